@@ -0,0 +1,229 @@
+# Python native libraries
+import argparse
+import json
+import os
+import sys
+import tempfile
+import zipfile
+from datetime import date, datetime
+
+# Third party libraries
+import openpyxl
+from lxml import etree
+
+# Self build libraries
+# Run as a script, e.g. "python src/Benchmark/CompiledWorkbookCheck.py", only the Benchmark
+# directory is on the path, the sources directory is added for the self build imports
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Render.CompiledWorkbook import CompiledWorkbook
+
+
+class CompiledWorkbookCheck:
+    """
+    Class checks that the CompiledWorkbook engine writes the workbooks openpyxl's writer used to, reading its output back with openpyxl.
+    Each check renders small synthetic templates in a temporary directory:
+        > noLeak: a run writing fewer cells than the previous one keeps the template values of the others.
+        > dateFormat: dates and datetimes get a date number format and read back as the same values.
+        > calcChain: the calculation chain is dropped and excel recalculates on load.
+        > missingReferences: rows and cells without "r" attribute are placed by position, as openpyxl's reader does.
+    Run it as "python src/Benchmark/CompiledWorkbookCheck.py" or "python -m Benchmark.CompiledWorkbookCheck" from src.
+    Attr:
+        > report (dict): result of each check
+        > passed (bool): every check passed
+    """
+
+    SHEET = "Sheet"
+    MAIN_NAMESPACE = CompiledWorkbook.MAIN_NAMESPACE
+
+    def __init__(self) -> None:
+        """
+        Method runs every check.
+        """
+        self.report = {"checks": dict()}
+        with tempfile.TemporaryDirectory(prefix="officesuite_check_") as directory:
+            self.__directory = directory
+            for check in [
+                self.__checkNoLeak,
+                self.__checkDateFormat,
+                self.__checkCalcChain,
+                self.__checkMissingReferences,
+            ]:
+                name = check.__name__.split("__check")[-1]
+                name = name[0].lower() + name[1:]
+                try:
+                    check()
+                    self.report["checks"][name] = {"passed": True}
+                except Exception as error:
+                    self.report["checks"][name] = {
+                        "passed": False,
+                        "error": f"{type(error).__name__}: {error}",
+                    }
+        self.passed = all(
+            result["passed"] for result in self.report["checks"].values()
+        )
+        self.report["passed"] = self.passed
+        pass
+
+    def __template(self, name: str, cells: dict[str, any]) -> str:
+        """
+        Method writes a template holding the given cells with openpyxl.
+        """
+        workbook = openpyxl.Workbook()
+        worksheet = workbook.active
+        worksheet.title = self.SHEET
+        for reference, value in cells.items():
+            worksheet[reference] = value
+        templatePath = os.path.join(self.__directory, name)
+        workbook.save(templatePath)
+        return templatePath
+
+    def __render(
+        self, templatePath: str, runs: list[list[tuple[str, str, any]]]
+    ) -> list[str]:
+        """
+        Method renders each run with one CompiledWorkbook and returns the saved workbook paths.
+        """
+        workbook = CompiledWorkbook(templatePath)
+        outputPaths = list()
+        for index, values in enumerate(runs):
+            workbook.render(values)
+            outputPath = f"{os.path.splitext(templatePath)[0]}_run{index}.xlsx"
+            workbook.save(outputPath)
+            outputPaths.append(outputPath)
+        return outputPaths
+
+    @staticmethod
+    def __expect(name: str, value: any, expected: any) -> None:
+        """
+        Method raises when a value read back differs from the expected one.
+        """
+        if value != expected:
+            raise AssertionError(f"{name} is {value!r}, expected {expected!r}.")
+        pass
+
+    def __checkNoLeak(self) -> None:
+        templatePath = self.__template("noLeak.xlsx", {"A1": "Title", "B2": "kept"})
+        _, secondPath = self.__render(
+            templatePath,
+            [
+                [
+                    ("A1", self.SHEET, "first"),
+                    ("B2", self.SHEET, "first"),
+                    ("D4", self.SHEET, "first"),
+                ],
+                [("A1", self.SHEET, "second")],
+            ],
+        )
+        worksheet = openpyxl.load_workbook(secondPath)[self.SHEET]
+        # Reading a missing cell creates it, the dimension is read first
+        self.__expect("dimension", worksheet.calculate_dimension(), "A1:B2")
+        self.__expect("A1", worksheet["A1"].value, "second")
+        self.__expect("B2", worksheet["B2"].value, "kept")
+        self.__expect("D4", worksheet["D4"].value, None)
+        pass
+
+    def __checkDateFormat(self) -> None:
+        templatePath = self.__template("dateFormat.xlsx", {"A1": "Title"})
+        values = {"B2": datetime(2024, 5, 17, 8, 30), "C3": date(2024, 5, 17)}
+        (outputPath,) = self.__render(
+            templatePath,
+            [[(reference, self.SHEET, value) for reference, value in values.items()]],
+        )
+        worksheet = openpyxl.load_workbook(outputPath)[self.SHEET]
+        for reference, value in values.items():
+            self.__expect(f"{reference} is date", worksheet[reference].is_date, True)
+            readValue = worksheet[reference].value
+            if type(value) is date:
+                readValue = readValue.date()
+            self.__expect(reference, readValue, value)
+        pass
+
+    def __checkCalcChain(self) -> None:
+        templatePath = self.__template("calcChain.xlsx", {"A1": 1, "A2": "=A1+1"})
+
+        # openpyxl never writes a calculation chain, we add the one excel would
+        with zipfile.ZipFile(templatePath) as package:
+            parts = {item: package.read(item) for item in package.namelist()}
+        parts["xl/calcChain.xml"] = (
+            f'<calcChain xmlns="{self.MAIN_NAMESPACE}"><c r="A2" i="1"/></calcChain>'
+        ).encode()
+        relationships = etree.fromstring(parts["xl/_rels/workbook.xml.rels"])
+        etree.SubElement(
+            relationships,
+            relationships[0].tag,
+            Id="rIdCalcChain",
+            Type=CompiledWorkbook.CALC_CHAIN_TYPE,
+            Target="calcChain.xml",
+        )
+        parts["xl/_rels/workbook.xml.rels"] = etree.tostring(relationships)
+        contentTypes = etree.fromstring(parts["[Content_Types].xml"])
+        etree.SubElement(
+            contentTypes,
+            f"{{{contentTypes.nsmap[None]}}}Override",
+            PartName="/xl/calcChain.xml",
+            ContentType="application/vnd.openxmlformats-officedocument."
+            "spreadsheetml.calcChain+xml",
+        )
+        parts["[Content_Types].xml"] = etree.tostring(contentTypes)
+        with zipfile.ZipFile(templatePath, "w") as package:
+            for item, data in parts.items():
+                package.writestr(item, data)
+
+        (outputPath,) = self.__render(templatePath, [[("A1", self.SHEET, 5)]])
+        with zipfile.ZipFile(outputPath) as package:
+            names = package.namelist()
+            relationships = package.read("xl/_rels/workbook.xml.rels")
+            contentTypes = package.read("[Content_Types].xml")
+            workbook = etree.fromstring(package.read("xl/workbook.xml"))
+        self.__expect("calcChain part", "xl/calcChain.xml" in names, False)
+        self.__expect("calcChain relationship", b"calcChain" in relationships, False)
+        self.__expect("calcChain content type", b"calcChain" in contentTypes, False)
+        calcPr = workbook.find(f"{{{self.MAIN_NAMESPACE}}}calcPr")
+        self.__expect("fullCalcOnLoad", calcPr.get("fullCalcOnLoad"), "1")
+        worksheet = openpyxl.load_workbook(outputPath)[self.SHEET]
+        self.__expect("A1", worksheet["A1"].value, 5)
+        self.__expect("A2", worksheet["A2"].value, "=A1+1")
+        pass
+
+    def __checkMissingReferences(self) -> None:
+        templateCells = {
+            f"{column}{row}": f"{column}{row}" for column in "ABC" for row in (1, 2)
+        }
+        templatePath = self.__template("missingReferences.xlsx", templateCells)
+
+        # Non excel writers often leave the optional row and cell references out
+        with zipfile.ZipFile(templatePath) as package:
+            parts = {item: package.read(item) for item in package.namelist()}
+        sheet = etree.fromstring(parts["xl/worksheets/sheet1.xml"])
+        for element in sheet.iter(
+            f"{{{self.MAIN_NAMESPACE}}}row", f"{{{self.MAIN_NAMESPACE}}}c"
+        ):
+            element.attrib.pop("r", None)
+        parts["xl/worksheets/sheet1.xml"] = etree.tostring(sheet)
+        with zipfile.ZipFile(templatePath, "w") as package:
+            for item, data in parts.items():
+                package.writestr(item, data)
+
+        (outputPath,) = self.__render(
+            templatePath,
+            [[("B2", self.SHEET, "written"), ("D2", self.SHEET, "added")]],
+        )
+        worksheet = openpyxl.load_workbook(outputPath)[self.SHEET]
+        expected = dict(templateCells, B2="written", D2="added")
+        for reference, value in expected.items():
+            self.__expect(reference, worksheet[reference].value, value)
+        pass
+
+    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Checks the compiled workbook engine against openpyxl."
+    )
+    parser.parse_args()
+
+    check = CompiledWorkbookCheck()
+    print(json.dumps(check.report, indent=4))
+    sys.exit(0 if check.passed else 1)
@@ -0,0 +1,139 @@
+# Python native libraries
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Third party libraries
+
+# Self build libraries
+
+
+class ImportBenchmark:
+    """
+    Class measures the cold import time of the application entry points, each import runs in a fresh interpreter.
+    An entry point fails when its median import time exceeds its budget or when it loads a heavy library that should only load at the action needing it.
+    Args:
+        > budgets (dict[str, float], optional): entry point module -> import time budget in seconds. Defaults to ImportBenchmark.BUDGETS.
+        > repeats (int, optional): fresh interpreters measured per entry point. Defaults to 5.
+    Attr:
+        > report (dict): measures of each entry point
+        > passed (bool): every entry point is within its budget and loads no heavy library
+    Raises:
+        > ValueError: Repeats should be a positive integer.
+    """
+
+    # Entry point -> import time budget in seconds
+    BUDGETS = {
+        "TerminalUserInterface.TerminalUserInterface": 0.15,
+        "CommandLineInterface.CommandLineInterface": 0.15,
+    }
+
+    # Libraries loaded on demand by the menu actions and render stages
+    HEAVY_LIBRARIES = [
+        "PIL",
+        "docx",
+        "docxtpl",
+        "fitz",
+        "jinja2",
+        "lxml",
+        "matplotlib",
+        "openpyxl",
+        "psutil",
+        "pymupdf",
+        "pynput",
+        "pyarrow",
+        "tqdm",
+    ]
+
+    # Runs inside the fresh interpreter, prints the import time and the heavy libraries loaded
+    __PROBE = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import {module}\n"
+        "seconds = time.perf_counter() - start\n"
+        "heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy}))\n"
+        "print(json.dumps({{'seconds': seconds, 'heavyLibraries': heavy}}))\n"
+    )
+
+    def __init__(self, budgets: dict[str, float] = None, repeats: int = 5) -> None:
+        """
+        Method measures every entry point.
+
+        Raises:
+            ValueError: Repeats should be a positive integer.
+        """
+        if repeats < 1:
+            raise ValueError("Repeats should be a positive integer.")
+        self.budgets = dict(self.BUDGETS if budgets is None else budgets)
+        self.repeats = repeats
+        self.report = {"repeats": repeats, "entryPoints": dict()}
+        for module, budget in self.budgets.items():
+            self.report["entryPoints"][module] = self.__measure(module, budget)
+        self.passed = all(
+            result["passed"] for result in self.report["entryPoints"].values()
+        )
+        self.report["passed"] = self.passed
+        pass
+
+    def __measure(self, module: str, budget: float) -> dict:
+        """
+        Method imports the module in fresh interpreters and compares the median time with the budget.
+        """
+        probe = self.__PROBE.format(module=module, heavy=self.HEAVY_LIBRARIES)
+        sourceDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        samples = list()
+        heavyLibraries = set()
+        for _ in range(self.repeats):
+            completed = subprocess.run(
+                [sys.executable, "-c", probe],
+                cwd=sourceDirectory,
+                capture_output=True,
+                text=True,
+            )
+            if completed.returncode != 0:
+                return {
+                    "budgetSeconds": budget,
+                    "passed": False,
+                    "error": completed.stderr.strip().splitlines()[-1],
+                }
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            samples.append(result["seconds"])
+            heavyLibraries.update(result["heavyLibraries"])
+
+        medianSeconds = statistics.median(samples)
+        return {
+            "budgetSeconds": budget,
+            "medianSeconds": medianSeconds,
+            "maxSeconds": max(samples),
+            "heavyLibraries": sorted(heavyLibraries),
+            "passed": medianSeconds <= budget and not heavyLibraries,
+        }
+
+    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the cold import time of the application entry points."
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Fresh interpreters per entry point."
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="Import time budget in seconds for every entry point.",
+    )
+    arguments = parser.parse_args()
+
+    benchmark = ImportBenchmark(
+        budgets=None
+        if arguments.budget is None
+        else {module: arguments.budget for module in ImportBenchmark.BUDGETS},
+        repeats=arguments.repeats,
+    )
+    print(json.dumps(benchmark.report, indent=4))
+    sys.exit(0 if benchmark.passed else 1)
@@ -0,0 +1,345 @@
+# Python native libraries
+import argparse
+import csv
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+# Third party libraries
+from tqdm import tqdm
+
+# Self build libraries
+# Run as a script, e.g. "python src/Benchmark/RenderBenchmark.py", only the Benchmark
+# directory is on the path, the sources directory is added for the self build imports
+if not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Builder.ExcelTemplate import ExcelTemplate
+from Builder.ProjectBuilder import ProjectBuilder
+from Func.Word.Word import Word
+from Render.ExcelRender import ExcelRenderer
+from Render.PackageCompression import PackageCompression
+from Render.ProjectContext import ProjectContext
+from Render.WordImageRender import WordImageRenderer
+from Render.WordRender import WordRender
+
+
+class RenderBenchmark:
+    """
+    Class measures the render throughput over a synthetic project of configurable size.
+    The project is scaffolded with the ProjectBuilder, then every renderer is timed step by step and a JSON and CSV report is written.
+    Run it as "python src/Benchmark/RenderBenchmark.py <outputPath> --runs 1000" or "python -m Benchmark.RenderBenchmark <outputPath>" from src.
+    Args:
+        > outputPath (str): directory where the synthetic project and its reports are built
+        > runs (int, optional): number of runs (N) in the database. Defaults to 100.
+        > keywords (int, optional): number of keywords (M) per run. Defaults to 10.
+        > placeholders (int, optional): number of image placeholders (K) per run. Defaults to 5.
+        > templates (int, optional): number of word and excel templates (T). Defaults to 1.
+        > workers (int, optional): number of render worker processes. Defaults to 1.
+        > compression (str, optional): zip compression level of the rendered documents: "store", "fast", "default" or "max". Defaults to "default".
+        > databaseFormat (str, optional): project database format, one of ProjectContext.DATABASE_FORMATS. Defaults to "xlsx".
+    Attr:
+        > projectDirPath (str): directory of the synthetic project
+        > report (dict): benchmark configuration and results
+        > reportJsonPath (str): path of the JSON report
+        > reportCsvPath (str): path of the CSV report, one row per renderer step
+    """
+
+    def __init__(
+        self,
+        outputPath: str,
+        runs: int = 100,
+        keywords: int = 10,
+        placeholders: int = 5,
+        templates: int = 1,
+        workers: int = 1,
+        compression: str = "default",
+        databaseFormat: str = "xlsx",
+    ) -> None:
+        self.outputPath = outputPath
+        self.runs = runs
+        self.keywords = keywords
+        self.placeholders = placeholders
+        self.templates = templates
+        self.workers = workers
+        self.compression = compression
+        self.databaseFormat = databaseFormat
+
+        steps = [
+            self.__buildProject,
+            self.__buildTemplates,
+            self.__benchmarkWordRender,
+            self.__benchmarkWordImageRender,
+            self.__benchmarkExcelRender,
+            self.__writeReport,
+        ]
+        totalSteps = len(steps)
+        with tqdm(
+            total=totalSteps,
+            desc="Benchmarking render",
+            unit="step",
+        ) as progressBar:
+            for index, step in enumerate(iterable=steps):
+                progressBar.set_description(f"Step {index+1} of {totalSteps}")
+                step()
+                progressBar.update(1)
+            pass
+        pass
+
+    def __buildProject(self) -> None:
+        """
+        Method scaffolds the synthetic project with the requested database size.
+        """
+        projectName = (
+            f"Benchmark N{self.runs} M{self.keywords} "
+            f"K{self.placeholders} T{self.templates}"
+        )
+        project = ProjectBuilder(
+            projectPath=self.outputPath,
+            projectName=projectName,
+            runs=self.runs,
+            keywords=self.keywords,
+            placeholders=self.placeholders,
+            databaseFormat=self.databaseFormat,
+        )
+        self.projectDirPath = project.projectDirPath
+        self.templateDirPath = project.templateDirPath
+        self.databasePath = project.databasePath
+        self.assetsDirPath = project.assetsDirPath
+
+        self.report = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "cpuCount": os.cpu_count(),
+            "runs": self.runs,
+            "keywords": self.keywords,
+            "placeholders": self.placeholders,
+            "templates": self.templates,
+            "workers": self.workers,
+            "compression": self.compression,
+            "databaseFormat": self.databaseFormat,
+            "renderers": dict(),
+        }
+        pass
+
+    def __buildTemplates(self) -> None:
+        """
+        Method replaces the example templates by T templates using every keyword and placeholder.
+        """
+        for item in os.listdir(self.templateDirPath):
+            os.remove(os.path.join(self.templateDirPath, item))
+
+        for templateIndex in range(1, self.templates + 1, 1):
+            templateName = f"template_{templateIndex}"
+            word = Word(
+                filePath=os.path.join(self.templateDirPath, f"{templateName}.docx")
+            )
+            for index in range(1, self.keywords + 1, 1):
+                keyword = f"Key_Word_{index}"
+                word.document.add_paragraph(text=f"{keyword}\t:\t{{{{{keyword}}}}}")
+            for index in range(1, self.placeholders + 1, 1):
+                keyword = f"Place_Holder_{index}"
+                word.document.add_paragraph(text=f"{keyword}\t:\t{{{{{keyword}}}}}")
+            word.saveAndClose()
+
+            ExcelTemplate(
+                templatePath=os.path.join(self.templateDirPath, f"{templateName}.xlsx")
+            )
+        pass
+
+    def __openProjectContext(self) -> tuple[ProjectContext, float]:
+        """
+        Method opens the database for a single renderer and returns it with its opening time.
+        The snapshot is off, a snapshot saved by the previous renderer would time a snapshot load instead of the database read.
+        """
+        start = time.perf_counter()
+        projectContext = ProjectContext(databasePath=self.databasePath, snapshot=False)
+        return projectContext, time.perf_counter() - start
+
+    def __recordRenderer(
+        self,
+        name: str,
+        renderer: any,
+        elapsed: float,
+        extension: str,
+        openSeconds: float,
+    ) -> None:
+        """
+        Method stores the step timings, the phase summary, the throughput and the output size of a renderer.
+        """
+        documents = self.runs * self.templates
+        outputBytes = 0
+        rendersDirectory = os.path.join(self.projectDirPath, "Renders")
+        for directory, _, files in os.walk(rendersDirectory):
+            for file in files:
+                if file.endswith(extension):
+                    outputBytes += os.path.getsize(os.path.join(directory, file))
+        self.report["renderers"][name] = {
+            "steps": {"openDatabase": openSeconds, **renderer.stepTimings},
+            "phases": renderer.instrumentation.summary(),
+            "totalSeconds": elapsed,
+            "documents": documents,
+            "documentsPerSecond": documents / elapsed if elapsed else None,
+            "outputBytes": outputBytes,
+        }
+        pass
+
+    def __benchmarkWordRender(self) -> None:
+        """
+        Method times the text only word render of the synthetic project.
+        """
+        start = time.perf_counter()
+        projectContext, openSeconds = self.__openProjectContext()
+        try:
+            renderer = WordRender(
+                templatesDirectory=self.templateDirPath,
+                databasePath=self.databasePath,
+                outputRenders=self.projectDirPath,
+                workers=self.workers,
+                compression=self.compression,
+                projectContext=projectContext,
+            )
+        finally:
+            projectContext.close()
+        self.__recordRenderer(
+            "WordRender", renderer, time.perf_counter() - start, ".docx", openSeconds
+        )
+        pass
+
+    def __benchmarkWordImageRender(self) -> None:
+        """
+        Method times the word with image placeholders render of the synthetic project.
+        """
+        start = time.perf_counter()
+        projectContext, openSeconds = self.__openProjectContext()
+        try:
+            renderer = WordImageRenderer(
+                templatesDirectory=self.templateDirPath,
+                databasePath=self.databasePath,
+                outputRenders=self.projectDirPath,
+                assetsDirectory=self.assetsDirPath,
+                workers=self.workers,
+                compression=self.compression,
+                projectContext=projectContext,
+            )
+        finally:
+            projectContext.close()
+        self.__recordRenderer(
+            "WordImageRenderer",
+            renderer,
+            time.perf_counter() - start,
+            ".docx",
+            openSeconds,
+        )
+        pass
+
+    def __benchmarkExcelRender(self) -> None:
+        """
+        Method times the excel render of the synthetic project.
+        """
+        start = time.perf_counter()
+        projectContext, openSeconds = self.__openProjectContext()
+        try:
+            renderer = ExcelRenderer(
+                templatesDirectory=self.templateDirPath,
+                databasePath=self.databasePath,
+                outputRenders=self.projectDirPath,
+                compression=self.compression,
+                projectContext=projectContext,
+            )
+        finally:
+            projectContext.close()
+        self.__recordRenderer(
+            "ExcelRenderer", renderer, time.perf_counter() - start, ".xlsx", openSeconds
+        )
+        pass
+
+    def __writeReport(self) -> None:
+        """
+        Method writes the JSON report and the CSV report with one row per renderer step.
+        """
+        self.reportJsonPath = os.path.join(
+            self.projectDirPath, "benchmarkReport.json"
+        )
+        self.reportCsvPath = os.path.join(self.projectDirPath, "benchmarkReport.csv")
+
+        with open(self.reportJsonPath, mode="w", encoding="utf-8") as jsonFile:
+            json.dump(self.report, jsonFile, indent=4)
+
+        with open(self.reportCsvPath, mode="w", newline="") as csvFile:
+            writer = csv.writer(csvFile)
+            writer.writerow(
+                [
+                    "Renderer",
+                    "Step",
+                    "Seconds",
+                    "Runs",
+                    "Keywords",
+                    "Placeholders",
+                    "Templates",
+                    "Workers",
+                    "Compression",
+                    "Database Format",
+                ]
+            )
+            configuration = [
+                self.runs,
+                self.keywords,
+                self.placeholders,
+                self.templates,
+                self.workers,
+                self.compression,
+                self.databaseFormat,
+            ]
+            for name, result in self.report["renderers"].items():
+                for step, seconds in result["steps"].items():
+                    writer.writerow([name, step, seconds, *configuration])
+                writer.writerow(
+                    [name, "total", result["totalSeconds"], *configuration]
+                )
+                writer.writerow(
+                    [name, "outputBytes", result["outputBytes"], *configuration]
+                )
+        pass
+
+    pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the render throughput over a synthetic project."
+    )
+    parser.add_argument("outputPath", help="Directory where the project is built.")
+    parser.add_argument("--runs", type=int, default=100, help="Runs (N).")
+    parser.add_argument("--keywords", type=int, default=10, help="Keywords (M).")
+    parser.add_argument("--placeholders", type=int, default=5, help="Images (K).")
+    parser.add_argument("--templates", type=int, default=1, help="Templates (T).")
+    parser.add_argument("--workers", type=int, default=1, help="Render workers.")
+    parser.add_argument(
+        "--compression",
+        default="default",
+        choices=list(PackageCompression.LEVELS),
+        help="Zip compression level of the rendered documents.",
+    )
+    parser.add_argument(
+        "--database-format",
+        default="xlsx",
+        choices=list(ProjectContext.DATABASE_FORMATS),
+        help="Format of the project database.",
+    )
+    arguments = parser.parse_args()
+
+    benchmark = RenderBenchmark(
+        outputPath=arguments.outputPath,
+        runs=arguments.runs,
+        keywords=arguments.keywords,
+        placeholders=arguments.placeholders,
+        templates=arguments.templates,
+        workers=arguments.workers,
+        compression=arguments.compression,
+        databaseFormat=arguments.database_format,
+    )
+    print(json.dumps(benchmark.report, indent=4))
+    print(f"Report written at: {benchmark.reportJsonPath}")
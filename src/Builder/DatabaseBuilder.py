@@ -1,7 +1,7 @@
 # Python native libraries
-import string
 
 # Third party libraries
+from openpyxl.utils import get_column_letter
 from Func.Excel.Excel import Excel
 
 # Self build libraries
@@ -12,18 +12,33 @@ class DatabaseBuilder(Excel):
     Class builds a data base example of an excel file for rendering the document projects into the Office Suite Render
     Args:
         > databasePath (str): path where the database will be stored
+        > runs (int, optional): number of runs (data rows) in every sheet. Defaults to 10.
+        > keywords (int, optional): number of keywords in the word and excel data. Defaults to 9.
+        > placeholders (int, optional): number of image placeholders. Defaults to 25.
     Attr: None
     Raises: None
     """
 
-    def __init__(self, databasePath: str) -> None:
+    def __init__(
+        self,
+        databasePath: str,
+        runs: int = 10,
+        keywords: int = 9,
+        placeholders: int = 25,
+    ) -> None:
         # We inherit all the parent attributes an methods
         super().__init__(filePath=databasePath)
 
+        # Size of the dummy information
+        self.__runs = runs
+        self.__keywords = keywords
+        self.__placeholders = placeholders
+
         # We build the dummy information as example into rendering projects
         self.__buildWordDummyData()
         self.__buildExcelDummyData()
         self.__buildPlaceholderDummyData()
+        self.__buildPlaceholderSizesData()
 
         # We write into the excel file and save the changes
         self.__overwriteIn()
@@ -35,14 +50,14 @@ class DatabaseBuilder(Excel):
         sheetData = list()
 
         headers = ["Key_Header"]
-        for i in range(1, 10, 1):  # We subtract the Key_Header
+        for i in range(1, self.__keywords + 1, 1):  # We subtract the Key_Header
             headers.append(f"Key_Word_{i}")
 
         sheetData.append(headers)
 
-        for rowNumber in range(1, 11, 1):
+        for rowNumber in range(1, self.__runs + 1, 1):
             rowList = list()
-            for columnNumber in range(1, 11, 1):
+            for columnNumber in range(1, self.__keywords + 2, 1):
                 rowList.append(f"Row {rowNumber} Data {columnNumber}")
             sheetData.append(rowList)
 
@@ -55,26 +70,26 @@ class DatabaseBuilder(Excel):
         sheetData = list()
 
         headers = ["Key Header"]
-        for i in range(1, 10, 1):
+        for i in range(1, self.__keywords + 1, 1):
             headers.append(f" Header {i}")
 
         pointers = ["Cell Pointer"]
-        # We get the first 10 capital letters from A to J
-        cells = [f"{col}" for col in string.ascii_uppercase[:9]]
+        # We point each header into the diagonal A1, B2, C3 ...
+        cells = [get_column_letter(i) for i in range(1, self.__keywords + 1, 1)]
         for index, cell in enumerate(cells):
             pointers.append(f"{cell}{index+1}")
 
         sheetPointer = ["Sheet Pointer"]
-        for i in range(1, 10, 1):
+        for i in range(1, self.__keywords + 1, 1):
             sheetPointer.append("Sheet 1")
 
         sheetData.append(headers)
         sheetData.append(pointers)
         sheetData.append(sheetPointer)
 
-        for rowNumber in range(1, 11, 1):
+        for rowNumber in range(1, self.__runs + 1, 1):
             rowList = list()
-            for columnNumber in range(1, 11, 1):
+            for columnNumber in range(1, self.__keywords + 2, 1):
                 rowList.append(f"Row {rowNumber} Data {columnNumber}")
             sheetData.append(rowList)
 
@@ -89,16 +104,26 @@ class DatabaseBuilder(Excel):
                 "!!!Remember to delete excessive placeholders and type Titles with file extension¡¡¡",
             ]
         )
-        sheetData.append([f"Place_Holder_{i}" for i in range(1, 26, 1)])
+        sheetData.append(
+            [f"Place_Holder_{i}" for i in range(1, self.__placeholders + 1, 1)]
+        )
 
-        for _ in range(1, 11, 1):
+        for _ in range(1, self.__runs + 1, 1):
             row = list()
-            for j in range(1, 26, 1):
+            for j in range(1, self.__placeholders + 1, 1):
                 row.append(f"Replace_Image_{j}.png")
             sheetData.append(row)
         self.__placeHolderSheet = sheetData
         pass
 
+    def __buildPlaceholderSizesData(self) -> None:
+        # Blank sizes keep the native image size, a single dimension keeps the aspect ratio
+        sheetData = [["Place Holder", "Width (cm)", "Height (cm)"]]
+        for i in range(1, self.__placeholders + 1, 1):
+            sheetData.append([f"Place_Holder_{i}", None, None])
+        self.__placeHolderSizesSheet = sheetData
+        pass
+
     def __overwriteIn(self) -> None:
 
         # Parent object class attribute.
@@ -107,6 +132,7 @@ class DatabaseBuilder(Excel):
         wordDataSheet = self.workbook.create_sheet(title="Word Data")
         excelDataSheet = self.workbook.create_sheet(title="Excel Data")
         placeholderDataSheet = self.workbook.create_sheet(title="Place Holders")
+        placeholderSizesSheet = self.workbook.create_sheet(title="Place Holder Sizes")
 
         # We errase the default sheets in the excel file
         self._erraseDefaultSheets()
@@ -118,6 +144,8 @@ class DatabaseBuilder(Excel):
             wordDataSheet.append(j)
         for k in self.__placeHolderSheet:
             placeholderDataSheet.append(k)
+        for m in self.__placeHolderSizesSheet:
+            placeholderSizesSheet.append(m)
         pass
 
     pass
@@ -0,0 +1,71 @@
+# Python native libraries
+import os
+
+# Third party libraries
+
+# Self build libraries
+from Func.Excel.Excel import Excel
+from Render.ProjectContext import ProjectContext
+
+
+class DatabaseConverter:
+    """
+    Class converts an excel database into one of the other database formats, keeping every sheet as it is.
+    Args:
+        > databasePath (str): path of the excel database information
+        > outputFormat (str): one of ProjectContext.DATABASE_FORMATS other than "xlsx"
+        > outputPath (str, optional): path of the converted database. Defaults to None (default database name next to the excel database).
+    Attr:
+        > databasePath (str): path of the excel database information
+        > outputFormat (str): format of the converted database
+        > outputPath (str): path of the converted database
+    Raises:
+        > FileNotFoundError: Database path does not exist.
+        > ValueError: Database format should be one of: sqlite, csv, parquet.
+        > ImportError: Parquet databases require pyarrow.
+    """
+
+    def __init__(
+        self, databasePath: str, outputFormat: str, outputPath: str = None
+    ) -> None:
+        """
+        Method converts the database.
+
+        Raises:
+            FileNotFoundError: Database path does not exist.
+            ValueError: Database format should be one of: sqlite, csv, parquet.
+            ImportError: Parquet databases require pyarrow.
+        """
+        formats = [key for key in ProjectContext.DATABASE_FORMATS if key != "xlsx"]
+        if outputFormat not in formats:
+            raise ValueError(f"Database format should be one of: {', '.join(formats)}.")
+        if not os.path.exists(databasePath):
+            raise FileNotFoundError("Database path does not exist.")
+
+        self.databasePath = databasePath
+        self.outputFormat = outputFormat
+        databaseName = ProjectContext.DATABASE_FORMATS[outputFormat]
+        self.__writer = ProjectContext.databaseReader(outputFormat)
+        self.outputPath = (
+            os.path.join(os.path.dirname(databasePath), databaseName)
+            if outputPath is None
+            else outputPath
+        )
+        self.__convert()
+        pass
+
+    def __convert(self) -> None:
+        """
+        Method copies every sheet of the excel database into the converted database.
+        """
+        excel = Excel(self.databasePath, readOnly=True)
+        database = self.__writer(self.outputPath)
+        try:
+            for sheetName in excel.sheets:
+                database.writeSheet(sheetName, excel.readSheet(sheetName))
+        finally:
+            database.close()
+            excel.close()
+        pass
+
+    pass
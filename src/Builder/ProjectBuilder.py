@@ -6,11 +6,13 @@ from tqdm import tqdm
 
 # Self build libraries
 from Builder.DatabaseBuilder import DatabaseBuilder
+from Builder.DatabaseConverter import DatabaseConverter
 from Builder.ExcelTemplate import ExcelTemplate
 from Builder.WordTemplate import WordTemplate
 from Builder.WordPlaceHolder import WordPlaceHolder
 from Func.Images.Placeholder import Placeholder
 from Func.Images.PlaceholderModel import PlaceholderModel
+from Render.ProjectContext import ProjectContext
 
 
 class ProjectBuilder:
@@ -20,14 +22,37 @@ class ProjectBuilder:
     Args:
         > projectPath (str): Destination where user desires to build a new project
         > projectName (str, optional): Project name the user desire to build. Defaults to "RenderProject".
+        > runs (int, optional): number of example runs in the database. Defaults to 10.
+        > keywords (int, optional): number of example keywords in the database. Defaults to 9.
+        > placeholders (int, optional): number of example image placeholders and assets. Defaults to 25.
+        > databaseFormat (str, optional): one of ProjectContext.DATABASE_FORMATS. Defaults to "xlsx".
+    Raises:
+        > ValueError: Database format should be one of: xlsx, sqlite, csv, parquet.
     """
 
-    def __init__(self, projectPath: str, projectName: str = "RenderProject") -> None:
+    def __init__(
+        self,
+        projectPath: str,
+        projectName: str = "RenderProject",
+        runs: int = 10,
+        keywords: int = 9,
+        placeholders: int = 25,
+        databaseFormat: str = "xlsx",
+    ) -> None:
         """
         Initializes de class procedure for building a new project.
         """
+        if databaseFormat not in ProjectContext.DATABASE_FORMATS:
+            raise ValueError(
+                "Database format should be one of: "
+                f"{', '.join(ProjectContext.DATABASE_FORMATS)}."
+            )
         self.projectPath: str = projectPath
         self.projectName: str = projectName
+        self.runs: int = runs
+        self.keywords: int = keywords
+        self.placeholders: int = placeholders
+        self.databaseFormat: str = databaseFormat
         steps = [
             self.__buildConstants,
             self.__buildProjectArchitecture,
@@ -62,6 +87,8 @@ class ProjectBuilder:
         self.__placeholdersDirectory: str = "Placeholders"
 
         self.__assetsDirectory: str = "Assets"
+
+        self.__recipesDirectory: str = "Recipes"
         pass
 
     def __buildProjectArchitecture(self):
@@ -107,11 +134,17 @@ class ProjectBuilder:
             self.projectDirPath,
             self.__assetsDirectory,
         )
+
+        self.recipesDirPath = os.path.join(
+            self.projectDirPath,
+            self.__recipesDirectory,
+        )
         for directory in [
             self.templateDirPath,
             self.databaseDirPath,
             self.placeholderDirPath,
             self.assetsDirPath,
+            self.recipesDirPath,
         ]:
             os.mkdir(directory)
 
@@ -135,18 +168,31 @@ class ProjectBuilder:
         Private method builds the assets in a brand new project.
         """
 
-        DatabaseBuilder(databasePath=self.databasePath)
+        DatabaseBuilder(
+            databasePath=self.databasePath,
+            runs=self.runs,
+            keywords=self.keywords,
+            placeholders=self.placeholders,
+        )
+        # Other formats are converted from the example workbook, which is then removed
+        if self.databaseFormat != "xlsx":
+            excelDatabasePath = self.databasePath
+            self.databasePath = DatabaseConverter(
+                databasePath=excelDatabasePath,
+                outputFormat=self.databaseFormat,
+            ).outputPath
+            os.remove(excelDatabasePath)
 
         Placeholder(
             outputPath=self.placeholderDirPath,
-            number=25,
+            number=self.placeholders,
             width=300,
             height=300,
         )
 
         PlaceholderModel(
             outputPath=self.assetsDirPath,
-            number=25,
+            number=self.placeholders,
             width=300,
             height=300,
         )
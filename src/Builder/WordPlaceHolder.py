@@ -61,6 +61,8 @@ class WordPlaceHolder(Word):
             "1. **Image Directory**: Place all replacement images in the specified `Assets` directory.",
             "2. **Image References**: In the `Placeholders` sheet of the database, specify the image filenames with their extensions (e.g., `image1.png`).",
             "3. **Placeholder Cleanup**: Remove any unused placeholders from the database to prevent errors.",
+            "4. **Image Sizes**: Optionally type a width and/or height in centimeters in the `Place Holder Sizes` sheet. "
+            "Images are shown at that size and large pictures are embedded downscaled to it.",
             "",
             "## Rendering the Documents",
             "1. Populate the database as per the instructions above.",
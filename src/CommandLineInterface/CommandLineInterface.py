@@ -0,0 +1,631 @@
+# Python native libraries
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+# Third party libraries
+
+# Self build libraries
+from Render.PackageCompression import PackageCompression
+from Render.ProjectContext import ProjectContext
+from Render.RenderRecipe import RenderRecipe
+
+
+class CommandLineInterface:
+    """
+    Class runs the non-interactive command line, e.g. "python main.py render <project> --workers 8 --only word --runs R1 R2", for schedulers and cron jobs.
+    Renders call the renderers directly and print a JSON summary on stdout, progress bars stay on stderr. The terminal user interface is never imported.
+    Args:
+        > arguments (list[str], optional): command line arguments without the program name. Defaults to None (sys.argv).
+    Attr:
+        > exitCode (int): one of the EXIT_* codes
+        > summary (dict): machine-readable summary of the command
+    Raises: None, errors are reported through the exit code and the summary
+    """
+
+    EXIT_SUCCESS = 0
+    EXIT_RENDER_ERROR = 1
+    EXIT_USAGE_ERROR = 2
+    EXIT_PROJECT_ERROR = 3
+    # PDF export or bundle error
+    EXIT_EXPORT_ERROR = 4
+    # Documents that could not be indexed
+    EXIT_INDEX_ERROR = 5
+
+    # Project directory architecture names, as built by the ProjectBuilder
+    TEMPLATE_DIR = "Templates"
+    DATABASE_DIR = "Database"
+    ASSETS_DIR = "Assets"
+    RECIPES_DIR = "Recipes"
+    RENDERS_DIR = "Renders"
+
+    def __init__(self, arguments: list[str] = None) -> None:
+        """
+        Method parses the arguments and runs the selected command.
+        """
+        self.summary: dict = dict()
+        try:
+            self.arguments = self.__buildParser().parse_args(arguments)
+        except SystemExit as systemExit:
+            # argparse already printed the usage, --help exits with 0
+            code = systemExit.code
+            self.exitCode = code if isinstance(code, int) else self.EXIT_SUCCESS
+            return
+        self.exitCode = self.arguments.command()
+        pass
+
+    def __buildParser(self) -> argparse.ArgumentParser:
+        """
+        Method builds the command line parser.
+        """
+        parser = argparse.ArgumentParser(
+            prog="python main.py",
+            description="Renders Office Suite projects without the terminal interface.",
+        )
+        commands = parser.add_subparsers(dest="commandName", required=True)
+
+        render = commands.add_parser(
+            "render", help="Renders the word and excel templates of a project."
+        )
+        render.set_defaults(command=self.__render)
+        render.add_argument("project", help="Project directory.")
+        render.add_argument(
+            "--workers", type=int, default=1, help="Render worker processes."
+        )
+        render.add_argument(
+            "--only",
+            choices=RenderRecipe.OUTPUT_TYPES,
+            help="Only renders one document type.",
+        )
+        render.add_argument(
+            "--runs", nargs="+", help="Key headers of the runs to render."
+        )
+        render.add_argument(
+            "--templates", nargs="+", help="File names of the templates to render."
+        )
+        render.add_argument(
+            "--recipe",
+            help="Recipe file, or recipe name saved in the project Recipes directory.",
+        )
+        render.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only renders documents whose inputs changed since the last render.",
+        )
+        render.add_argument(
+            "--compression",
+            default="default",
+            choices=list(PackageCompression.LEVELS),
+            help="Zip compression level of the rendered documents.",
+        )
+        render.add_argument(
+            "--instrumentation-log",
+            help="JSON lines file where each measured render phase is appended.",
+        )
+        render.add_argument(
+            "--no-snapshot",
+            action="store_true",
+            help="Neither loads nor saves the database snapshot.",
+        )
+        render.add_argument(
+            "--pdf",
+            action="store_true",
+            help="Exports the rendered Word documents to PDF with LibreOffice.",
+        )
+        render.add_argument(
+            "--pdf-workers",
+            type=int,
+            default=2,
+            help="Concurrent LibreOffice workers of the PDF export.",
+        )
+        render.add_argument(
+            "--pdf-timeout",
+            type=float,
+            default=120,
+            help="Seconds a PDF conversion may take before it is killed.",
+        )
+        render.add_argument(
+            "--pdf-retries",
+            type=int,
+            default=1,
+            help="New attempts of a failed PDF conversion.",
+        )
+        render.add_argument(
+            "--bundle",
+            action="store_true",
+            help="Merges the PDF documents into one packet per run and one project archive.",
+        )
+        render.add_argument(
+            "--summary", help="File where the JSON summary is also written."
+        )
+
+        index = commands.add_parser(
+            "index",
+            help="Updates the full-text index of the rendered documents and templates.",
+        )
+        index.set_defaults(command=self.__index)
+        index.add_argument("project", help="Project directory.")
+        index.add_argument(
+            "--workers", type=int, default=1, help="Text extraction processes."
+        )
+        index.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Extracts every document again instead of the changed ones only.",
+        )
+        index.add_argument(
+            "--summary", help="File where the JSON summary is also written."
+        )
+
+        search = commands.add_parser(
+            "search", help="Finds the indexed documents mentioning a text."
+        )
+        search.set_defaults(command=self.__search)
+        search.add_argument("project", help="Project directory.")
+        search.add_argument("query", nargs="+", help="Words every document holds.")
+        search.add_argument(
+            "--raw",
+            action="store_true",
+            help="Takes the query as SQLite FTS5 syntax, e.g. '\"ACME Corp\" OR Contoso'.",
+        )
+        search.add_argument("--run", help="Only searches the documents of one run.")
+        search.add_argument(
+            "--limit", type=int, default=20, help="Maximum number of documents."
+        )
+        search.add_argument(
+            "--summary", help="File where the JSON summary is also written."
+        )
+        return parser
+
+    def __loadRecipe(self, projectPath: str) -> RenderRecipe | None:
+        """
+        Method builds the recipe selected by the arguments, None to render everything.
+
+        Raises:
+            FileNotFoundError: Recipe file does not exist.
+        """
+        arguments = self.arguments
+        outputTypes = None if arguments.only is None else [arguments.only]
+        if arguments.recipe is None:
+            if arguments.runs is None and arguments.templates is None:
+                return (
+                    None
+                    if outputTypes is None
+                    else RenderRecipe(name="cli", outputTypes=outputTypes)
+                )
+            return RenderRecipe(
+                name="cli",
+                runs=arguments.runs,
+                templates=arguments.templates,
+                outputTypes=outputTypes,
+            )
+
+        recipePath = arguments.recipe
+        if not os.path.exists(recipePath):
+            recipePath = os.path.join(
+                projectPath,
+                self.RECIPES_DIR,
+                f"{arguments.recipe}{RenderRecipe.FILE_EXTENSION}",
+            )
+        recipe = RenderRecipe.load(recipePath=recipePath)
+
+        # --only narrows the document types of the recipe
+        if outputTypes is not None:
+            recipe.outputTypes = [
+                outputType
+                for outputType in recipe.outputTypes
+                if outputType in outputTypes
+            ]
+        return recipe
+
+    @staticmethod
+    def __unmatchedSelection(
+        recipe: RenderRecipe,
+        projectContext: ProjectContext,
+        templatesPath: str,
+    ) -> dict[str, list[str]]:
+        """
+        Method lists the selected runs missing from the database and the selected templates missing from the templates directory.
+
+        Returns:
+            dict[str, list[str]]: {"runs", "templates"} unmatched entries, empty when the whole selection exists
+        """
+        unmatched = dict()
+        if recipe.runs is not None:
+            # Word Data runs start after the keywords row, Excel Data runs after the pointers rows
+            knownRuns = set()
+            for sheetName, firstRow in [("Word Data", 1), ("Excel Data", 3)]:
+                matrix = projectContext.getSheetMatrix(sheetName) or list()
+                knownRuns.update(str(row[0]) for row in matrix[firstRow:] if row)
+            runs = [str(run) for run in recipe.runs if str(run) not in knownRuns]
+            if runs:
+                unmatched["runs"] = runs
+        if recipe.templates is not None:
+            extensions = tuple(
+                extension
+                for outputType, extension in [("word", ".docx"), ("excel", ".xlsx")]
+                if recipe.includesOutput(outputType)
+            )
+            knownTemplates = {
+                item for item in os.listdir(templatesPath) if item.endswith(extensions)
+            }
+            templates = [
+                template
+                for template in recipe.templates
+                if template not in knownTemplates
+            ]
+            if templates:
+                unmatched["templates"] = templates
+        return unmatched
+
+    def __render(self) -> int:
+        """
+        Method renders the project and prints the JSON summary.
+
+        Returns:
+            int: exit code
+        """
+        arguments = self.arguments
+        projectPath = os.path.abspath(arguments.project)
+        self.summary = {
+            "command": "render",
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "project": projectPath,
+            "workers": arguments.workers,
+            "compression": arguments.compression,
+            "incremental": arguments.incremental,
+            "renderers": dict(),
+        }
+
+        if arguments.workers < 1 or arguments.pdf_workers < 1:
+            return self.__finish(
+                self.EXIT_USAGE_ERROR,
+                ValueError("Workers should be a positive integer."),
+            )
+        if arguments.recipe is not None and (
+            arguments.runs is not None or arguments.templates is not None
+        ):
+            return self.__finish(
+                self.EXIT_USAGE_ERROR,
+                ValueError("--recipe can not be combined with --runs or --templates."),
+            )
+
+        try:
+            if not os.path.isdir(projectPath):
+                raise FileNotFoundError(
+                    f"Project directory does not exist: {projectPath}"
+                )
+            recipe = self.__loadRecipe(projectPath=projectPath)
+            databasePath = ProjectContext.findDatabase(
+                databaseDirectory=os.path.join(projectPath, self.DATABASE_DIR)
+            )
+            # The database is read once and shared between the renderers
+            projectContext = ProjectContext(
+                databasePath=databasePath, snapshot=not arguments.no_snapshot
+            )
+        except Exception as error:
+            return self.__finish(self.EXIT_PROJECT_ERROR, error)
+
+        self.summary.update(
+            {
+                "database": databasePath,
+                "databaseFormat": projectContext.databaseFormat,
+                "snapshotLoaded": projectContext.snapshotLoaded,
+                "recipe": None
+                if recipe is None
+                else {
+                    "name": recipe.name,
+                    "runs": recipe.runs,
+                    "templates": recipe.templates,
+                    "outputTypes": recipe.outputTypes,
+                },
+            }
+        )
+        renderersOptions = {
+            "word": {
+                "assetsDirectory": os.path.join(projectPath, self.ASSETS_DIR),
+                "workers": arguments.workers,
+            },
+            "excel": dict(),
+        }
+        templatesPath = os.path.join(projectPath, self.TEMPLATE_DIR)
+        if recipe is not None:
+            # A misspelled run or template would silently render nothing
+            try:
+                unmatched = self.__unmatchedSelection(
+                    recipe=recipe,
+                    projectContext=projectContext,
+                    templatesPath=templatesPath,
+                )
+            except Exception as error:
+                projectContext.close()
+                return self.__finish(self.EXIT_PROJECT_ERROR, error)
+            if unmatched:
+                projectContext.close()
+                self.summary["unmatched"] = unmatched
+                return self.__finish(
+                    self.EXIT_USAGE_ERROR,
+                    ValueError(
+                        "Selection not found in the project: "
+                        + "; ".join(
+                            f"{kind} {', '.join(entries)}"
+                            for kind, entries in unmatched.items()
+                        )
+                        + "."
+                    ),
+                )
+
+        # Key headers of the rendered Word runs, their packets are merged again
+        renderedRuns = None
+        keyHeaders = None
+        try:
+            if arguments.bundle:
+                # Word Data runs start after the keywords row, the archive follows their order
+                keyHeaders = [
+                    str(row[0])
+                    for row in (projectContext.getSheetMatrix("Word Data") or list())[1:]
+                    if row
+                ]
+            for outputType, options in renderersOptions.items():
+                if recipe is not None and not recipe.includesOutput(outputType):
+                    continue
+                renderer = self.__rendererClass(outputType)
+                start = time.perf_counter()
+                try:
+                    result = renderer(
+                        templatesDirectory=templatesPath,
+                        databasePath=databasePath,
+                        outputRenders=projectPath,
+                        projectContext=projectContext,
+                        incremental=arguments.incremental,
+                        instrumentationLog=arguments.instrumentation_log,
+                        compression=arguments.compression,
+                        recipe=recipe,
+                        **options,
+                    )
+                except Exception as error:
+                    self.summary["renderers"][renderer.__name__] = {
+                        "status": "error",
+                        "seconds": time.perf_counter() - start,
+                        "error": f"{type(error).__name__}: {error}",
+                    }
+                    return self.__finish(self.EXIT_RENDER_ERROR, error)
+                if outputType == "word":
+                    renderedRuns = result.selectedRuns()
+                self.summary["renderers"][renderer.__name__] = {
+                    "status": "success",
+                    "seconds": time.perf_counter() - start,
+                    "steps": result.stepTimings,
+                    "phases": result.instrumentation.summary(),
+                }
+        finally:
+            projectContext.close()
+        if arguments.pdf and (recipe is None or recipe.includesOutput("word")):
+            error = self.__exportPdf(projectPath=projectPath, recipe=recipe)
+            if error is not None:
+                return self.__finish(self.EXIT_EXPORT_ERROR, error)
+        if arguments.bundle:
+            return self.__bundlePdf(
+                projectPath=projectPath, runs=renderedRuns, keyHeaders=keyHeaders
+            )
+        return self.__finish(self.EXIT_SUCCESS)
+
+    def __exportPdf(
+        self, projectPath: str, recipe: RenderRecipe | None
+    ) -> Exception | None:
+        """
+        Method converts the rendered Word documents whose PDF is missing or outdated and adds the export to the summary.
+
+        Returns:
+            Exception | None: error of the export, None when every document was exported
+        """
+        # The exporter loads PyMuPDF, only imported when exporting
+        from Render.PDFExporter import PDFExporter
+
+        arguments = self.arguments
+        start = time.perf_counter()
+        try:
+            with PDFExporter(
+                workers=arguments.pdf_workers,
+                timeout=arguments.pdf_timeout,
+                retries=arguments.pdf_retries,
+            ) as exporter:
+                results = exporter.exportRenders(
+                    rendersDirectory=os.path.join(projectPath, self.RENDERS_DIR),
+                    runs=None if recipe is None else recipe.runs,
+                )
+        except Exception as error:
+            self.summary["pdfExport"] = {
+                "status": "error",
+                "seconds": time.perf_counter() - start,
+                "error": f"{type(error).__name__}: {error}",
+            }
+            return error
+
+        failures = [result for result in results if result["status"] != "success"]
+        self.summary["pdfExport"] = {
+            "status": "error" if failures else "success",
+            "seconds": time.perf_counter() - start,
+            # "command" means each document started its own LibreOffice
+            "mode": exporter.mode,
+            "exported": len(results) - len(failures),
+            "failed": len(failures),
+            "failures": failures,
+        }
+        if failures:
+            return RuntimeError(
+                f"{len(failures)} documents could not be exported to PDF."
+            )
+        return None
+
+    def __bundlePdf(
+        self, projectPath: str, runs: list | None, keyHeaders: list | None
+    ) -> int:
+        """
+        Method merges the PDF documents into the run packets and the project archive and adds the bundle to the summary.
+
+        Returns:
+            int: exit code
+        """
+        # The bundler loads PyMuPDF, only imported when bundling
+        from Render.PDFBundler import PDFBundler
+
+        start = time.perf_counter()
+        try:
+            bundler = PDFBundler(
+                projectPath=projectPath, runs=runs, keyHeaders=keyHeaders
+            )
+        except Exception as error:
+            self.summary["pdfBundle"] = {
+                "status": "error",
+                "seconds": time.perf_counter() - start,
+                "error": f"{type(error).__name__}: {error}",
+            }
+            return self.__finish(self.EXIT_EXPORT_ERROR, error)
+        self.summary["pdfBundle"] = {
+            "status": "success",
+            "seconds": time.perf_counter() - start,
+            "archive": bundler.archivePath,
+            "runBundles": len(bundler.runBundles),
+            "mergedBundles": bundler.mergedBundles,
+        }
+        return self.__finish(self.EXIT_SUCCESS)
+
+    def __index(self) -> int:
+        """
+        Method updates the full-text index of the project and prints the JSON summary.
+
+        Returns:
+            int: exit code
+        """
+        # The index only loads the document classes in the extraction workers
+        from Render.RenderIndex import RenderIndex
+
+        arguments = self.arguments
+        projectPath = os.path.abspath(arguments.project)
+        self.summary = {
+            "command": "index",
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "project": projectPath,
+            "workers": arguments.workers,
+            "rebuild": arguments.rebuild,
+        }
+        if arguments.workers < 1:
+            return self.__finish(
+                self.EXIT_USAGE_ERROR,
+                ValueError("Workers should be a positive integer."),
+            )
+        try:
+            with RenderIndex(projectPath=projectPath) as renderIndex:
+                self.summary["index"] = renderIndex.indexPath
+                self.summary.update(
+                    renderIndex.update(
+                        workers=arguments.workers, rebuild=arguments.rebuild
+                    )
+                )
+        except Exception as error:
+            return self.__finish(self.EXIT_PROJECT_ERROR, error)
+        if self.summary["failed"]:
+            return self.__finish(
+                self.EXIT_INDEX_ERROR,
+                RuntimeError(
+                    f"{len(self.summary['failed'])} documents could not be indexed."
+                ),
+            )
+        return self.__finish(self.EXIT_SUCCESS)
+
+    def __search(self) -> int:
+        """
+        Method searches the full-text index of the project and prints the matching documents as JSON.
+
+        Returns:
+            int: exit code
+        """
+        from Render.RenderIndex import RenderIndex
+
+        arguments = self.arguments
+        projectPath = os.path.abspath(arguments.project)
+        text = " ".join(arguments.query)
+        self.summary = {
+            "command": "search",
+            "project": projectPath,
+            "query": text if arguments.raw else RenderIndex.quote(text),
+            "run": arguments.run,
+        }
+        if arguments.limit < 1:
+            return self.__finish(
+                self.EXIT_USAGE_ERROR,
+                ValueError("Limit should be a positive integer."),
+            )
+        if not text.strip():
+            return self.__finish(
+                self.EXIT_USAGE_ERROR,
+                ValueError("Search query should not be empty."),
+            )
+        if not os.path.exists(os.path.join(projectPath, RenderIndex.INDEX_FILE_NAME)):
+            return self.__finish(
+                self.EXIT_PROJECT_ERROR,
+                FileNotFoundError(
+                    "Project has no index yet, build it with: python main.py index <project>"
+                ),
+            )
+        start = time.perf_counter()
+        try:
+            with RenderIndex(projectPath=projectPath) as renderIndex:
+                results = renderIndex.search(
+                    query=self.summary["query"],
+                    limit=arguments.limit,
+                    run=arguments.run,
+                )
+        except ValueError as error:
+            return self.__finish(self.EXIT_USAGE_ERROR, error)
+        except Exception as error:
+            return self.__finish(self.EXIT_PROJECT_ERROR, error)
+        self.summary["seconds"] = time.perf_counter() - start
+        self.summary["results"] = results
+        return self.__finish(self.EXIT_SUCCESS)
+
+    @staticmethod
+    def __rendererClass(outputType: str) -> type:
+        """
+        Method imports the renderer of a document type, "--only excel" never loads docxtpl.
+        """
+        if outputType == "word":
+            from Render.WordImageRender import WordImageRenderer
+
+            return WordImageRenderer
+        from Render.ExcelRender import ExcelRenderer
+
+        return ExcelRenderer
+
+    def __finish(self, exitCode: int, error: Exception = None) -> int:
+        """
+        Method completes the summary, prints it on stdout and writes the summary file.
+
+        Returns:
+            int: exit code
+        """
+        self.summary["exitCode"] = exitCode
+        self.summary["error"] = (
+            None if error is None else f"{type(error).__name__}: {error}"
+        )
+        output = json.dumps(self.summary, indent=4, default=str)
+        print(output)
+        if self.arguments.summary is not None:
+            try:
+                with open(self.arguments.summary, mode="w", encoding="utf-8") as file:
+                    file.write(output)
+            except OSError as writeError:
+                print(
+                    f"Summary file could not be written: {writeError}", file=sys.stderr
+                )
+        return exitCode
+
+    pass
+
+
+if __name__ == "__main__":
+    sys.exit(CommandLineInterface().exitCode)
@@ -0,0 +1,194 @@
+# Python native libraries
+import csv
+import os
+from datetime import date, datetime, time
+from typing import Iterator
+
+# Third party libraries
+
+# Self build libraries
+from Func.AbstractDocument import AbstractDocument
+
+
+class CSV(AbstractDocument):
+    """
+    Class reads a database stored as a directory of CSV files, one file per sheet named after the sheet, e.g. "Word Data.csv".
+    Builds the directory if it does not exist. Same sheet interface as the read-only Excel database.
+    CSV cells are text, the cell types file remembers which cells were numbers, booleans and dates so only those are converted back,
+    every other cell, e.g. a "1001" text key header, stays text. Cells of sheet files written by other tools are read as text.
+    Args:
+        > filePath (str) : directory where the sheet files exist
+    Returns: None
+    Attributes:
+        > filePath (str) : directory where the sheet files exist
+        > sheets (list[str]) : list of sheets contained in the directory
+    """
+
+    FILE_EXTENSION = ".csv"
+
+    # File holding the sheet, row, column and type of the non text cells of every sheet
+    CELL_TYPES_FILE_NAME = "_cellTypes.csv"
+    __CELL_TYPES = {
+        "bool": (bool, lambda cell: cell == "TRUE"),
+        "int": (int, int),
+        "float": (float, float),
+        "datetime": (datetime, datetime.fromisoformat),
+        "date": (date, date.fromisoformat),
+        "time": (time, time.fromisoformat),
+    }
+
+    def __init__(self, filePath: str) -> None:
+        """
+        We build the class starting object attributes.
+            Args:
+                > filePath (str) : directory where the sheet files exist
+            Returns: None
+            Raises: None
+        """
+        self.filePath = filePath
+        os.makedirs(self.filePath, exist_ok=True)
+        self.__readDirectory()
+        pass
+
+    def __readDirectory(self) -> None:
+        """
+        Method lists the sheet files of the directory.
+        """
+        self.sheets = sorted(
+            item[: -len(self.FILE_EXTENSION)]
+            for item in os.listdir(self.filePath)
+            if item.endswith(self.FILE_EXTENSION)
+            and item != self.CELL_TYPES_FILE_NAME
+        )
+        pass
+
+    def __sheetPath(self, sheetName: str) -> str:
+        return os.path.join(self.filePath, f"{sheetName}{self.FILE_EXTENSION}")
+
+    @classmethod
+    def __cellType(cls, value: any) -> str | None:
+        """
+        Method returns the name of the value type stored in the cell types file, None for text.
+        """
+        for name, (valueType, _) in cls.__CELL_TYPES.items():
+            if type(value) is valueType:
+                return name
+        return None
+
+    def __readCellTypes(self) -> list[list[str]]:
+        """
+        Method reads the rows [sheet, row, column, type] of the cell types file, empty when it does not exist.
+        """
+        cellTypesPath = os.path.join(self.filePath, self.CELL_TYPES_FILE_NAME)
+        if not os.path.exists(cellTypesPath):
+            return list()
+        with open(cellTypesPath, mode="r", encoding="utf-8", newline="") as typesFile:
+            return list(csv.reader(typesFile))
+
+    @classmethod
+    def __parseCell(cls, cell: str, cellType: str | None) -> any:
+        """
+        Method converts a CSV cell back into the value it was written from.
+        """
+        if cell == "":
+            return None
+        if cellType is None:
+            return cell
+        try:
+            return cls.__CELL_TYPES[cellType][1](cell)
+        # A sheet edited by hand may no longer match its types, the cell stays text
+        except (KeyError, ValueError):
+            return cell
+
+    @staticmethod
+    def __formatCell(value: any) -> str:
+        """
+        Method converts a value into its CSV cell.
+        """
+        if value is None:
+            return ""
+        if isinstance(value, bool):
+            return "TRUE" if value else "FALSE"
+        return str(value)
+
+    def iterSheetRows(self, sheetName: str) -> Iterator[list[any]]:
+        """
+        Method streams the rows of a single sheet.
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > Iterator[list[any]] : row values as lists
+            Raises:
+                > KeyError : Sheet does not exist in the directory.
+        """
+        if sheetName not in self.sheets:
+            raise KeyError(f"Sheet does not exist in the directory: {sheetName}")
+
+        # (row, column) -> type of the non text cells
+        cellTypes = {
+            (int(row), int(column)): cellType
+            for sheet, row, column, cellType in self.__readCellTypes()
+            if sheet == sheetName
+        }
+        with open(
+            self.__sheetPath(sheetName), mode="r", encoding="utf-8", newline=""
+        ) as sheetFile:
+            for rowIndex, row in enumerate(csv.reader(sheetFile)):
+                yield [
+                    self.__parseCell(cell, cellTypes.get((rowIndex, columnIndex)))
+                    for columnIndex, cell in enumerate(row)
+                ]
+
+    def readSheet(self, sheetName: str) -> list[list[any]]:
+        """
+        Method reads a single sheet as a 2D matrix (row, column).
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > list[list[any]] : sheet matrix
+            Raises:
+                > KeyError : Sheet does not exist in the directory.
+        """
+        return list(self.iterSheetRows(sheetName))
+
+    def writeSheet(self, sheetName: str, sheetMatrix: list[list[any]]) -> None:
+        """
+        Method writes a 2D matrix (row, column) as a sheet, replacing a previous sheet with the same name.
+            Args:
+                > sheetName (str) : name of the sheet to write
+                > sheetMatrix (list[list[any]]) : sheet matrix
+            Returns: None
+        """
+        cellTypes = [
+            cellTypeRow
+            for cellTypeRow in self.__readCellTypes()
+            if cellTypeRow[0] != sheetName
+        ]
+        with open(
+            self.__sheetPath(sheetName), mode="w", encoding="utf-8", newline=""
+        ) as sheetFile:
+            writer = csv.writer(sheetFile)
+            for rowIndex, row in enumerate(sheetMatrix):
+                writer.writerow([self.__formatCell(value) for value in row])
+                for columnIndex, value in enumerate(row):
+                    cellType = self.__cellType(value)
+                    if cellType is not None:
+                        cellTypes.append([sheetName, rowIndex, columnIndex, cellType])
+
+        with open(
+            os.path.join(self.filePath, self.CELL_TYPES_FILE_NAME),
+            mode="w",
+            encoding="utf-8",
+            newline="",
+        ) as typesFile:
+            csv.writer(typesFile).writerows(cellTypes)
+        self.__readDirectory()
+        pass
+
+    def close(self) -> None:
+        """
+        Method kept for the database interface, sheet files are only open while read.
+        """
+        pass
+
+    pass
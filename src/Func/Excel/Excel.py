@@ -1,4 +1,5 @@
 # Python native libraries
+from typing import Iterator
 
 # Third party libraries
 import openpyxl
@@ -14,30 +15,35 @@ class Excel(AbstractDocument):
     Class reads a Excel file type or builds a new Excel file if does not exists
     Args:
         > filePath (str) : file path where the workbook exists
+        > readOnly (bool, optional) : streams cell values only, sheets are read on demand. Defaults to False.
     Returns: None
     Attributes:
         > filePath (str) : file path where the workbook exists
+        > readOnly (bool) : whether the workbook was loaded in read-only values mode
         > workbook (workbook) : file object class
         > sheets (list[str]) : list of sheets contained in the workbook
-        > workbookData (list[list[list[any]]]): 3D matrix (sheet, row, column)
+        > workbookData (list[list[list[any]]]): 3D matrix (sheet, row, column), not built in read-only mode
     """
 
-    def __init__(self, filePath: str):
+    def __init__(self, filePath: str, readOnly: bool = False):
         """
         We build the class starting object attributes.
             Args:
                 > filePath (str) : file path where the workbook exists
+                > readOnly (bool, optional) : streams cell values only, sheets are read on demand. Defaults to False.
             Returns: None
             Attributes:
                 > filePath (str) : file path where the workbook exists
+                > readOnly (bool) : whether the workbook was loaded in read-only values mode
                 > workbook (workbook) : file object class
                 > sheets (list[str]) : list of sheets contained in the workbook
-                > workbookData (list[list[list[any]]]): 3D matrix (sheet, row, column)
+                > workbookData (list[list[list[any]]]): 3D matrix (sheet, row, column), not built in read-only mode
             Raises: None
         """
 
         # Class main attribute file path location
         self.filePath = filePath
+        self.readOnly = readOnly
 
         # We validate the given path corresponds with an .xlsx file type
         self.__validateFiletype()
@@ -79,6 +85,16 @@ class Excel(AbstractDocument):
                 > workbookData (list[list[list[any]]]): 3D matrix (sheet, row, column).
             Raises: None
         """
+        if self.readOnly:
+            # Cell values are streamed from the file, formulas resolve to their cached values
+            self.workbook = openpyxl.load_workbook(
+                filename=self.filePath,
+                read_only=True,
+                data_only=True,
+            )
+            self.sheets = self.workbook.sheetnames
+            return
+
         self.workbook = openpyxl.load_workbook(filename=self.filePath)
         self.sheets = self.workbook.sheetnames
 
@@ -115,6 +131,41 @@ class Excel(AbstractDocument):
         del workbook
         pass
 
+    def iterSheetRows(self, sheetName: str) -> Iterator[list[any]]:
+        """
+        Method streams the rows of a single sheet without materializing the rest of the workbook.
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > Iterator[list[any]] : row values as lists
+            Raises:
+                > KeyError : Sheet does not exist in the workbook.
+        """
+        if sheetName not in self.sheets:
+            raise KeyError(f"Sheet does not exist in the workbook: {sheetName}")
+
+        for row in self.workbook[sheetName].iter_rows(values_only=True):
+            yield list(row)
+
+    def readSheet(self, sheetName: str) -> list[list[any]]:
+        """
+        Method reads a single sheet as a 2D matrix (row, column).
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > list[list[any]] : sheet matrix
+            Raises:
+                > KeyError : Sheet does not exist in the workbook.
+        """
+        return list(self.iterSheetRows(sheetName))
+
+    def close(self) -> None:
+        """
+        Method releases the workbook, required in read-only mode to close the file handle.
+        """
+        self.workbook.close()
+        pass
+
     def printWorkbookData(self):
         for sheetIndex, sheet in enumerate(self.workbookData):
             print(f"Sheet: {self.sheets[sheetIndex]}\nContent:\n")
@@ -1,5 +1,4 @@
-from PIL import Image, ImageDraw, ImageFont
-import os
+from Func.Images.PlaceholderBatch import PlaceholderBatch
 
 
 class Placeholder:
@@ -10,6 +9,8 @@ class Placeholder:
         > number (int, optional): _description_. Defaults to 1.
         > width (int, optional): _description_. Defaults to 400.
         > height (int, optional): _description_. Defaults to 400.
+        > workers (int, optional): PNG encoding threads. Defaults to None (CPU count).
+        > fastEncode (bool, optional): palette PNG with the exact colors, encoded several times faster. Defaults to False.
     """
 
     def __init__(
@@ -18,6 +19,8 @@ class Placeholder:
         number: int = 1,
         width: int = 400,
         height: int = 400,
+        workers: int = None,
+        fastEncode: bool = False,
     ) -> None:
         """
         Method executes the procedure to build an image placeholder for our rendering document templates
@@ -27,105 +30,34 @@ class Placeholder:
             number (int, optional): _description_. Defaults to 1.
             width (int, optional): _description_. Defaults to 400.
             height (int, optional): _description_. Defaults to 400.
+            workers (int, optional): PNG encoding threads. Defaults to None (CPU count).
+            fastEncode (bool, optional): palette PNG with the exact colors, encoded several times faster. Defaults to False.
         """
         # We set our class attributes for building our place holders
         self.__outputPath = outputPath
         self.__number = number
         self.__size = width, height
+        self.__workers = workers
+        self.__fastEncode = fastEncode
         self.__buildPlaceholders()
         pass
 
-    def __buildImage(self, placeholderText: str, outputFilePath: str) -> None:
-        """
-        Private Method describes the procedure in order to build a single place holder.
-        Args:
-            placeholderText (str): _description_
-            outputFilePath (str): _description_
-        """
-        # Draw base image
-        image = Image.new(mode="RGB", size=self.__size, color="white")
-        draw = ImageDraw.Draw(image)
-
-        # Draw red borders
-        borderColor = "red"
-        borderWidth = 5
-        width, height = self.__size
-        draw.rectangle(
-            [
-                (borderWidth, borderWidth),
-                (width - borderWidth, height - borderWidth),
-            ],
-            outline=borderColor,
-            width=borderWidth,
-        )
-
-        # Draw a red cross (X)
-        draw.line(
-            [
-                (0, 0),
-                (width, height),
-            ],
-            fill=borderColor,
-            width=borderWidth,
-        )
-        draw.line(
-            [
-                (0, height),
-                (width, 0),
-            ],
-            fill=borderColor,
-            width=borderWidth,
-        )
-
-        # Adjust font size dynamically to fit the image
-        fontColor = "black"
-        maxFontSize = 20  # Initial font size
-        try:
-            font = ImageFont.truetype("arial.ttf", maxFontSize)
-            text_bbox = draw.textbbox((0, 0), placeholderText, font=font)
-            textWidth, textHeight = (
-                text_bbox[2] - text_bbox[0],
-                text_bbox[3] - text_bbox[1],
-            )
-        except IOError:
-            # Fallback to a basic Pillow font if TrueType font is unavailable
-            font = ImageFont.load_default()
-            text_bbox = draw.textbbox(
-                (0, 0),
-                placeholderText,
-                font=font,
-                font_size=20,
-            )
-            textWidth, textHeight = (
-                text_bbox[2] - text_bbox[0],
-                text_bbox[3] - text_bbox[1],
-            )
-
-        # Calculate position to center the text
-        textX = (width - textWidth) // 2
-        textY = (height - textHeight) // 2
-
-        # Draw the text on the image
-        draw.text((textX, textY), placeholderText, fill=fontColor, font=font)
-
-        # Save the recently draw image
-        image.save(outputFilePath)
-
     def __buildPlaceholders(self) -> None:
         """
         Method describes the procedure to build the amount of placeholders asked in need by the user.
         """
         # +1 in order to build as many placeholders indicated by the user
-        for index in range(1, self.__number + 1, 1):
-            placeholderText = f"Place_Holder_{index}"
-            outputFilePath = os.path.join(
-                self.__outputPath,
-                f"{placeholderText}.png",
-            )
-            self.__buildImage(
-                placeholderText=placeholderText,
-                outputFilePath=outputFilePath,
-            )
+        names = [f"Place_Holder_{index}" for index in range(1, self.__number + 1, 1)]
+        PlaceholderBatch(
+            outputPath=self.__outputPath,
+            names=names,
+            width=self.__size[0],
+            height=self.__size[1],
+            background="white",
+            stampText=True,
+            workers=self.__workers,
+            fastEncode=self.__fastEncode,
+        )
         pass
 
     pass
@@ -0,0 +1,266 @@
+# Python native libraries
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Third party libraries
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+# Self build libraries
+
+
+class PlaceholderBatch:
+    """
+    Class generates a batch of placeholder images sharing the same size and frame (red border and cross).
+    The font is loaded and the frame drawn once, each image only stamps its text on a copy of the frame.
+    PNG encoding and writing run in a thread pool, Pillow releases the GIL while compressing.
+    Images without text are identical, so they are encoded once and the same bytes are written for every name.
+    Args:
+        > outputPath (str): directory where the images are written
+        > names (list[str]): image file names without extension
+        > width (int, optional): image width in pixels. Defaults to 400.
+        > height (int, optional): image height in pixels. Defaults to 400.
+        > background (str, optional): background color. Defaults to "white".
+        > stampText (bool, optional): writes each name centered on its image. Defaults to True.
+        > workers (int, optional): encoding threads. Defaults to None (CPU count).
+        > fastEncode (bool, optional): palette PNG with the exact image colors and the lowest compression level, encoded several times faster. Defaults to False.
+    Attr:
+        > outputFilePaths (list[str]): written image paths, in names order
+    Raises:
+        > ValueError: Workers should be a positive integer.
+    """
+
+    BORDER_COLOR = "red"
+    BORDER_WIDTH = 5
+    FONT_COLOR = "black"
+    FONT_SIZE = 20
+
+    # PNG zlib levels, Pillow saves with 6 by default
+    DEFAULT_COMPRESS_LEVEL = 6
+    FAST_COMPRESS_LEVEL = 1
+
+    def __init__(
+        self,
+        outputPath: str,
+        names: list[str],
+        width: int = 400,
+        height: int = 400,
+        background: str = "white",
+        stampText: bool = True,
+        workers: int = None,
+        fastEncode: bool = False,
+    ) -> None:
+        """
+        Method builds and writes every image of the batch.
+
+        Raises:
+            ValueError: Workers should be a positive integer.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("Workers should be a positive integer.")
+        self.__outputPath = outputPath
+        self.__names = list(names)
+        self.__size = width, height
+        self.__background = background
+        self.__stampText = stampText
+        self.__workers = workers or os.cpu_count() or 1
+        self.__compressLevel = (
+            self.FAST_COMPRESS_LEVEL if fastEncode else self.DEFAULT_COMPRESS_LEVEL
+        )
+        self.outputFilePaths = [
+            os.path.join(self.__outputPath, f"{name}.png") for name in self.__names
+        ]
+
+        self.__buildFrame()
+        if fastEncode:
+            self.__buildPaletteFrame()
+        else:
+            self.__paletteFrame = None
+        if self.__stampText:
+            self.__loadFont()
+            self.__buildStampedImages()
+        else:
+            self.__writeSharedImage()
+        pass
+
+    def __buildFrame(self) -> None:
+        """
+        Method draws the background, the red border and the red cross shared by every image.
+        """
+        self.__frame = Image.new(mode="RGB", size=self.__size, color=self.__background)
+        draw = ImageDraw.Draw(self.__frame)
+        width, height = self.__size
+        borderWidth = self.BORDER_WIDTH
+        draw.rectangle(
+            [
+                (borderWidth, borderWidth),
+                (width - borderWidth, height - borderWidth),
+            ],
+            outline=self.BORDER_COLOR,
+            width=borderWidth,
+        )
+        draw.line([(0, 0), (width, height)], fill=self.BORDER_COLOR, width=borderWidth)
+        draw.line([(0, height), (width, 0)], fill=self.BORDER_COLOR, width=borderWidth)
+        pass
+
+    def __loadFont(self) -> None:
+        """
+        Method loads the text font once for the whole batch.
+        """
+        try:
+            self.__font = ImageFont.truetype("arial.ttf", self.FONT_SIZE)
+            self.__fontSize = None
+        except IOError:
+            # Fallback to a basic Pillow font if TrueType font is unavailable
+            self.__font = ImageFont.load_default()
+            self.__fontSize = self.FONT_SIZE
+        pass
+
+    def __textPosition(self, draw: ImageDraw.ImageDraw, text: str) -> tuple[int, int]:
+        """
+        Method returns the top left position centering the text on the image.
+        """
+        if self.__fontSize is None:
+            textBox = draw.textbbox((0, 0), text, font=self.__font)
+        else:
+            textBox = draw.textbbox(
+                (0, 0), text, font=self.__font, font_size=self.__fontSize
+            )
+        textWidth, textHeight = textBox[2] - textBox[0], textBox[3] - textBox[1]
+        width, height = self.__size
+        return (width - textWidth) // 2, (height - textHeight) // 2
+
+    def __stamp(self, text: str) -> Image.Image:
+        """
+        Method copies the frame and writes the text centered on it.
+        """
+        image = self.__frame.copy()
+        draw = ImageDraw.Draw(image)
+        draw.text(
+            self.__textPosition(draw, text),
+            text,
+            fill=self.FONT_COLOR,
+            font=self.__font,
+        )
+        return image
+
+    def __buildPaletteFrame(self) -> None:
+        """
+        Method converts the frame into a palette image holding its exact colors, for the fast encoding.
+        The palette frame stays None when the frame holds more colors than a palette can.
+        """
+        self.__paletteFrame = None
+        colors = self.__frame.getcolors(maxcolors=256)
+        if colors is None:
+            return
+        # With no more colors than the palette size, each color keeps its own entry
+        paletteFrame = self.__frame.quantize(
+            colors=len(colors), method=Image.Quantize.MAXCOVERAGE
+        )
+        if ImageChops.difference(paletteFrame.convert("RGB"), self.__frame).getbbox():
+            return
+        palette = paletteFrame.getpalette()
+        self.__paletteIndexes = {
+            tuple(palette[index * 3 : index * 3 + 3]): index
+            for _, index in paletteFrame.getcolors(maxcolors=256)
+        }
+        self.__paletteFrame = paletteFrame
+        pass
+
+    def __stampPalette(self, text: str) -> Image.Image | None:
+        """
+        Method writes the text on a crop of the frame and maps the crop pixels to palette indexes,
+        the new text colors (black anti-aliased on the background) are appended to the palette.
+        Only the text box is converted, the rest of the image is a copy of the palette frame.
+
+        Returns:
+            Image.Image | None: palette image, None when the colors do not fit in a palette
+        """
+        draw = ImageDraw.Draw(self.__frame)
+        position = self.__textPosition(draw, text)
+        left, top, right, bottom = draw.textbbox(position, text, font=self.__font)
+        width, height = self.__size
+        box = (max(left, 0), max(top, 0), min(right, width), min(bottom, height))
+        if box[0] >= box[2] or box[1] >= box[3]:
+            return self.__paletteFrame.copy()
+
+        region = self.__frame.crop(box)
+        ImageDraw.Draw(region).text(
+            (position[0] - box[0], position[1] - box[1]),
+            text,
+            fill=self.FONT_COLOR,
+            font=self.__font,
+        )
+
+        indexes = dict(self.__paletteIndexes)
+        freeIndexes = iter(sorted(set(range(256)) - set(indexes.values())))
+        palette = self.__paletteFrame.getpalette()
+        palette += [0] * (768 - len(palette))
+        regionIndexes = bytearray()
+        for color in region.getdata():
+            index = indexes.get(color)
+            if index is None:
+                index = next(freeIndexes, None)
+                if index is None:
+                    return None
+                indexes[color] = index
+                palette[index * 3 : index * 3 + 3] = color
+            regionIndexes.append(index)
+
+        image = self.__paletteFrame.copy()
+        image.putpalette(palette)
+        image.paste(Image.frombytes("P", region.size, bytes(regionIndexes)), box)
+        return image
+
+    def __buildImage(self, text: str) -> Image.Image:
+        """
+        Method builds the image of one name, as a palette image when encoding fast.
+        """
+        if self.__paletteFrame is not None:
+            image = self.__stampPalette(text)
+            if image is not None:
+                return image
+        return self.__stamp(text)
+
+    def __save(self, image: Image.Image, outputFilePath: str) -> None:
+        """
+        Method encodes the image as PNG.
+        """
+        image.save(outputFilePath, format="PNG", compress_level=self.__compressLevel)
+        pass
+
+    def __buildStampedImages(self) -> None:
+        """
+        Method stamps the images in this thread and hands them to the encoding threads.
+        At most two images per thread wait to be encoded, so memory stays bounded for large batches.
+        """
+        maxPending = self.__workers * 2
+        with ThreadPoolExecutor(max_workers=self.__workers) as executor:
+            pending = list()
+            for name, outputFilePath in zip(self.__names, self.outputFilePaths):
+                if len(pending) >= maxPending:
+                    pending.pop(0).result()
+                pending.append(
+                    executor.submit(self.__save, self.__buildImage(name), outputFilePath)
+                )
+            for future in pending:
+                future.result()
+        pass
+
+    def __writeSharedImage(self) -> None:
+        """
+        Method encodes the frame once and writes the same bytes for every name.
+        """
+        if not self.outputFilePaths:
+            return
+        self.__save(
+            self.__frame if self.__paletteFrame is None else self.__paletteFrame,
+            self.outputFilePaths[0],
+        )
+        with open(self.outputFilePaths[0], mode="rb") as imageFile:
+            data = imageFile.read()
+        for outputFilePath in self.outputFilePaths[1:]:
+            with open(outputFilePath, mode="wb") as imageFile:
+                imageFile.write(data)
+        pass
+
+    pass
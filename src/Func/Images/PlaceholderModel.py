@@ -1,5 +1,4 @@
-from PIL import Image, ImageDraw
-import os
+from Func.Images.PlaceholderBatch import PlaceholderBatch
 
 
 class PlaceholderModel:
@@ -10,6 +9,8 @@ class PlaceholderModel:
         > number (int, optional): _description_. Defaults to 1.
         > width (int, optional): _description_. Defaults to 400.
         > height (int, optional): _description_. Defaults to 400.
+        > workers (int, optional): PNG encoding threads. Defaults to None (CPU count).
+        > fastEncode (bool, optional): palette PNG with the exact colors, encoded several times faster. Defaults to False.
     """
 
     def __init__(
@@ -18,6 +19,8 @@ class PlaceholderModel:
         number: int = 1,
         width: int = 400,
         height: int = 400,
+        workers: int = None,
+        fastEncode: bool = False,
     ) -> None:
         """
         Method executes the procedure to build an image placeholder for our rendering document templates
@@ -27,74 +30,34 @@ class PlaceholderModel:
             number (int, optional): _description_. Defaults to 1.
             width (int, optional): _description_. Defaults to 400.
             height (int, optional): _description_. Defaults to 400.
+            workers (int, optional): PNG encoding threads. Defaults to None (CPU count).
+            fastEncode (bool, optional): palette PNG with the exact colors, encoded several times faster. Defaults to False.
         """
         # We set our class attributes for building our place holders
         self.__outputPath = outputPath
         self.__number = number
         self.__size = width, height
+        self.__workers = workers
+        self.__fastEncode = fastEncode
         self.__buildPlaceholders()
         pass
 
-    def __buildImage(self, placeholderText: str, outputFilePath: str) -> None:
-        """
-        Private Method describes the procedure in order to build a single place holder.
-        Args:
-            placeholderText (str): _description_
-            outputFilePath (str): _description_
-        """
-        # Draw base image
-        image = Image.new(mode="RGB", size=self.__size, color="gray")
-        draw = ImageDraw.Draw(image)
-
-        # Draw red borders
-        borderColor = "red"
-        borderWidth = 5
-        width, height = self.__size
-        draw.rectangle(
-            [
-                (borderWidth, borderWidth),
-                (width - borderWidth, height - borderWidth),
-            ],
-            outline=borderColor,
-            width=borderWidth,
-        )
-
-        # Draw a red cross (X)
-        draw.line(
-            [
-                (0, 0),
-                (width, height),
-            ],
-            fill=borderColor,
-            width=borderWidth,
-        )
-        draw.line(
-            [
-                (0, height),
-                (width, 0),
-            ],
-            fill=borderColor,
-            width=borderWidth,
-        )
-
-        # Save the recently draw image
-        image.save(outputFilePath)
-
     def __buildPlaceholders(self) -> None:
         """
         Method describes the procedure to build the amount of placeholders asked in need by the user.
         """
         # +1 in order to build as many placeholders indicated by the user
-        for index in range(1, self.__number + 1, 1):
-            placeholderText = f"Replace_Image_{index}"
-            outputFilePath = os.path.join(
-                self.__outputPath,
-                f"{placeholderText}.png",
-            )
-            self.__buildImage(
-                placeholderText=placeholderText,
-                outputFilePath=outputFilePath,
-            )
+        names = [f"Replace_Image_{index}" for index in range(1, self.__number + 1, 1)]
+        PlaceholderBatch(
+            outputPath=self.__outputPath,
+            names=names,
+            width=self.__size[0],
+            height=self.__size[1],
+            background="gray",
+            stampText=False,
+            workers=self.__workers,
+            fastEncode=self.__fastEncode,
+        )
         pass
 
     pass
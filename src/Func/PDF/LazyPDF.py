@@ -0,0 +1,226 @@
+# Python native libraries
+import os
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-party libraries
+import pymupdf  # PyMuPDF, the fitz module name is deprecated
+
+# Self-build libraries
+from Func.AbstractDocument import AbstractDocument
+
+
+class LazyPDF(AbstractDocument):
+    """
+    Class reads a PDF file page by page, a page text is only extracted when the page is touched.
+    Opening the file only reads its page tree, so a single section of a 3,000 pages PDF is read without extracting the rest.
+    The file stays open until close, the class can be used as a context manager.
+    As a sequence it holds the read pages: len(pdf) and pdf[0] count and index pageNumbers, getPage takes absolute page numbers.
+    Args:
+        > filePath (str): path of the PDF file
+        > pages (Iterable[int], optional): page numbers to read, starting at 1, e.g. range(10, 21). Defaults to None (every page).
+        > cachedPages (int, optional): extracted page texts kept in memory, least recently used first out. Defaults to 64.
+    Attr:
+        > filePath (str): path of the PDF file
+        > pageCount (int): number of pages of the file
+        > pageNumbers (list[int]): page numbers read, in the given order
+    Meth:
+        > getPage: returns the text of a page by number.
+        > iterPages: yields the (page number, text) of the read pages.
+        > close: closes the file.
+        > extractBatch: extracts the text of many PDF files, optionally across worker processes.
+    Raises:
+        > ValueError: Given file path is not a valid PDF file.
+        > FileNotFoundError: File not found.
+        > IndexError: Page number out of the file pages.
+    """
+
+    # Pages extracted by each worker task of a batch, large files are split across workers
+    BATCH_CHUNK_PAGES = 200
+
+    def __init__(
+        self, filePath: str, pages: Iterable[int] = None, cachedPages: int = 64
+    ) -> None:
+        """
+        Method opens the PDF file without extracting any page.
+
+        Raises:
+            ValueError: Given file path is not a valid PDF file.
+            FileNotFoundError: File not found.
+            IndexError: Page number out of the file pages.
+        """
+        self.filePath = filePath
+        if not self.filePath.lower().endswith(".pdf"):
+            raise ValueError(
+                f"Given file path: {self.filePath} is not a valid PDF file."
+            )
+        if not os.path.exists(self.filePath):
+            raise FileNotFoundError(f"File not found: {self.filePath}")
+
+        self.__pdf = pymupdf.open(self.filePath)
+        self.pageCount = self.__pdf.page_count
+        self.pageNumbers = (
+            list(range(1, self.pageCount + 1)) if pages is None else list(pages)
+        )
+        for pageNumber in self.pageNumbers:
+            self.__validatePageNumber(pageNumber)
+
+        # Page number -> extracted text, bounded so long reads keep a flat memory use
+        self.__cachedPages = max(0, cachedPages)
+        self.__texts = OrderedDict()
+        pass
+
+    def __validatePageNumber(self, pageNumber: int) -> None:
+        """
+        Method validates a page number against the file pages.
+
+        Raises:
+            IndexError: Page number out of the file pages.
+        """
+        if not 1 <= pageNumber <= self.pageCount:
+            raise IndexError(
+                f"Page number {pageNumber} out of the {self.pageCount} pages of: "
+                f"{self.filePath}"
+            )
+        pass
+
+    def getPage(self, pageNumber: int) -> str:
+        """
+        Method returns the text of a page, extracting it the first time it is touched.
+        Any page of the file can be read, including pages outside the read page numbers.
+
+        Args:
+            > pageNumber (int): page number, starting at 1
+
+        Returns:
+            str: stripped text of the page
+
+        Raises:
+            IndexError: Page number out of the file pages.
+            ValueError: PDF file is closed.
+        """
+        if pageNumber in self.__texts:
+            self.__texts.move_to_end(pageNumber)
+            return self.__texts[pageNumber]
+
+        self.__validatePageNumber(pageNumber)
+        if self.__pdf is None:
+            raise ValueError(f"PDF file is closed: {self.filePath}")
+        text = self.__pdf[pageNumber - 1].get_text("text").strip()
+        if self.__cachedPages:
+            self.__texts[pageNumber] = text
+            if len(self.__texts) > self.__cachedPages:
+                self.__texts.popitem(last=False)
+        return text
+
+    def iterPages(self) -> Iterator[tuple[int, str]]:
+        """
+        Method yields the page number and text of every read page, one page extracted at a time.
+        """
+        for pageNumber in self.pageNumbers:
+            yield pageNumber, self.getPage(pageNumber)
+
+    def __iter__(self) -> Iterator[str]:
+        for _, text in self.iterPages():
+            yield text
+
+    def __len__(self) -> int:
+        return len(self.pageNumbers)
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        # Indexes the read pages from 0, as len and iteration do
+        if isinstance(index, slice):
+            return [self.getPage(pageNumber) for pageNumber in self.pageNumbers[index]]
+        return self.getPage(self.pageNumbers[index])
+
+    def printDocumentContent(self) -> None:
+        """
+        Print the content of the read pages.
+        """
+        print(f"--- PDF Document Content ---")
+        for pageNumber, content in self.iterPages():
+            if content:
+                print(f"\n** Page {pageNumber} **")
+                print(content)
+
+    def close(self) -> None:
+        """
+        Method closes the PDF file, already extracted pages remain available.
+        """
+        if self.__pdf is not None:
+            self.__pdf.close()
+            self.__pdf = None
+        pass
+
+    def __enter__(self) -> "LazyPDF":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+        pass
+
+    @classmethod
+    def extractBatch(
+        cls,
+        filePaths: list[str],
+        pages: Iterable[int] = None,
+        workers: int = 1,
+    ) -> dict[str, list[str]]:
+        """
+        Method extracts the page texts of many PDF files, files larger than BATCH_CHUNK_PAGES are split so workers share them.
+
+        Args:
+            > filePaths (list[str]): paths of the PDF files
+            > pages (Iterable[int], optional): page numbers read in every file. Defaults to None (every page).
+            > workers (int, optional): worker processes. Defaults to 1 (serial).
+
+        Returns:
+            dict[str, list[str]]: file path -> texts of the read pages, in page order
+
+        Raises:
+            ValueError: Workers should be a positive integer.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Workers should be a positive integer.")
+        pages = None if pages is None else list(pages)
+
+        # We only read the page trees here, each task extracts a chunk of one file
+        jobs = list()
+        for filePath in filePaths:
+            with cls(filePath, pages=pages, cachedPages=0) as pdf:
+                pageNumbers = pdf.pageNumbers
+            for index in range(0, len(pageNumbers), cls.BATCH_CHUNK_PAGES):
+                jobs.append(
+                    {
+                        "filePath": filePath,
+                        "pageNumbers": pageNumbers[
+                            index : index + cls.BATCH_CHUNK_PAGES
+                        ],
+                    }
+                )
+
+        texts = {filePath: list() for filePath in filePaths}
+        # Serial path, we avoid the process pool overhead
+        if workers == 1:
+            for job in jobs:
+                texts[job["filePath"]].extend(cls._extractPages(**job))
+            return texts
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(cls._extractPages, **job) for job in jobs]
+            # Chunks are gathered in submission order, so pages stay in order
+            for job, future in zip(jobs, futures):
+                texts[job["filePath"]].extend(future.result())
+        return texts
+
+    @staticmethod
+    def _extractPages(filePath: str, pageNumbers: list[int]) -> list[str]:
+        """
+        Worker extracts the text of a chunk of pages of one file.
+        Static so it can be sent to worker processes.
+        """
+        with LazyPDF(filePath, pages=pageNumbers, cachedPages=0) as pdf:
+            return list(pdf)
+
+    pass
@@ -0,0 +1,133 @@
+# Python native libraries
+import os
+
+# Third-party libraries
+import pymupdf  # PyMuPDF, the fitz module name is deprecated
+
+# Self-build libraries
+
+
+class PDFMerger:
+    """
+    Class merges PDF files into a single PDF, pages are copied as they are without re-rasterizing them.
+    Merged pages are flushed to the output file every "flushPages" pages with an incremental save and the output is reopened,
+    so only the pages appended since the last flush are held in memory, a 50,000 pages bundle never has to fit in it.
+    The output is written aside and only replaces the output path on close.
+    Args:
+        > outputPath (str): path of the merged PDF
+        > flushPages (int, optional): pages appended between two flushes. Defaults to 500.
+    Attr:
+        > outputPath (str): path of the merged PDF
+        > pageCount (int): pages merged so far
+        > toc (list[list]): table of contents entries [level, title, page], pages starting at 1
+    Meth:
+        > append: appends the pages of a PDF file, with a bookmark to its first page.
+        > close: writes the table of contents and the merged PDF.
+    Raises:
+        > ValueError: Flush pages should be a positive integer.
+    """
+
+    def __init__(self, outputPath: str, flushPages: int = 500) -> None:
+        """
+        Method starts an empty merged PDF.
+
+        Raises:
+            ValueError: Flush pages should be a positive integer.
+        """
+        if not isinstance(flushPages, int) or flushPages < 1:
+            raise ValueError("Flush pages should be a positive integer.")
+        self.outputPath = outputPath
+        self.flushPages = flushPages
+        self.pageCount = 0
+        self.toc = list()
+
+        self.__temporaryPath = f"{outputPath}.{os.getpid()}.tmp"
+        self.__document = pymupdf.open()
+        # The temporary file only exists after the first flush
+        self.__flushed = False
+        self.__pendingPages = 0
+        pass
+
+    def append(self, sourcePath: str, title: str = None, level: int = 1) -> int:
+        """
+        Method appends every page of a PDF file, its own table of contents is kept below the bookmark.
+
+        Args:
+            > sourcePath (str): path of the PDF file
+            > title (str, optional): bookmark of the file first page. Defaults to None (no bookmark, the file entries keep their levels).
+            > level (int, optional): table of contents level of the bookmark. Defaults to 1.
+
+        Returns:
+            int: pages appended
+        """
+        with pymupdf.open(sourcePath) as source:
+            firstPage = self.pageCount + 1
+            if title is not None:
+                self.toc.append([level, title, firstPage])
+
+            # Entries of the file shift below the bookmark and after the merged pages
+            levelShift = level if title is not None else level - 1
+            for entryLevel, entryTitle, entryPage in source.get_toc(simple=True):
+                if entryPage >= 1:
+                    self.toc.append(
+                        [entryLevel + levelShift, entryTitle, entryPage + firstPage - 1]
+                    )
+
+            self.__document.insert_pdf(source)
+            pages = source.page_count
+        self.pageCount += pages
+        self.__pendingPages += pages
+        if self.__pendingPages >= self.flushPages:
+            self.__flush()
+        return pages
+
+    def __flush(self) -> None:
+        """
+        Method writes the pending pages to the temporary file and reopens it, releasing them from memory.
+        """
+        if self.__flushed:
+            self.__document.saveIncr()
+        else:
+            self.__document.save(self.__temporaryPath)
+            self.__flushed = True
+        self.__document.close()
+        self.__document = pymupdf.open(self.__temporaryPath)
+        self.__pendingPages = 0
+        pass
+
+    def close(self) -> None:
+        """
+        Method writes the table of contents and moves the merged PDF to the output path.
+
+        Raises:
+            ValueError: Merged PDF has no pages.
+        """
+        try:
+            if self.pageCount == 0:
+                raise ValueError(f"Merged PDF has no pages: {self.outputPath}")
+            self.__document.set_toc(self.toc)
+            self.__flush()
+            self.__document.close()
+            os.replace(self.__temporaryPath, self.outputPath)
+        finally:
+            if not self.__document.is_closed:
+                self.__document.close()
+            if os.path.exists(self.__temporaryPath):
+                os.remove(self.__temporaryPath)
+        pass
+
+    def __enter__(self) -> "PDFMerger":
+        return self
+
+    def __exit__(self, exceptionType: type, *exception) -> None:
+        if exceptionType is None:
+            self.close()
+            return
+        # A failed merge never replaces the output path
+        if not self.__document.is_closed:
+            self.__document.close()
+        if os.path.exists(self.__temporaryPath):
+            os.remove(self.__temporaryPath)
+        pass
+
+    pass
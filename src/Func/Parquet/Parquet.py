@@ -0,0 +1,187 @@
+# Python native libraries
+import json
+import os
+from datetime import date, datetime, time
+from typing import Iterator
+
+# Third party libraries
+
+# Self build libraries
+from Func.AbstractDocument import AbstractDocument
+
+
+class Parquet(AbstractDocument):
+    """
+    Class reads a database stored as a directory of Parquet files, one file per sheet named after the sheet, e.g. "Word Data.parquet".
+    Builds the directory if it does not exist. Same sheet interface as the read-only Excel database, requires pyarrow.
+    Columns c1, c2 ... keep their type when every cell shares it, mixed columns (e.g. text headers over numbers) are stored as JSON text,
+    dates in mixed columns are tagged with their type so they are read back as they were written.
+    Args:
+        > filePath (str) : directory where the sheet files exist
+    Returns: None
+    Attributes:
+        > filePath (str) : directory where the sheet files exist
+        > sheets (list[str]) : list of sheets contained in the directory
+    Raises:
+        > ImportError: Parquet databases require pyarrow.
+    """
+
+    FILE_EXTENSION = ".parquet"
+
+    # Schema metadata key listing the JSON encoded columns
+    __JSON_COLUMNS = b"jsonColumns"
+    # JSON has no date types, they are encoded as {"type": name, "value": isoformat}
+    __DATE_TYPES = {
+        "datetime": (datetime, datetime.fromisoformat),
+        "date": (date, date.fromisoformat),
+        "time": (time, time.fromisoformat),
+    }
+
+    def __init__(self, filePath: str) -> None:
+        """
+        We build the class starting object attributes.
+            Args:
+                > filePath (str) : directory where the sheet files exist
+            Returns: None
+            Raises:
+                > ImportError: Parquet databases require pyarrow.
+        """
+        # pyarrow is optional, only Parquet databases need it
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as error:
+            raise ImportError(
+                "Parquet databases require pyarrow, install it with: pip install pyarrow."
+            ) from error
+        self.__pyarrow = pyarrow
+
+        self.filePath = filePath
+        os.makedirs(self.filePath, exist_ok=True)
+        self.__readDirectory()
+        pass
+
+    def __readDirectory(self) -> None:
+        """
+        Method lists the sheet files of the directory.
+        """
+        self.sheets = sorted(
+            item[: -len(self.FILE_EXTENSION)]
+            for item in os.listdir(self.filePath)
+            if item.endswith(self.FILE_EXTENSION)
+        )
+        pass
+
+    def __sheetPath(self, sheetName: str) -> str:
+        return os.path.join(self.filePath, f"{sheetName}{self.FILE_EXTENSION}")
+
+    @classmethod
+    def __encodeCell(cls, value: any) -> any:
+        """
+        Method encodes the values JSON does not support, dates with their type and any other value as text.
+        """
+        for name, (valueType, _) in cls.__DATE_TYPES.items():
+            if type(value) is valueType:
+                return {"type": name, "value": value.isoformat()}
+        return str(value)
+
+    @classmethod
+    def __decodeCell(cls, encoded: dict) -> any:
+        """
+        Method decodes a tagged JSON value, cells are never dictionaries.
+        """
+        return cls.__DATE_TYPES[encoded["type"]][1](encoded["value"])
+
+    def iterSheetRows(self, sheetName: str) -> Iterator[list[any]]:
+        """
+        Method streams the rows of a single sheet, the sheet columns are read at once.
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > Iterator[list[any]] : row values as lists
+            Raises:
+                > KeyError : Sheet does not exist in the directory.
+        """
+        if sheetName not in self.sheets:
+            raise KeyError(f"Sheet does not exist in the directory: {sheetName}")
+
+        table = self.__pyarrow.parquet.read_table(self.__sheetPath(sheetName))
+        metadata = table.schema.metadata or dict()
+        jsonColumns = set(json.loads(metadata.get(self.__JSON_COLUMNS, b"[]")))
+        columns = list()
+        for name in table.column_names:
+            values = table.column(name).to_pylist()
+            if name in jsonColumns:
+                values = [
+                    (
+                        None
+                        if value is None
+                        else json.loads(value, object_hook=self.__decodeCell)
+                    )
+                    for value in values
+                ]
+            columns.append(values)
+        for row in zip(*columns):
+            yield list(row)
+
+    def readSheet(self, sheetName: str) -> list[list[any]]:
+        """
+        Method reads a single sheet as a 2D matrix (row, column).
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > list[list[any]] : sheet matrix
+            Raises:
+                > KeyError : Sheet does not exist in the directory.
+        """
+        return list(self.iterSheetRows(sheetName))
+
+    def writeSheet(self, sheetName: str, sheetMatrix: list[list[any]]) -> None:
+        """
+        Method writes a 2D matrix (row, column) as a sheet, replacing a previous sheet with the same name.
+        Shorter rows are padded with empty cells.
+            Args:
+                > sheetName (str) : name of the sheet to write
+                > sheetMatrix (list[list[any]]) : sheet matrix
+            Returns: None
+        """
+        pyarrow = self.__pyarrow
+        width = max((len(row) for row in sheetMatrix), default=0) or 1
+        arrays = dict()
+        jsonColumns = list()
+        for index in range(width):
+            name = f"c{index + 1}"
+            values = [row[index] if index < len(row) else None for row in sheetMatrix]
+            # pyarrow would widen integers mixed with floats, every cell must share its type
+            if len({type(value) for value in values if value is not None}) <= 1:
+                try:
+                    arrays[name] = pyarrow.array(values)
+                    continue
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                    pass
+            jsonColumns.append(name)
+            arrays[name] = pyarrow.array(
+                [
+                    (
+                        None
+                        if value is None
+                        else json.dumps(value, default=self.__encodeCell)
+                    )
+                    for value in values
+                ],
+                type=pyarrow.string(),
+            )
+        table = pyarrow.table(arrays).replace_schema_metadata(
+            {self.__JSON_COLUMNS: json.dumps(jsonColumns).encode()}
+        )
+        pyarrow.parquet.write_table(table, self.__sheetPath(sheetName))
+        self.__readDirectory()
+        pass
+
+    def close(self) -> None:
+        """
+        Method kept for the database interface, sheet files are only open while read.
+        """
+        pass
+
+    pass
@@ -0,0 +1,206 @@
+# Python native libraries
+import sqlite3
+from datetime import date, datetime, time
+from typing import Iterator
+
+# Third party libraries
+
+# Self build libraries
+from Func.AbstractDocument import AbstractDocument
+
+
+class SQLite(AbstractDocument):
+    """
+    Class reads a database stored as a SQLite file, one table per sheet named after the sheet, e.g. "Word Data".
+    Builds the file if it does not exist. Same sheet interface as the read-only Excel database.
+    Any table is read as a sheet whose first row holds the column names, reading never writes to the database.
+    Tables written by writeSheet keep the raw sheet rows in order instead, columns c1, c2 ... hold integers, floats and text as stored.
+    Their booleans and dates are stored as 1/0 and text, the cells table remembers their type so they are read back as they were written.
+    Args:
+        > filePath (str) : file path where the database exists
+    Returns: None
+    Attributes:
+        > filePath (str) : file path where the database exists
+        > sheets (list[str]) : list of sheets contained in the database
+    """
+
+    # Tables listing the sheets written by writeSheet and the type of their boolean and date cells
+    SHEETS_TABLE = "_sheets"
+    CELL_TYPES_TABLE = "_cellTypes"
+    __CELL_TYPES = {
+        "bool": (bool, bool),
+        "datetime": (datetime, datetime.fromisoformat),
+        "date": (date, date.fromisoformat),
+        "time": (time, time.fromisoformat),
+    }
+
+    def __init__(self, filePath: str) -> None:
+        """
+        We build the class starting object attributes.
+            Args:
+                > filePath (str) : file path where the database exists
+            Returns: None
+            Raises: None
+        """
+        self.filePath = filePath
+        self.__connection = sqlite3.connect(self.filePath)
+        self.__readTables()
+        pass
+
+    def __readTables(self) -> None:
+        """
+        Method lists the sheet tables of the database and the ones written by writeSheet.
+        """
+        tables = [
+            name
+            for (name,) in self.__connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND name NOT LIKE 'sqlite%' ORDER BY rowid"
+            )
+        ]
+        self.sheets = [
+            name
+            for name in tables
+            if name not in (self.SHEETS_TABLE, self.CELL_TYPES_TABLE)
+        ]
+        self.__writtenSheets = set()
+        if self.SHEETS_TABLE not in tables and self.CELL_TYPES_TABLE in tables:
+            # Databases written before the sheets table only hold written sheets
+            self.__writtenSheets = set(self.sheets)
+        elif self.SHEETS_TABLE in tables:
+            self.__writtenSheets = {
+                name
+                for (name,) in self.__connection.execute(
+                    f"SELECT sheet FROM {self.SHEETS_TABLE}"
+                )
+            }
+        pass
+
+    @staticmethod
+    def __quote(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    @classmethod
+    def __cellType(cls, value: any) -> str | None:
+        """
+        Method returns the name of the value type SQLite does not store natively, None for the native ones.
+        """
+        for name, (valueType, _) in cls.__CELL_TYPES.items():
+            if type(value) is valueType:
+                return name
+        return None
+
+    def iterSheetRows(self, sheetName: str) -> Iterator[list[any]]:
+        """
+        Method streams the rows of a single sheet.
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > Iterator[list[any]] : row values as lists
+            Raises:
+                > KeyError : Sheet does not exist in the database.
+        """
+        if sheetName not in self.sheets:
+            raise KeyError(f"Sheet does not exist in the database: {sheetName}")
+        if sheetName not in self.__writtenSheets:
+            # Other tables have named columns and may have no rowid
+            cursor = self.__connection.execute(
+                f"SELECT * FROM {self.__quote(sheetName)}"
+            )
+            yield [column[0] for column in cursor.description]
+            for row in cursor:
+                yield list(row)
+            return
+
+        # (row, column) -> parser of the boolean and date cells
+        parsers = {
+            (row, column): self.__CELL_TYPES[cellType][1]
+            for row, column, cellType in self.__connection.execute(
+                f"SELECT row, column, type FROM {self.CELL_TYPES_TABLE} "
+                "WHERE sheet = ?",
+                (sheetName,),
+            )
+        }
+        for rowIndex, row in enumerate(
+            self.__connection.execute(
+                f"SELECT * FROM {self.__quote(sheetName)} ORDER BY rowid"
+            )
+        ):
+            row = list(row)
+            if parsers:
+                for columnIndex, value in enumerate(row):
+                    parser = parsers.get((rowIndex, columnIndex))
+                    if parser is not None and value is not None:
+                        row[columnIndex] = parser(value)
+            yield row
+
+    def readSheet(self, sheetName: str) -> list[list[any]]:
+        """
+        Method reads a single sheet as a 2D matrix (row, column).
+            Args:
+                > sheetName (str) : name of the sheet to read
+            Returns:
+                > list[list[any]] : sheet matrix
+            Raises:
+                > KeyError : Sheet does not exist in the database.
+        """
+        return list(self.iterSheetRows(sheetName))
+
+    def writeSheet(self, sheetName: str, sheetMatrix: list[list[any]]) -> None:
+        """
+        Method writes a 2D matrix (row, column) as a table, replacing a previous table with the same name.
+        Shorter rows are padded with empty cells.
+            Args:
+                > sheetName (str) : name of the sheet to write
+                > sheetMatrix (list[list[any]]) : sheet matrix
+            Returns: None
+        """
+        width = max((len(row) for row in sheetMatrix), default=0) or 1
+        table = self.__quote(sheetName)
+        columns = ", ".join(f"c{index}" for index in range(1, width + 1))
+        rows = list()
+        cellTypes = list()
+        for rowIndex, row in enumerate(sheetMatrix):
+            values = list(row) + [None] * (width - len(row))
+            for columnIndex, value in enumerate(values):
+                cellType = self.__cellType(value)
+                if cellType is None:
+                    continue
+                cellTypes.append((sheetName, rowIndex, columnIndex, cellType))
+                if cellType != "bool":
+                    values[columnIndex] = value.isoformat()
+            rows.append(values)
+        with self.__connection:
+            self.__connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.SHEETS_TABLE} "
+                "(sheet TEXT PRIMARY KEY)"
+            )
+            self.__connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.CELL_TYPES_TABLE} "
+                "(sheet TEXT, row INTEGER, column INTEGER, type TEXT)"
+            )
+            self.__connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self.__connection.execute(
+                f"DELETE FROM {self.CELL_TYPES_TABLE} WHERE sheet = ?", (sheetName,)
+            )
+            self.__connection.execute(
+                f"INSERT OR IGNORE INTO {self.SHEETS_TABLE} VALUES (?)", (sheetName,)
+            )
+            self.__connection.execute(f"CREATE TABLE {table} ({columns})")
+            self.__connection.executemany(
+                f"INSERT INTO {table} VALUES ({', '.join('?' * width)})", rows
+            )
+            self.__connection.executemany(
+                f"INSERT INTO {self.CELL_TYPES_TABLE} VALUES (?, ?, ?, ?)", cellTypes
+            )
+        self.__readTables()
+        pass
+
+    def close(self) -> None:
+        """
+        Method closes the database connection.
+        """
+        self.__connection.close()
+        pass
+
+    pass
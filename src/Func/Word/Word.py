@@ -1,34 +1,62 @@
 # Python native libraries
+import os
+import posixpath
+import zipfile
+from typing import Iterator
 
 # Third party libraries
 from docx import Document
 from docx.opc.exceptions import PackageNotFoundError
+from lxml import etree
 
 # Self build libraries
 
 from Func.AbstractDocument import AbstractDocument
 
 
+# WordprocessingML namespace of the document part elements
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
 class Word(AbstractDocument):
     """
     Class reads a Word file type or builds a new Word file if does not exists
     Args:
         > filePath (str):
+        > fast (bool, optional): streams the text out of word/document.xml without the python-docx object model. Defaults to False.
     Attr:
         > filePath (str):
-        > document (Document):
-        > paragraphsContent (list):
-        > tablesContent (list):
+        > fast (bool): whether the document was opened in fast mode
+        > document (Document): None in fast mode
+        > paragraphsContent (list): body paragraphs text, read on first use in fast mode
+        > tablesContent (list): body tables as rows of stripped cell text, read on first use in fast mode
+    Meth:
+        > iterParagraphs: yields the body paragraphs text, one at a time.
+        > iterTableRows: yields the body table rows, one at a time.
     """
 
-    def __init__(self, filePath: str) -> None:
+    # Body level elements of the document part
+    PARAGRAPH_TAG = f"{W}p"
+    TABLE_TAG = f"{W}tbl"
+    ROW_TAG = f"{W}tr"
+    CELL_TAG = f"{W}tc"
+
+    def __init__(self, filePath: str, fast: bool = False) -> None:
 
         # Class main attribute file path location
         self.filePath = filePath
+        self.fast = fast
 
         # We validate the given path corresponds with an .docx file type
         self.__validateFiletype()
 
+        # Fast mode only reads, a missing file is still built empty
+        if self.fast:
+            if not os.path.exists(self.filePath):
+                self.__createNewFile()
+            self.__openFast()
+            return
+
         # We generate our first document attributes
         try:
             self.__readFile()
@@ -57,6 +85,26 @@ class Word(AbstractDocument):
         else:
             return True
 
+    @property
+    def paragraphsContent(self) -> list[str]:
+        if self.__paragraphsContent is None:
+            self.__readContent()
+        return self.__paragraphsContent
+
+    @paragraphsContent.setter
+    def paragraphsContent(self, value: list[str]) -> None:
+        self.__paragraphsContent = value
+
+    @property
+    def tablesContent(self) -> list[list[list[str]]]:
+        if self.__tablesContent is None:
+            self.__readContent()
+        return self.__tablesContent
+
+    @tablesContent.setter
+    def tablesContent(self, value: list[list[list[str]]]) -> None:
+        self.__tablesContent = value
+
     def __readFile(self) -> None:
         """ """
         self.document = Document(self.filePath)
@@ -66,8 +114,6 @@ class Word(AbstractDocument):
         for paragraph in self.document.paragraphs:
             self.paragraphsContent.append(paragraph.text)
 
-        self.tablesContent = list()
-
         # Stores the tables content as a 3D table -> row -> column
         self.tablesContent = list()
 
@@ -90,6 +136,204 @@ class Word(AbstractDocument):
 
         pass
 
+    def __openFast(self) -> None:
+        """
+        Method locates the document part of the package, contents are only read on first use.
+
+        Raises:
+            ValueError: Given file path is not a valid Word package.
+        """
+        self.document = None
+        self.paragraphsContent = None
+        self.tablesContent = None
+        try:
+            with zipfile.ZipFile(self.filePath) as package:
+                names = set(package.namelist())
+                self.__documentPart = "word/document.xml"
+                # The main document part is named by the package relationships
+                if "_rels/.rels" in names:
+                    with package.open("_rels/.rels") as stream:
+                        for relationship in etree.parse(stream).getroot():
+                            if relationship.get("Type", "").endswith(
+                                "/officeDocument"
+                            ):
+                                self.__documentPart = posixpath.normpath(
+                                    relationship.get("Target").lstrip("/")
+                                )
+                                break
+        except zipfile.BadZipFile:
+            raise ValueError(
+                f"Given file path: {self.filePath} is not a valid Word package."
+            )
+        if self.__documentPart not in names:
+            raise ValueError(
+                f"Given file path: {self.filePath} is not a valid Word package."
+            )
+        pass
+
+    def __readContent(self) -> None:
+        """
+        Method reads the fast mode paragraphs and tables in a single pass over the document part.
+        """
+        paragraphsContent = list()
+        tablesContent = list()
+        for kind, content in self.__iterBody():
+            if kind == "paragraph":
+                paragraphsContent.append(content)
+            elif kind == "table":
+                tablesContent.append(list())
+            else:
+                tablesContent[-1].append(content[1])
+        self.paragraphsContent = paragraphsContent
+        self.tablesContent = tablesContent
+        pass
+
+    def iterParagraphs(self) -> Iterator[str]:
+        """
+        Method yields the text of the body paragraphs as saved in the file, the same as python-docx paragraph.text.
+        The document part is streamed, memory stays flat whatever the document size.
+        """
+        for kind, content in self.__iterBody():
+            if kind == "paragraph":
+                yield content
+
+    def iterTableRows(self) -> Iterator[tuple[int, list[str]]]:
+        """
+        Method yields the (table index, stripped cell texts) of every row of the body tables as saved in the file.
+        Cells follow python-docx row.cells: a cell spanning columns is repeated, a vertically merged cell repeats the cell above.
+        """
+        for kind, content in self.__iterBody():
+            if kind == "row":
+                yield content
+
+    def __iterBody(self) -> Iterator[tuple[str, any]]:
+        """
+        Method streams the document part and yields its body content in document order:
+        ("paragraph", text), ("table", table index) when a table starts and ("row", (table index, cells)).
+        Each element is cleared once read, so only the current paragraph or row is held in memory.
+        """
+        documentPart = (
+            self.__documentPart
+            if self.fast
+            else self.document.part.partname.lstrip("/")
+        )
+        # Levels: 0 document, 1 body, 2 body paragraphs and tables, 3 table rows
+        depth = -1
+        tableIndex = -1
+        # Grid offset -> (text, grid span) of the previous row cells, for vertical merges
+        rowAbove = dict()
+        with zipfile.ZipFile(self.filePath) as package:
+            with package.open(documentPart) as stream:
+                for event, element in etree.iterparse(
+                    stream, events=("start", "end"), huge_tree=True
+                ):
+                    if event == "start":
+                        depth += 1
+                        if depth == 2 and element.tag == self.TABLE_TAG:
+                            tableIndex += 1
+                            rowAbove = dict()
+                            yield "table", tableIndex
+                        continue
+
+                    if depth == 2:
+                        if element.tag == self.PARAGRAPH_TAG:
+                            yield "paragraph", self.__paragraphText(element)
+                        self.__release(element)
+                    elif (
+                        depth == 3
+                        and element.tag == self.ROW_TAG
+                        and element.getparent().tag == self.TABLE_TAG
+                    ):
+                        cells, rowAbove = self.__rowCells(element, rowAbove)
+                        yield "row", (tableIndex, cells)
+                        self.__release(element)
+                    depth -= 1
+
+    @staticmethod
+    def __release(element: etree._Element) -> None:
+        """
+        Method frees a read element and its already read siblings.
+        """
+        element.clear()
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+        pass
+
+    @staticmethod
+    def __runText(run: etree._Element) -> str:
+        """
+        Method returns the text of a run: text, tabs, breaks and non-breaking hyphens, as python-docx run.text.
+        """
+        parts = list()
+        for child in run:
+            tag = child.tag
+            if tag == f"{W}t":
+                parts.append(child.text or "")
+            elif tag in (f"{W}tab", f"{W}ptab"):
+                parts.append("\t")
+            elif tag == f"{W}cr":
+                parts.append("\n")
+            elif tag == f"{W}br":
+                # Page and column breaks have no text
+                textWrapping = child.get(f"{W}type", "textWrapping") == "textWrapping"
+                parts.append("\n" if textWrapping else "")
+            elif tag == f"{W}noBreakHyphen":
+                parts.append("-")
+        return "".join(parts)
+
+    @staticmethod
+    def __paragraphText(paragraph: etree._Element) -> str:
+        """
+        Method returns the text of a paragraph runs and hyperlink runs, as python-docx paragraph.text.
+        """
+        parts = list()
+        for child in paragraph:
+            if child.tag == f"{W}r":
+                parts.append(Word.__runText(child))
+            elif child.tag == f"{W}hyperlink":
+                parts.extend(
+                    Word.__runText(run) for run in child if run.tag == f"{W}r"
+                )
+        return "".join(parts)
+
+    @staticmethod
+    def __rowCells(row: etree._Element, rowAbove: dict) -> tuple[list[str], dict]:
+        """
+        Method returns the stripped cell texts of a row and its grid offset -> (text, grid span) cells.
+        """
+
+        def value(parent: etree._Element, tag: str) -> str | None:
+            # Value of the w:val attribute of a property, None when the property is missing
+            child = None if parent is None else parent.find(tag)
+            return None if child is None else child.get(f"{W}val", "")
+
+        gridBefore = value(row.find(f"{W}trPr"), f"{W}gridBefore")
+        offset = int(gridBefore) if gridBefore else 0
+        cells = list()
+        rowCells = dict()
+        for cell in row:
+            if cell.tag != Word.CELL_TAG:
+                continue
+            properties = cell.find(f"{W}tcPr")
+            gridSpan = value(properties, f"{W}gridSpan")
+            gridSpan = int(gridSpan) if gridSpan else 1
+            verticalMerge = value(properties, f"{W}vMerge")
+            # A vertical merge without value continues the cell above
+            if verticalMerge in ("", "continue") and offset in rowAbove:
+                text, span = rowAbove[offset]
+            else:
+                text = "\n".join(
+                    Word.__paragraphText(paragraph)
+                    for paragraph in cell
+                    if paragraph.tag == Word.PARAGRAPH_TAG
+                ).strip()
+                span = gridSpan
+            cells.extend([text] * span)
+            rowCells[offset] = (text, span)
+            offset += gridSpan
+        return cells, rowCells
+
     def __createNewFile(self) -> None:
         self.document = Document()
         self.document.save(self.filePath)
@@ -103,21 +347,29 @@ class Word(AbstractDocument):
 
         # Print all paragraphs
         print("\n** Paragraphs **")
-        for paragraph in self.document.paragraphs:
-            if paragraph.text.strip():  # Ignore empty paragraphs
-                print(paragraph.text)
+        for paragraph in self.paragraphsContent:
+            if paragraph.strip():  # Ignore empty paragraphs
+                print(paragraph)
 
         # Print all tables
         print("\n** Tables **")
-        for tableIndex, table in enumerate(self.document.tables, start=1):
+        for tableIndex, table in enumerate(self.tablesContent, start=1):
             print(f"\nTable {tableIndex}:")
-            for row in table.rows:
-                rowData = [cell.text.strip() for cell in row.cells]
+            for rowData in table:
                 print(
                     "\t" + "\t| ".join(rowData)
                 )  # Tab-separated values for better formatting
 
     def saveAndClose(self) -> None:
+        """
+        Raises:
+            ValueError: Word file opened in fast mode has no document to save.
+        """
+        if self.fast:
+            raise ValueError(
+                "Word file opened in fast mode has no document to save: "
+                f"{self.filePath}"
+            )
         self.document.save(path_or_stream=self.filePath)
         pass
 
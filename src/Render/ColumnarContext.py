@@ -0,0 +1,143 @@
+# Python native libraries
+from array import array
+from collections.abc import Mapping
+
+# Third party libraries
+
+# Self build libraries
+
+
+class ColumnarContext(Mapping):
+    """
+    Class stores a render context sheet by columns, one array per keyword and a row index per run.
+    Integer and float only columns are packed into typed arrays, so memory scales with the data instead of one dictionary per run.
+    Behaves as a read-only mapping of run key -> RunContext.
+    Args:
+        > keywords (list[str]): keyword of each column
+        > runs (list[any]): key header of each row
+        > rows (list[list[any]]): values of each row, in keyword order
+    Attr:
+        > keywords (list[str]): keyword of each column
+    Meth:
+        > select: builds a smaller context holding only the given runs.
+    Raises:
+        > ValueError: Runs and rows should have the same length.
+    """
+
+    def __init__(self, keywords: list[str], runs: list[any], rows: list[list[any]]):
+        """
+        Method packs the rows into columns.
+
+        Args:
+            > keywords (list[str]): keyword of each column
+            > runs (list[any]): key header of each row
+            > rows (list[list[any]]): values of each row, in keyword order
+
+        Raises:
+            ValueError: Runs and rows should have the same length.
+            IndexError: A row is shorter than the keywords.
+        """
+        if len(runs) != len(rows):
+            raise ValueError("Runs and rows should have the same length.")
+
+        # Run key -> row index, a repeated run key or keyword keeps its last values
+        self.__rowIndex = {run: index for index, run in enumerate(runs)}
+        self.__columns = {
+            keyword: self.__packColumn([row[columnIndex] for row in rows])
+            for columnIndex, keyword in enumerate(keywords)
+        }
+        self.keywords = list(self.__columns)
+        pass
+
+    @staticmethod
+    def __packColumn(values: list[any]) -> array | list[any]:
+        """
+        Method packs a column into a typed array when every value is an integer or every value is a float.
+        """
+        if values and all(type(value) is int for value in values):
+            try:
+                return array("q", values)
+            except OverflowError:
+                return values
+        if values and all(type(value) is float for value in values):
+            return array("d", values)
+        return values
+
+    def value(self, run: any, keyword: str) -> any:
+        """
+        Method returns a single value of the context.
+
+        Args:
+            > run (any): key header of the run
+            > keyword (str): keyword of the column
+
+        Returns:
+            any: stored value
+
+        Raises:
+            KeyError: Run or keyword does not exist.
+        """
+        return self.__columns[keyword][self.__rowIndex[run]]
+
+    def select(self, runs: list[any]) -> "ColumnarContext":
+        """
+        Method builds a context holding only the given runs, e.g. the partition sent to a worker process.
+
+        Args:
+            > runs (list[any]): key headers of the runs to keep
+
+        Returns:
+            ColumnarContext: context of the given runs
+
+        Raises:
+            KeyError: Run does not exist.
+        """
+        rows = [[self.value(run, keyword) for keyword in self.keywords] for run in runs]
+        return ColumnarContext(keywords=self.keywords, runs=runs, rows=rows)
+
+    def __getitem__(self, run: any) -> "RunContext":
+        if run not in self.__rowIndex:
+            raise KeyError(run)
+        return RunContext(context=self, run=run)
+
+    def __iter__(self):
+        return iter(self.__rowIndex)
+
+    def __len__(self) -> int:
+        return len(self.__rowIndex)
+
+    def __contains__(self, run: any) -> bool:
+        return run in self.__rowIndex
+
+    pass
+
+
+class RunContext(Mapping):
+    """
+    Class is a read-only view of a single run in a ColumnarContext, mapping keyword -> value without copying the row.
+    Args:
+        > context (ColumnarContext): context holding the run
+        > run (any): key header of the run
+    """
+
+    __slots__ = ("__context", "__run")
+
+    def __init__(self, context: ColumnarContext, run: any) -> None:
+        self.__context = context
+        self.__run = run
+        pass
+
+    def __getitem__(self, keyword: str) -> any:
+        return self.__context.value(self.__run, keyword)
+
+    def __iter__(self):
+        return iter(self.__context.keywords)
+
+    def __len__(self) -> int:
+        return len(self.__context.keywords)
+
+    def __repr__(self) -> str:
+        # Same representation as the run dictionary, render manifests digest it
+        return repr(dict(self))
+
+    pass
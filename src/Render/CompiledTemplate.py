@@ -0,0 +1,190 @@
+# Python native libraries
+import io
+import re
+
+# Third party libraries
+from docx import Document
+from docxtpl import DocxTemplate
+from jinja2 import Environment, Template
+
+# Self build libraries
+from Render.PackageCompression import PackageCompression
+
+
+class CompiledTemplate(DocxTemplate):
+    """
+    Class keeps a word template parsed and compiled in memory, so every run renders from the same pristine copy.
+    The template file is read once, its body, headers, footers and footnotes XML are patched and compiled into Jinja templates once per Jinja environment,
+    and each render only evaluates the compiled templates over a fresh package loaded from the in-memory bytes.
+    Custom environments and autoescaping given to render apply as with docxtpl.
+    Args:
+        > templatePath (str): path of the word template
+        > compression (str, optional): zip compression level of the saved documents, see PackageCompression. Defaults to "default".
+    Attr:
+        > templatePath (str): path of the word template
+        > compression (PackageCompression): zip compression of the saved documents
+    Raises:
+        > FileNotFoundError: Template path does not exist.
+        > ValueError: Compression level should be one of: store, fast, default, max.
+    """
+
+    FOOTNOTES_CONTENT_TYPE = (
+        "application/vnd.openxmlformats-officedocument"
+        ".wordprocessingml.footnotes+xml"
+    )
+
+    def __init__(self, templatePath: str, compression: str = "default") -> None:
+        """
+        Method reads the template file and compiles its XML parts.
+
+        Args:
+            > templatePath (str): path of the word template
+            > compression (str, optional): zip compression level of the saved documents, see PackageCompression. Defaults to "default".
+
+        Raises:
+            FileNotFoundError: Template path does not exist.
+            ValueError: Compression level should be one of: store, fast, default, max.
+        """
+        self.templatePath = templatePath
+        self.compression = PackageCompression(level=compression)
+
+        # Pristine package bytes, every render loads its own document from them
+        with open(self.templatePath, "rb") as templateFile:
+            self.__templateBytes = templateFile.read()
+
+        super().__init__(template_file=templatePath)
+        self.__compile()
+        pass
+
+    def init_docx(self, reload: bool = True) -> None:
+        """
+        Method loads the working document from the in-memory template instead of the disk.
+        """
+        if not self.docx or (self.is_rendered and reload):
+            self.docx = Document(io.BytesIO(self.__templateBytes))
+            self.is_rendered = False
+        pass
+
+    def __compile(self) -> None:
+        """
+        Method patches once every XML part docxtpl renders, they are compiled on the first render with each environment.
+        """
+        self.init_docx()
+
+        # Body
+        self.__bodyXml = self.patch_xml(self.get_xml())
+
+        # Headers and footers keyed by their relationship id
+        self.__headersFootersXml = dict()
+        for uri in [self.HEADER_URI, self.FOOTER_URI]:
+            for relKey, part in self.get_headers_footers(uri):
+                xml = self.get_part_xml(part)
+                encoding = self.get_headers_footers_encoding(xml)
+                self.__headersFootersXml[relKey] = (self.patch_xml(xml), encoding)
+
+        # Footnotes keyed by their part name
+        self.__footnotesXml = dict()
+        for part in self.docx.part.package.parts:
+            if part.content_type == self.FOOTNOTES_CONTENT_TYPE:
+                blob = part.blob
+                xml = blob.decode("utf-8") if isinstance(blob, bytes) else blob
+                self.__footnotesXml[part.partname] = self.patch_xml(xml)
+
+        # The compiling document is discarded, renders start from the pristine bytes
+        self.docx = None
+
+        # (environment id, autoescape) -> (environment, compiled parts), the environment is kept so its id is not reused
+        self.__compiledParts = dict()
+        self.__autoescapeEnvironment = Environment(autoescape=True)
+        pass
+
+    def __templates(self, jinja_env: Environment | None) -> dict:
+        """
+        Method returns the parts compiled with an environment, compiling them the first time it is used.
+        """
+        environment = Environment() if jinja_env is None else jinja_env
+        key = (None if jinja_env is None else id(jinja_env), environment.autoescape)
+        if key not in self.__compiledParts:
+            self.__compiledParts[key] = (
+                jinja_env,
+                {
+                    "body": self.__compileXml(environment, self.__bodyXml),
+                    "headersFooters": {
+                        relKey: (self.__compileXml(environment, xml), encoding)
+                        for relKey, (xml, encoding) in self.__headersFootersXml.items()
+                    },
+                    "footnotes": {
+                        partName: self.__compileXml(environment, xml)
+                        for partName, xml in self.__footnotesXml.items()
+                    },
+                },
+            )
+        return self.__compiledParts[key][1]
+
+    @staticmethod
+    def __compileXml(environment: Environment, xml: str) -> Template:
+        """
+        Method applies the docxtpl paragraph split and compiles the XML into a Jinja template.
+        """
+        return environment.from_string(re.sub(r"<w:p([ >])", r"\n<w:p\1", xml))
+
+    def render(
+        self, context: dict, jinja_env: Environment = None, autoescape: bool = False
+    ) -> None:
+        """
+        Method renders the context like docxtpl does, reusing one autoescaping environment where docxtpl builds a new one each render.
+        """
+        if autoescape and jinja_env is None:
+            jinja_env = self.__autoescapeEnvironment
+        super().render(context, jinja_env=jinja_env, autoescape=autoescape)
+        pass
+
+    def __renderCompiled(self, template: Template, part: any, context: dict) -> str:
+        """
+        Method evaluates a compiled template and applies the docxtpl post processing.
+        """
+        self.current_rendering_part = part
+        xml = template.render(context)
+        xml = re.sub(r"\n<w:p([ >])", r"<w:p\1", xml)
+        xml = (
+            xml.replace("{_{", "{{")
+            .replace("}_}", "}}")
+            .replace("{_%", "{%")
+            .replace("%_}", "%}")
+        )
+        return self.resolve_listing(xml)
+
+    def build_xml(self, context: dict, jinja_env: Environment = None) -> str:
+        template = self.__templates(jinja_env)["body"]
+        return self.__renderCompiled(template, self.docx._part, context)
+
+    def build_headers_footers_xml(
+        self, context: dict, uri: str, jinja_env: Environment = None
+    ) -> any:
+        templates = self.__templates(jinja_env)["headersFooters"]
+        for relKey, part in self.get_headers_footers(uri):
+            template, encoding = templates[relKey]
+            xml = self.__renderCompiled(template, part, context)
+            yield relKey, xml.encode(encoding)
+
+    def render_footnotes(self, context: dict, jinja_env: Environment = None) -> None:
+        templates = self.__templates(jinja_env)["footnotes"]
+        for part in self.docx.part.package.parts:
+            template = templates.get(part.partname)
+            if template is not None:
+                part._blob = self.__renderCompiled(template, part, context)
+        pass
+
+    def save(self, filename: any, *args: any, **kwargs: any) -> None:
+        """
+        Method saves the rendered document like docxtpl does, writing the package with the selected compression.
+        """
+        if not self.is_saved and not self.is_rendered:
+            self.init_docx()
+        self.pre_processing()
+        self.compression.writeDocument(self.docx.part.package, filename)
+        self.post_processing(filename)
+        self.is_saved = True
+        pass
+
+    pass
@@ -0,0 +1,466 @@
+# Python native libraries
+import posixpath
+import zipfile
+
+# Third party libraries
+from lxml import etree
+from openpyxl.cell.cell import TIME_FORMATS
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format
+from openpyxl.utils.cell import (
+    column_index_from_string,
+    coordinate_from_string,
+    get_column_letter,
+    range_boundaries,
+)
+from openpyxl.utils.datetime import to_excel
+
+# Self build libraries
+from Render.PackageCompression import PackageCompression
+
+
+class CompiledWorkbook:
+    """
+    Class keeps an excel template package parsed in memory and renders runs by writing only their target cells XML.
+    Untouched package parts are copied as they are, so each run avoids passing the whole workbook through openpyxl's writer.
+    Args:
+        > templatePath (str): path of the excel template
+        > compression (str, optional): zip compression level of the saved workbooks, see PackageCompression. Defaults to "default" (template settings).
+    Attr:
+        > templatePath (str): path of the excel template
+        > compression (PackageCompression): zip compression of the saved workbooks
+        > sheets (list[str]): list of sheets contained in the template
+    Meth:
+        > render: writes a run's cell values over the pristine template.
+        > save: writes the last rendered run into a new package.
+    Raises:
+        > FileNotFoundError: Template path does not exist.
+        > ValueError: Compression level should be one of: store, fast, default, max.
+    """
+
+    MAIN_NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    RELATIONSHIPS_NAMESPACE = (
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    )
+    CALC_CHAIN_TYPE = (
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships/calcChain"
+    )
+    STYLES_TYPE = (
+        "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+    )
+    # Custom number formats ids start after the builtin ones
+    FIRST_CUSTOM_FORMAT_ID = 164
+
+    def __init__(self, templatePath: str, compression: str = "default") -> None:
+        """
+        Method reads the template package and indexes the cells of every sheet.
+
+        Args:
+            > templatePath (str): path of the excel template
+            > compression (str, optional): zip compression level of the saved workbooks, see PackageCompression. Defaults to "default" (template settings).
+
+        Raises:
+            FileNotFoundError: Template path does not exist.
+            ValueError: Compression level should be one of: store, fast, default, max.
+        """
+        self.templatePath = templatePath
+        self.compression = PackageCompression(level=compression)
+        self.__readPackage()
+        self.__removeCalculationChain()
+        self.__indexSheets()
+        self.__indexStyles()
+
+        # Sheet part name -> serialized XML of the last rendered run
+        self.__renderedParts = dict()
+        pass
+
+    def __readPackage(self) -> None:
+        """
+        Method loads every package part in memory keeping their original order and zip settings.
+        """
+        self.__entries = list()
+        self.__parts = dict()
+        with zipfile.ZipFile(self.templatePath) as package:
+            for item in package.infolist():
+                self.__entries.append(item)
+                self.__parts[item.filename] = package.read(item.filename)
+        pass
+
+    def __removeCalculationChain(self) -> None:
+        """
+        Method drops the calculation chain and asks excel to recalculate on load, as written values may replace formulas.
+        """
+        workbookRelsName = "xl/_rels/workbook.xml.rels"
+        relationships = etree.fromstring(self.__parts[workbookRelsName])
+        for relationship in list(relationships):
+            if relationship.get("Type") != self.CALC_CHAIN_TYPE:
+                continue
+            partName = self.__resolveTarget(relationship.get("Target"))
+            relationships.remove(relationship)
+            self.__parts.pop(partName, None)
+            self.__entries = [
+                item for item in self.__entries if item.filename != partName
+            ]
+
+            contentTypes = etree.fromstring(self.__parts["[Content_Types].xml"])
+            for override in list(contentTypes):
+                if override.get("PartName") == f"/{partName}":
+                    contentTypes.remove(override)
+            self.__parts["[Content_Types].xml"] = self.__serialize(contentTypes)
+        self.__parts[workbookRelsName] = self.__serialize(relationships)
+
+        workbook = etree.fromstring(self.__parts["xl/workbook.xml"])
+        calcPr = workbook.find(f"{{{self.MAIN_NAMESPACE}}}calcPr")
+        if calcPr is None:
+            calcPr = etree.SubElement(workbook, f"{{{self.MAIN_NAMESPACE}}}calcPr")
+        calcPr.set("fullCalcOnLoad", "1")
+        self.__parts["xl/workbook.xml"] = self.__serialize(workbook)
+        pass
+
+    def __indexSheets(self) -> None:
+        """
+        Method parses every worksheet once and indexes its rows and cells by reference.
+        """
+        workbook = etree.fromstring(self.__parts["xl/workbook.xml"])
+        relationships = etree.fromstring(self.__parts["xl/_rels/workbook.xml.rels"])
+        targets = {
+            relationship.get("Id"): self.__resolveTarget(relationship.get("Target"))
+            for relationship in relationships
+        }
+
+        self.sheets = list()
+        self.__sheetParts = dict()
+        self.__sheetTrees = dict()
+        self.__sheetRows = dict()
+        self.__sheetCells = dict()
+        for sheet in workbook.iter(f"{{{self.MAIN_NAMESPACE}}}sheet"):
+            sheetName = sheet.get("name")
+            partName = targets[sheet.get(f"{{{self.RELATIONSHIPS_NAMESPACE}}}id")]
+            tree = etree.fromstring(self.__parts[partName])
+            sheetData = tree.find(f"{{{self.MAIN_NAMESPACE}}}sheetData")
+
+            rows = dict()
+            cells = dict()
+            rowNumber = 0
+            for row in sheetData:
+                # References are optional, as openpyxl's reader missing ones follow the previous row or cell
+                rowNumber = int(row.get("r", rowNumber + 1))
+                row.set("r", str(rowNumber))
+                rows[rowNumber] = row
+                columnNumber = 0
+                for cell in row:
+                    if cell.get("r") is None:
+                        columnNumber += 1
+                        cell.set("r", f"{get_column_letter(columnNumber)}{rowNumber}")
+                    else:
+                        columnNumber = self.__cellColumn(cell)
+                    cells[cell.get("r")] = cell
+
+            self.sheets.append(sheetName)
+            self.__sheetParts[sheetName] = partName
+            self.__sheetTrees[sheetName] = tree
+            self.__sheetRows[sheetName] = rows
+            self.__sheetCells[sheetName] = cells
+        pass
+
+    def __indexStyles(self) -> None:
+        """
+        Method parses the styles part and tells which cell styles already display dates.
+        """
+        relationships = etree.fromstring(self.__parts["xl/_rels/workbook.xml.rels"])
+        self.__stylesPart = None
+        self.__stylesTree = None
+        for relationship in relationships:
+            if relationship.get("Type") == self.STYLES_TYPE:
+                self.__stylesPart = self.__resolveTarget(relationship.get("Target"))
+        if self.__stylesPart not in self.__parts:
+            # Without styles part, dates are written as bare serial numbers
+            self.__stylesPart = None
+            return
+
+        namespace = f"{{{self.MAIN_NAMESPACE}}}"
+        self.__stylesTree = etree.fromstring(self.__parts[self.__stylesPart])
+        self.__numberFormats = dict(BUILTIN_FORMATS)
+        numFmts = self.__stylesTree.find(f"{namespace}numFmts")
+        if numFmts is not None:
+            for numFmt in numFmts:
+                self.__numberFormats[int(numFmt.get("numFmtId"))] = numFmt.get(
+                    "formatCode"
+                )
+        # (template style, date format) -> style index displaying the date
+        self.__dateStyles = dict()
+        pass
+
+    def __dateStyle(self, style: str | None, data: any) -> str | None:
+        """
+        Method returns the style of a date cell, as openpyxl a style without date format gets a copy with the default one of the value type.
+        """
+        if self.__stylesTree is None:
+            return style
+        namespace = f"{{{self.MAIN_NAMESPACE}}}"
+        cellXfs = self.__stylesTree.find(f"{namespace}cellXfs")
+        xfs = list(cellXfs)
+        styleIndex = int(style) if style is not None else 0
+        if styleIndex >= len(xfs):
+            return style
+        xf = xfs[styleIndex]
+        numberFormat = self.__numberFormats.get(int(xf.get("numFmtId", "0")))
+        if numberFormat is not None and is_date_format(numberFormat):
+            return style
+
+        # Subclasses, e.g. pandas timestamps, take the format of their parent type
+        formatCode = next(
+            code
+            for timeType, code in TIME_FORMATS.items()
+            if isinstance(data, timeType)
+        )
+        key = (styleIndex, formatCode)
+        if key not in self.__dateStyles:
+            xfCopy = etree.fromstring(etree.tostring(xf))
+            xfCopy.set("numFmtId", str(self.__numberFormatId(formatCode)))
+            xfCopy.set("applyNumberFormat", "1")
+            cellXfs.append(xfCopy)
+            cellXfs.set("count", str(len(cellXfs)))
+            self.__parts[self.__stylesPart] = self.__serialize(self.__stylesTree)
+            self.__dateStyles[key] = str(len(cellXfs) - 1)
+        return self.__dateStyles[key]
+
+    def __numberFormatId(self, formatCode: str) -> int:
+        """
+        Method returns the id of a number format, adding it to the styles part when missing.
+        """
+        for numFmtId, code in self.__numberFormats.items():
+            if code == formatCode:
+                return numFmtId
+
+        namespace = f"{{{self.MAIN_NAMESPACE}}}"
+        numFmts = self.__stylesTree.find(f"{namespace}numFmts")
+        if numFmts is None:
+            # Number formats are the first element of the style sheet
+            numFmts = etree.Element(f"{namespace}numFmts")
+            self.__stylesTree.insert(0, numFmts)
+        numFmtId = max(self.FIRST_CUSTOM_FORMAT_ID - 1, *self.__numberFormats) + 1
+        etree.SubElement(
+            numFmts,
+            f"{namespace}numFmt",
+            numFmtId=str(numFmtId),
+            formatCode=formatCode,
+        )
+        numFmts.set("count", str(len(numFmts)))
+        self.__numberFormats[numFmtId] = formatCode
+        return numFmtId
+
+    @staticmethod
+    def __resolveTarget(target: str) -> str:
+        """
+        Method turns a workbook relationship target into a package part name.
+        """
+        if target.startswith("/"):
+            return target[1:]
+        return posixpath.normpath(posixpath.join("xl", target))
+
+    @staticmethod
+    def __serialize(tree: any) -> bytes:
+        """
+        Method serializes a part XML tree as an OOXML package part.
+        """
+        return etree.tostring(
+            tree, xml_declaration=True, encoding="UTF-8", standalone=True
+        )
+
+    def __buildCell(self, reference: str, style: str | None, data: any) -> any:
+        """
+        Method builds a cell element holding the given value, keeping the template cell style.
+        """
+        namespace = f"{{{self.MAIN_NAMESPACE}}}"
+        cell = etree.Element(f"{namespace}c", r=reference)
+        if isinstance(data, tuple(TIME_FORMATS)):
+            style = self.__dateStyle(style, data)
+        if style is not None:
+            cell.set("s", style)
+
+        if data is None:
+            return cell
+        if isinstance(data, bool):
+            cell.set("t", "b")
+            etree.SubElement(cell, f"{namespace}v").text = "1" if data else "0"
+        elif isinstance(data, (int, float)):
+            etree.SubElement(cell, f"{namespace}v").text = repr(data)
+        elif isinstance(data, tuple(TIME_FORMATS)):
+            etree.SubElement(cell, f"{namespace}v").text = repr(to_excel(data))
+        elif isinstance(data, str) and data.startswith("="):
+            # Same as openpyxl, strings starting with "=" are written as formulas
+            etree.SubElement(cell, f"{namespace}f").text = data[1:]
+        else:
+            cell.set("t", "inlineStr")
+            inlineString = etree.SubElement(cell, f"{namespace}is")
+            text = etree.SubElement(inlineString, f"{namespace}t")
+            text.text = str(data)
+            text.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+        return cell
+
+    @staticmethod
+    def __insertSorted(parent: any, element: any, key: callable) -> None:
+        """
+        Method inserts an element before the first sibling with a greater key, rows and cells must stay ordered.
+        """
+        elementKey = key(element)
+        for index, sibling in enumerate(parent):
+            if key(sibling) > elementKey:
+                parent.insert(index, element)
+                return
+        parent.append(element)
+
+    @staticmethod
+    def __cellColumn(cell: any) -> int:
+        """
+        Method returns the column index of a cell element.
+        """
+        return column_index_from_string(coordinate_from_string(cell.get("r"))[0])
+
+    def __writeCell(self, sheetName: str, cellPointer: str, data: any) -> tuple:
+        """
+        Method writes a value into the pristine sheet tree and returns how to undo the change.
+        """
+        namespace = f"{{{self.MAIN_NAMESPACE}}}"
+        column, rowNumber = coordinate_from_string(cellPointer.replace("$", "").upper())
+        reference = f"{column}{rowNumber}"
+
+        cells = self.__sheetCells[sheetName]
+        rows = self.__sheetRows[sheetName]
+        previousCell = cells.get(reference)
+
+        style = None if previousCell is None else previousCell.get("s")
+        cell = self.__buildCell(reference, style, data)
+
+        # The cell exists, we swap it keeping its position
+        if previousCell is not None:
+            previousCell.getparent().replace(previousCell, cell)
+            cells[reference] = cell
+            return (sheetName, reference, previousCell, cell, None)
+
+        # The row exists, we insert the cell in column order
+        row = rows.get(rowNumber)
+        if row is not None:
+            self.__insertSorted(row, cell, self.__cellColumn)
+            cells[reference] = cell
+            return (sheetName, reference, None, cell, None)
+
+        # Neither exist, we insert a new row in row order
+        sheetData = self.__sheetTrees[sheetName].find(f"{namespace}sheetData")
+        row = etree.Element(f"{namespace}row", r=str(rowNumber))
+        row.append(cell)
+        self.__insertSorted(sheetData, row, lambda element: int(element.get("r")))
+        rows[rowNumber] = row
+        cells[reference] = cell
+        return (sheetName, reference, None, cell, row)
+
+    def __undoWrite(self, change: tuple) -> None:
+        """
+        Method restores the pristine sheet tree after a written cell.
+        """
+        sheetName, reference, previousCell, cell, row = change
+        cells = self.__sheetCells[sheetName]
+        if previousCell is not None:
+            cell.getparent().replace(cell, previousCell)
+            cells[reference] = previousCell
+            return
+
+        del cells[reference]
+        if row is not None:
+            row.getparent().remove(row)
+            del self.__sheetRows[sheetName][int(row.get("r"))]
+        else:
+            cell.getparent().remove(cell)
+        pass
+
+    @staticmethod
+    def __usedRange(templateRange: str, references: list[str]) -> str:
+        """
+        Method extends the template used range, e.g. "A1:D10", over the written cell references.
+        """
+        minColumn, minRow, maxColumn, maxRow = range_boundaries(templateRange)
+        for reference in references:
+            column, row = coordinate_from_string(reference)
+            column = column_index_from_string(column)
+            minColumn, maxColumn = min(minColumn, column), max(maxColumn, column)
+            minRow, maxRow = min(minRow, row), max(maxRow, row)
+        start = f"{get_column_letter(minColumn)}{minRow}"
+        end = f"{get_column_letter(maxColumn)}{maxRow}"
+        return start if start == end else f"{start}:{end}"
+
+    def render(self, values: list[tuple[str, str, any]]) -> None:
+        """
+        Method renders a run over the pristine template, previous runs never leak into the next one.
+
+        Args:
+            > values (list[tuple[str, str, any]]): (cellPointer, sheetPointer, data) for each cell to write
+
+        Raises:
+            KeyError: Worksheet does not exist.
+        """
+        changes = list()
+        touchedSheets = list()
+        try:
+            for cellPointer, sheetPointer, data in values:
+                if sheetPointer not in self.__sheetTrees:
+                    raise KeyError(f"Worksheet {sheetPointer} does not exist.")
+                changes.append(self.__writeCell(sheetPointer, cellPointer, data))
+                if sheetPointer not in touchedSheets:
+                    touchedSheets.append(sheetPointer)
+
+            self.__renderedParts = dict()
+            for sheetName in touchedSheets:
+                dimension = self.__sheetTrees[sheetName].find(
+                    f"{{{self.MAIN_NAMESPACE}}}dimension"
+                )
+                templateRange = None if dimension is None else dimension.get("ref")
+                if templateRange is not None:
+                    dimension.set(
+                        "ref",
+                        self.__usedRange(
+                            templateRange,
+                            [change[1] for change in changes if change[0] == sheetName],
+                        ),
+                    )
+                try:
+                    self.__renderedParts[self.__sheetParts[sheetName]] = (
+                        self.__serialize(self.__sheetTrees[sheetName])
+                    )
+                finally:
+                    if templateRange is not None:
+                        dimension.set("ref", templateRange)
+
+        # We always return the sheets to their pristine state
+        finally:
+            for change in reversed(changes):
+                self.__undoWrite(change)
+        pass
+
+    def save(self, filename: any) -> None:
+        """
+        Method writes the last rendered run into a new package.
+
+        Args:
+            > filename (any): output path or binary stream
+        """
+        keepCompression = self.compression.level == "default"
+        with self.compression.openPackage(filename) as package:
+            for item in self.__entries:
+                data = self.__renderedParts.get(item.filename)
+                if data is None:
+                    data = self.__parts[item.filename]
+
+                # Fresh entries keep the template names and dates, the compression unless one was selected
+                entry = zipfile.ZipInfo(item.filename, date_time=item.date_time)
+                entry.external_attr = item.external_attr
+                if keepCompression:
+                    entry.compress_type = item.compress_type
+                    package.writestr(entry, data)
+                    continue
+                entry.compress_type = self.compression.compressType
+                package.writestr(
+                    entry, data, compresslevel=self.compression.compressLevel
+                )
+        pass
+
+    pass
@@ -0,0 +1,216 @@
+# Python native libraries
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import secrets
+
+# Third party libraries
+
+# Self build libraries
+
+
+class DatabaseSnapshot:
+    """
+    Class persists the parsed sheets of a project database and the contexts transformed from them as a binary file next to the database.
+    The snapshot is keyed by the size, modification time and content hash of the database files, the hash is only computed when the size or time changed.
+    The file holds a JSON header line and the pickled content, signed with an HMAC keyed by a secret of the user profile:
+    a snapshot written by anyone else, e.g. dropped in a shared project directory, is never unpickled and the database is read instead.
+    Args:
+        > databasePath (str): path of the database information, a file or a directory of sheet files
+    Attr:
+        > databasePath (str): path of the database information
+        > snapshotPath (str): path of the snapshot file
+        > matchedByHash (bool): the loaded snapshot was matched by content hash, saving it again refreshes its modification times
+    Meth:
+        > load: reads the snapshot if it matches the current database.
+        > save: writes the snapshot of the current database.
+    """
+
+    # Bumped whenever the stored sheets or contexts change their structure
+    VERSION = 2
+    FILE_EXTENSION = ".snapshot"
+
+    # Secret signing the snapshots of this user, never stored in a project
+    KEY_PATH = os.path.join(os.path.expanduser("~"), ".officesuite", "snapshot.key")
+    KEY_BYTES = 32
+
+    def __init__(self, databasePath: str) -> None:
+        """
+        Method locates the snapshot of the database.
+
+        Args:
+            > databasePath (str): path of the database information, a file or a directory of sheet files
+        """
+        self.databasePath = os.path.normpath(databasePath)
+        self.snapshotPath = f"{self.databasePath}{self.FILE_EXTENSION}"
+
+        # Database files as they were when the database was read, a later edit is never saved as this snapshot
+        self.__stats = self.__readStats()
+        self.matchedByHash = False
+
+        # Content hash of the database, computed at most once
+        self.__hash = None
+        pass
+
+    def __databaseFiles(self) -> list[str]:
+        """
+        Method lists the files holding the database, sorted by name.
+        """
+        if not os.path.isdir(self.databasePath):
+            return [self.databasePath]
+        return sorted(
+            os.path.join(self.databasePath, item)
+            for item in os.listdir(self.databasePath)
+            if os.path.isfile(os.path.join(self.databasePath, item))
+        )
+
+    def __readStats(self) -> list[tuple]:
+        """
+        Method returns the (name, size, modification time) of every database file.
+        """
+        stats = list()
+        for path in self.__databaseFiles():
+            stat = os.stat(path)
+            stats.append((os.path.basename(path), stat.st_size, stat.st_mtime_ns))
+        return stats
+
+    def __contentHash(self) -> str:
+        """
+        Method returns the SHA-256 of the database files content.
+        """
+        if self.__hash is None:
+            digest = hashlib.sha256()
+            for path in self.__databaseFiles():
+                digest.update(os.path.basename(path).encode())
+                with open(path, mode="rb") as databaseFile:
+                    for chunk in iter(lambda: databaseFile.read(1 << 20), b""):
+                        digest.update(chunk)
+            self.__hash = digest.hexdigest()
+        return self.__hash
+
+    @classmethod
+    def __signingKey(cls) -> bytes | None:
+        """
+        Method returns the secret signing the snapshots, creating it readable by the user only the first time.
+
+        Returns:
+            bytes | None: signing key, None when it can neither be read nor created (snapshots are then off)
+        """
+        try:
+            with open(cls.KEY_PATH, mode="rb") as keyFile:
+                key = keyFile.read()
+            if len(key) == cls.KEY_BYTES:
+                return key
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+
+        key = secrets.token_bytes(cls.KEY_BYTES)
+        temporaryPath = f"{cls.KEY_PATH}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cls.KEY_PATH), mode=0o700, exist_ok=True)
+            descriptor = os.open(
+                temporaryPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(descriptor, mode="wb") as keyFile:
+                keyFile.write(key)
+            os.replace(temporaryPath, cls.KEY_PATH)
+        except OSError:
+            if os.path.exists(temporaryPath):
+                os.remove(temporaryPath)
+            return None
+        return key
+
+    @staticmethod
+    def __signature(key: bytes, header: bytes, content: bytes) -> str:
+        """
+        Method returns the HMAC-SHA256 of the header line and the pickled content.
+        """
+        signature = hmac.new(key, header, hashlib.sha256)
+        signature.update(content)
+        return signature.hexdigest()
+
+    def load(self) -> dict | None:
+        """
+        Method reads the snapshot when it matches the current database and its signature is valid.
+
+        Returns:
+            dict | None: {"sheets", "matrices", "contexts"} content, None when missing, outdated, unsigned or unreadable
+        """
+        key = self.__signingKey()
+        if key is None:
+            return None
+        try:
+            with open(self.snapshotPath, mode="rb") as snapshotFile:
+                # The small JSON header is validated before reading the content
+                header = json.loads(snapshotFile.readline())
+                if header.get("version") != self.VERSION:
+                    return None
+                if header.get("stats") != [list(stat) for stat in self.__stats]:
+                    # Same content under a new modification time, e.g. a file copied or saved unchanged
+                    if header.get("hash") != self.__contentHash():
+                        return None
+                    self.matchedByHash = True
+                content = snapshotFile.read()
+            signature = header.pop("signature", "")
+            headerLine = json.dumps(header, sort_keys=True).encode()
+            # Only content this user signed is unpickled
+            if not hmac.compare_digest(
+                self.__signature(key, headerLine, content), str(signature)
+            ):
+                self.matchedByHash = False
+                return None
+            return pickle.loads(content)
+        except (
+            OSError,
+            ValueError,
+            AttributeError,
+            EOFError,
+            pickle.UnpicklingError,
+            ImportError,
+        ):
+            self.matchedByHash = False
+            return None
+
+    def save(self, sheets: list[str], matrices: dict, contexts: dict) -> None:
+        """
+        Method writes the snapshot of the current database, a failed write leaves the previous snapshot in place.
+        Nothing is written when the database changed since it was read.
+
+        Args:
+            > sheets (list[str]): list of sheets contained in the database
+            > matrices (dict): parsed sheet matrices by sheet name
+            > contexts (dict): transformed contexts by key
+        """
+        if self.__readStats() != self.__stats:
+            return
+        key = self.__signingKey()
+        if key is None:
+            return
+        header = {
+            "version": self.VERSION,
+            "stats": self.__stats,
+            "hash": self.__contentHash(),
+        }
+        headerLine = json.dumps(header, sort_keys=True).encode()
+        content = pickle.dumps(
+            {"sheets": sheets, "matrices": matrices, "contexts": contexts},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        header["signature"] = self.__signature(key, headerLine, content)
+        temporaryPath = f"{self.snapshotPath}.{os.getpid()}.tmp"
+        try:
+            with open(temporaryPath, mode="wb") as snapshotFile:
+                snapshotFile.write(json.dumps(header, sort_keys=True).encode() + b"\n")
+                snapshotFile.write(content)
+            os.replace(temporaryPath, self.snapshotPath)
+        except OSError:
+            # The snapshot only saves time, a read-only project still renders
+            if os.path.exists(temporaryPath):
+                os.remove(temporaryPath)
+        pass
+
+    pass
@@ -1,12 +1,18 @@
 # Python native libraries
+import io
 import os
 
 # Third party libraries
-import openpyxl
 from tqdm import tqdm
 
 # Self build libraries
-from Func.Excel.Excel import Excel
+from Render.CompiledWorkbook import CompiledWorkbook
+from Render.OutputWriter import OutputWriter
+from Render.PackageCompression import PackageCompression
+from Render.ProjectContext import ProjectContext
+from Render.RenderInstrumentation import RenderInstrumentation
+from Render.RenderManifest import RenderManifest
+from Render.RenderRecipe import RenderRecipe
 
 
 class ExcelRenderer:
@@ -16,6 +22,14 @@ class ExcelRenderer:
         > templatesDirectory (str): directory where the excel documents are found
         > databasePath (str): path of the excel database information
         > outputRenders (str): directory where the class will dump render documents
+        > projectContext (ProjectContext, optional): database already read and shared between renderers. Defaults to None (read from databasePath).
+        > incremental (bool, optional): only renders documents whose template or row values changed since the last render. Defaults to False.
+        > instrumentationLog (str, optional): JSON lines file where each measured phase is appended. Defaults to None (no log).
+        > compression (str, optional): zip compression level of the rendered documents: "store", "fast", "default" or "max". Defaults to "default".
+        > recipe (RenderRecipe, optional): only renders the runs and templates selected by the recipe. Defaults to None (everything).
+    Attr:
+        > stepTimings (dict[str, float]): wall time in seconds of each step
+        > instrumentation (RenderInstrumentation): wall time, CPU time and peak memory of each step and each run render and save
     Raises:
         > FileNotFoundError: Templates directory does not exist.
         > FileNotFoundError: Database path does not exist.
@@ -23,6 +37,7 @@ class ExcelRenderer:
         > ValueError: Matrix should have Header, cell and sheet pointers.
         > ValueError: Pointes should have same length for rendering.
         > IndexError: Matrix size not uniform, Index out of range.
+        > ValueError: Compression level should be one of: store, fast, default, max.
     """
 
     def __init__(
@@ -30,6 +45,11 @@ class ExcelRenderer:
         templatesDirectory: str,
         databasePath: str,
         outputRenders: str,
+        projectContext: ProjectContext = None,
+        incremental: bool = False,
+        instrumentationLog: str = None,
+        compression: str = "default",
+        recipe: RenderRecipe = None,
     ) -> None:
         """_summary_
 
@@ -37,15 +57,25 @@ class ExcelRenderer:
             > templatesDirectory (str): directory where the excel documents are found
             > databasePath (str): path of the excel database information
             > outputRenders (str): directory where the class will dump render documents
+            > projectContext (ProjectContext, optional): database already read and shared between renderers. Defaults to None (read from databasePath).
+            > incremental (bool, optional): only renders documents whose template or row values changed since the last render. Defaults to False.
+            > instrumentationLog (str, optional): JSON lines file where each measured phase is appended. Defaults to None (no log).
+            > compression (str, optional): zip compression level of the rendered documents: "store", "fast", "default" or "max". Defaults to "default".
+            > recipe (RenderRecipe, optional): only renders the runs and templates selected by the recipe. Defaults to None (everything).
 
         Raises:
             FileNotFoundError: Templates directory does not exist.
             FileNotFoundError: Database path does not exist.
+            ValueError: Compression level should be one of: store, fast, default, max.
         """
         # we set our principal attributes
         self.templatesDirectory = templatesDirectory
         self.databasePath = databasePath
         self.outputRenders = outputRenders
+        self.projectContext = projectContext
+        self.incremental = incremental
+        self.compression = compression
+        self.recipe = recipe
 
         # Initial validations
         if not os.path.exists(self.templatesDirectory):
@@ -53,6 +83,9 @@ class ExcelRenderer:
         if not os.path.exists(self.databasePath):
             raise FileNotFoundError("Database path does not exist.")
 
+        # Unknown compression levels fail before reading the database
+        PackageCompression(level=self.compression)
+
         # We execute the main procedures for rendering documents
         steps = [
                 self.__buildConstants,
@@ -62,6 +95,10 @@ class ExcelRenderer:
                 self.__renderExcelDocuments,
             ]
         totalSteps = len(steps)
+
+        # Wall time in seconds of each step, e.g. {"readDatabase": 0.42}
+        self.stepTimings: dict[str, float] = dict()
+        self.instrumentation = RenderInstrumentation(logPath=instrumentationLog)
         with tqdm(
             total=totalSteps,
             desc="Rendering Excel templates in project",
@@ -69,9 +106,20 @@ class ExcelRenderer:
         ) as progressBar:
             for index, step in enumerate(iterable=steps):
                 progressBar.set_description(f"Step {index+1} of {totalSteps}")
-                step()
+                stepName = step.__name__.strip("_")
+                with self.instrumentation.measure(
+                    phase=stepName, renderer=type(self).__name__
+                ) as record:
+                    step()
+                self.stepTimings[stepName] = (
+                    self.stepTimings.get(stepName, 0.0) + record["wallSeconds"]
+                )
                 progressBar.update(1)
             pass
+
+        # We release the database file when this renderer opened it
+        if projectContext is None:
+            self.projectContext.close()
         pass
 
     def __buildConstants(self):
@@ -79,6 +127,7 @@ class ExcelRenderer:
         We build the the inner class constants
         """
         self.rendersDirectory: str = "Renders"
+        self.manifestFileName: str = ".excelRenderManifest.json"
         pass
 
     def __readDatabase(self) -> None:
@@ -90,14 +139,10 @@ class ExcelRenderer:
 
         """
 
-        excel = Excel(self.databasePath)
-
-        # workbookData (list[list[list[any]]]): 3D __matrix (sheet, row, column)
-        self.__matrix = excel.workbookData
-        self.__sheets = excel.sheets
-        for index, sheetName in enumerate(self.__sheets):
-            if sheetName == "Excel Data":
-                self.__excelMatrix = self.__matrix[index]
+        # We only read the database when no shared project context was given
+        if self.projectContext is None:
+            self.projectContext = ProjectContext(self.databasePath)
+        self.__excelMatrix = self.projectContext.getSheetMatrix("Excel Data")
 
         # Validation of database integrity
         if not self.__excelMatrix:
@@ -109,48 +154,70 @@ class ExcelRenderer:
     def __transformExcelMatrix(self) -> None:
         """
         Method builds the excel table content into a proper data structure for rendering documents
+        The transformed context of every run is kept in the project context snapshot, the one of a run selection only in memory.
 
         Raises:
             ValueError: Matrix should have Header, cell and sheet pointers.
             ValueError: Pointes should have same length for rendering.
             IndexError: Matrix size not uniform, Index out of range.
         """
+        (
+            self.cellPointers,
+            self.sheetPointers,
+            self.excelKeyHeaders,
+            self.excelContext,
+        ) = self.projectContext.getContext(
+            key=("excelContext", RenderRecipe.runsKey(self.recipe)),
+            builder=self.__buildExcelContext,
+            snapshot=RenderRecipe.runsKey(self.recipe) is None,
+        )
+        pass
+
+    def __buildExcelContext(self) -> tuple[list, list, list, dict]:
+        """
+        Method builds the cell pointers, the sheet pointers, the key headers and the excel context by run.
+        """
 
         if len(self.__excelMatrix) < 3:
             raise ValueError("Matrix should have Header, cell and sheet pointers")
 
         # We get all the cell pointers
-        self.cellPointers = self.__excelMatrix[1][1:]
+        cellPointers = self.__excelMatrix[1][1:]
 
         # We get all the sheet pointers
-        self.sheetPointers = self.__excelMatrix[2][1:]
-        if len(self.cellPointers) != len(self.sheetPointers):
+        sheetPointers = self.__excelMatrix[2][1:]
+        if len(cellPointers) != len(sheetPointers):
             raise ValueError("Pointes should have same length for rendering.")
 
-        # We get the Key Headers "Run" names
-        self.excelKeyHeaders = [row[0] for row in self.__excelMatrix[3:]]
+        # We get the Key Headers "Run" names, rows outside the recipe are never transformed
+        selectedRows = [
+            row
+            for row in self.__excelMatrix[3:]
+            if self.recipe is None or self.recipe.includesRun(row[0])
+        ]
+        excelKeyHeaders = [row[0] for row in selectedRows]
 
-        self.excelContext = {}
+        excelContext = {}
         # We get row values from 4th row or index 3 onwards
-        for row in self.__excelMatrix[3:]:
+        for row in selectedRows:
             keyHeader = row[0]
             value = []
             # We skip the first column (Key Header) as it's not rendering data
             for colIndex, data in enumerate(row[1:]):
-                if colIndex >= len(self.cellPointers):
+                if colIndex >= len(cellPointers):
                     raise IndexError("Matrix size not uniform, Index out of range")
-                elif colIndex >= len(self.sheetPointers):
+                elif colIndex >= len(sheetPointers):
                     raise IndexError("Matrix size not uniform, Index out of range")
 
-                cellPointer = self.cellPointers[colIndex]
-                sheetPointer = self.sheetPointers[colIndex]
+                cellPointer = cellPointers[colIndex]
+                sheetPointer = sheetPointers[colIndex]
 
                 # Data structure: (cellPointer, sheetPointer, data)
                 value.append((cellPointer, sheetPointer, data))
 
             # We dump the values for the respective key "run name"
-            self.excelContext[keyHeader] = value
-        pass
+            excelContext[keyHeader] = value
+        return cellPointers, sheetPointers, excelKeyHeaders, excelContext
 
     def __getTemplatesList(self):
         """
@@ -161,7 +228,10 @@ class ExcelRenderer:
             for item in os.listdir(self.templatesDirectory)
         ]
         self.excelTemplatesPaths = [
-            path for path in self.__templatesPaths if path.endswith(".xlsx")
+            path
+            for path in self.__templatesPaths
+            if path.endswith(".xlsx")
+            and (self.recipe is None or self.recipe.includesTemplate(path))
         ]
         pass
 
@@ -169,30 +239,61 @@ class ExcelRenderer:
         """
         Method renders the documents contained in the directory path.
         """
-        for templatePath in self.excelTemplatesPaths:
-            excelTemplate = openpyxl.load_workbook(templatePath)
-            for key, valueList in self.excelContext.items():
-
-                # We build the destination directory where we will store the rendered document version
-                runOutputDirectory = os.path.join(
-                    self.outputRenders,
-                    self.rendersDirectory,
-                    key,
-                )
-                os.makedirs(runOutputDirectory, exist_ok=True)
-
-                # We strip from the template path the original document name and append it to the intended destination adding the key header
-                fileName = os.path.basename(templatePath)
-                renderName = f"{key}_{fileName}"
-                renderOutput = os.path.join(runOutputDirectory, renderName)
-
-                # We actually render the file and save the changes
-                for cellPointer, sheetPointer, data in valueList:
-                    excelSheet = excelTemplate[sheetPointer]
-                    excelSheet[cellPointer] = data
-                excelTemplate.save(renderOutput)
-                excelTemplate.close()
+        manifest = None
+        if self.incremental:
+            manifest = RenderManifest(
+                manifestPath=os.path.join(self.outputRenders, self.manifestFileName),
+                settings={"compression": self.compression},
+            )
 
+        # Saving the next run overlaps with writing the previous ones
+        with OutputWriter(instrumentation=self.instrumentation) as writer:
+            for templatePath in self.excelTemplatesPaths:
+                # Each run is written over the same pristine template
+                templateName = os.path.basename(templatePath)
+                with self.instrumentation.measure(
+                    phase="loadTemplate", template=templateName
+                ):
+                    excelTemplate = CompiledWorkbook(
+                        templatePath=templatePath, compression=self.compression
+                    )
+                for key, valueList in self.excelContext.items():
+
+                    # Destination directory where we will store the rendered document version, built by the writer
+                    runOutputDirectory = os.path.join(
+                        self.outputRenders,
+                        self.rendersDirectory,
+                        key,
+                    )
+
+                    # We strip from the template path the original document name and append it to the intended destination adding the key header
+                    fileName = os.path.basename(templatePath)
+                    renderName = f"{key}_{fileName}"
+                    renderOutput = os.path.join(runOutputDirectory, renderName)
+
+                    # In incremental mode we skip the runs whose inputs did not change
+                    if manifest is not None and not manifest.needsRender(
+                        outputPath=renderOutput,
+                        templatePath=templatePath,
+                        values=valueList,
+                    ):
+                        continue
+
+                    # We actually render the file and save the changes in memory, the writer dumps them into the run directory
+                    with self.instrumentation.measure(
+                        phase="renderRun", template=templateName, run=key
+                    ):
+                        excelTemplate.render(values=valueList)
+                    with self.instrumentation.measure(
+                        phase="saveRun", template=templateName, run=key
+                    ):
+                        document = io.BytesIO()
+                        excelTemplate.save(document)
+                    writer.write(renderOutput, document.getvalue())
+
+        # A recipe render keeps the outputs outside its selection
+        if manifest is not None:
+            manifest.commit(prune=self.recipe is None)
         pass
 
     pass
@@ -0,0 +1,134 @@
+# Python native libraries
+import os
+import weakref
+
+# Third party libraries
+from docx.image.image import Image
+from docx.opc.constants import RELATIONSHIP_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.shape import CT_Inline
+from docxtpl import InlineImage
+
+# Self build libraries
+
+
+class ImageAssetCache:
+    """
+    Class keeps the image assets read, measured and hashed in memory, so runs sharing logos or signatures only load them once.
+    Entries are keyed by path and validated against the file modification time and size, a changed file is read again.
+    Media parts are deduplicated by content hash, each rendered document stores a single part per distinct image.
+    Meth:
+        > getImage: returns the parsed image of an asset file.
+        > embedImage: relates an image into the part being rendered, adding its media part once per document.
+    Raises:
+        > FileNotFoundError: Image asset does not exist.
+    """
+
+    def __init__(self) -> None:
+        """
+        Method initializes an empty cache.
+        """
+        # Asset path -> (modification time, size, parsed image)
+        self.__images = dict()
+
+        # Document package -> {image SHA1: media part}, released with the rendered document
+        self.__mediaParts = weakref.WeakKeyDictionary()
+        pass
+
+    def getImage(self, imagePath: str) -> Image:
+        """
+        Method returns the parsed image of an asset, holding its bytes, dimensions and hash.
+
+        Args:
+            > imagePath (str): path of the image asset
+
+        Returns:
+            Image: python-docx image of the asset
+
+        Raises:
+            FileNotFoundError: Image asset does not exist.
+        """
+        status = os.stat(imagePath)
+        cached = self.__images.get(imagePath)
+        if cached is not None and cached[:2] == (status.st_mtime_ns, status.st_size):
+            return cached[2]
+
+        image = Image.from_file(imagePath)
+        self.__images[imagePath] = (status.st_mtime_ns, status.st_size, image)
+        return image
+
+    def embedImage(self, part: any, image: Image) -> tuple[str, Image]:
+        """
+        Method relates an image into a story part, the media part is only added the first time the document uses the image content.
+        python-docx hashes every stored media blob again on each lookup, we index them by hash once per document instead.
+
+        Args:
+            > part (any): python-docx story part being rendered
+            > image (Image): parsed image to embed
+
+        Returns:
+            tuple[str, Image]: relationship id and image of the media part, an identical image already embedded is reused
+        """
+        imageParts = part.package.image_parts
+        mediaParts = self.__mediaParts.get(part.package)
+        if mediaParts is None:
+            # Media already in the template is indexed as well
+            mediaParts = {imagePart.sha1: imagePart for imagePart in imageParts}
+            self.__mediaParts[part.package] = mediaParts
+
+        imagePart = mediaParts.get(image.sha1)
+        if imagePart is None:
+            imagePart = imageParts._add_image_part(image)
+            mediaParts[image.sha1] = imagePart
+        return part.relate_to(imagePart, RELATIONSHIP_TYPE.IMAGE), imagePart.image
+
+    pass
+
+
+class CachedInlineImage(InlineImage):
+    """
+    Class renders an inline image from an already parsed image instead of reading its file on every render.
+    Args:
+        > tpl (DocxTemplate): template the image is rendered into
+        > image (Image): parsed image, e.g. from ImageAssetCache.getImage
+        > imageAssets (ImageAssetCache): cache embedding the image media part
+        > width (int, optional): image width in EMU. Defaults to None (native size).
+        > height (int, optional): image height in EMU. Defaults to None (native size).
+        > anchor (str, optional): hyperlink of the image. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        tpl: any,
+        image: Image,
+        imageAssets: ImageAssetCache,
+        width: int = None,
+        height: int = None,
+        anchor: str = None,
+    ) -> None:
+        super().__init__(tpl, image.filename, width=width, height=height, anchor=anchor)
+        self.image = image
+        self.imageAssets = imageAssets
+        pass
+
+    def _insert_image(self) -> str:
+        """
+        Method builds the drawing run XML, same as docxtpl does from an image file.
+        """
+        part = self.tpl.current_rendering_part
+        relationshipId, image = self.imageAssets.embedImage(part=part, image=self.image)
+        width, height = image.scaled_dimensions(self.width, self.height)
+        pic = CT_Inline.new_pic_inline(
+            part.next_id, relationshipId, image.filename, width, height
+        ).xml
+        if self.anchor:
+            run = parse_xml(pic)
+            if run.xpath(".//a:blip"):
+                pic = self._add_hyperlink(run, self.anchor, part).xml
+
+        return (
+            "</w:t></w:r><w:r><w:drawing>%s</w:drawing></w:r><w:r>"
+            '<w:t xml:space="preserve">' % pic
+        )
+
+    pass
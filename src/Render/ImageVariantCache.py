@@ -0,0 +1,190 @@
+# Python native libraries
+import hashlib
+import math
+import os
+
+# Third party libraries
+from PIL import ExifTags, Image, ImageOps
+
+# Self build libraries
+
+
+class ImageVariantCache:
+    """
+    Class prepares right-sized variants of the image assets shown in placeholders with a target size, so a 24 megapixel photo in a 5 cm placeholder is not embedded at full resolution.
+    Each variant is resampled to the target size at VARIANT_DPI and recompressed once, then kept in the cache directory and reused by later renders while its asset is unchanged.
+    Assets already smaller than their target are embedded as they are, images are never upscaled.
+    Photos are measured and written upright, the EXIF orientation is applied to the variant as Word ignores it.
+    Args:
+        > cacheDirectory (str): directory where the variants are written
+    Attr:
+        > cacheDirectory (str): directory where the variants are written
+    Meth:
+        > getVariant: returns the image file to embed and its displayed size for a target size.
+        > prune: deletes the cached variants not returned since the cache was built.
+    """
+
+    # Pixels per inch of the variants, the resolution Word keeps when it compresses pictures
+    VARIANT_DPI = 220
+    JPEG_QUALITY = 85
+
+    # Word sizes are measured in English Metric Units
+    EMU_PER_INCH = 914400
+
+    # EXIF orientations of the photos stored a quarter turn away from upright
+    TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+    def __init__(self, cacheDirectory: str) -> None:
+        """
+        Method initializes the cache, the directory is only created with the first variant.
+        """
+        self.cacheDirectory = cacheDirectory
+
+        # (asset path, width, height) -> (image path, width, height)
+        self.__variants = dict()
+        pass
+
+    def getVariant(
+        self, imagePath: str, width: int = None, height: int = None
+    ) -> tuple[str, int | None, int | None]:
+        """
+        Method returns the image file to embed for a target size, writing its variant the first time.
+        A missing dimension follows the asset aspect ratio.
+
+        Args:
+            > imagePath (str): path of the image asset
+            > width (int, optional): displayed width in EMU. Defaults to None.
+            > height (int, optional): displayed height in EMU. Defaults to None.
+
+        Returns:
+            tuple[str, int | None, int | None]: image path, displayed width and height in EMU, the asset itself at native size without target
+        """
+        if width is None and height is None:
+            return imagePath, None, None
+        key = (imagePath, width, height)
+        if key not in self.__variants:
+            self.__variants[key] = self.__prepareVariant(imagePath, width, height)
+        return self.__variants[key]
+
+    def prune(self) -> list[str]:
+        """
+        Method deletes the variants of the cache directory not returned by getVariant since the cache was built,
+        e.g. variants of edited or removed assets and of changed sizes. Only call it once every placeholder was resolved.
+
+        Returns:
+            list[str]: paths of the deleted variants
+        """
+        if not os.path.isdir(self.cacheDirectory):
+            return list()
+        usedPaths = {
+            os.path.abspath(variantPath)
+            for variantPath, _, _ in self.__variants.values()
+        }
+        removedPaths = list()
+        with os.scandir(self.cacheDirectory) as entries:
+            for entry in entries:
+                # Temporary files belong to variants being written
+                if not entry.is_file() or entry.name.endswith(".tmp"):
+                    continue
+                if os.path.abspath(entry.path) not in usedPaths:
+                    os.remove(entry.path)
+                    removedPaths.append(entry.path)
+        return removedPaths
+
+    def __prepareVariant(
+        self, imagePath: str, width: int | None, height: int | None
+    ) -> tuple[str, int, int]:
+        """
+        Method resamples and recompresses the asset when it holds more pixels than its target size or is not stored upright.
+        """
+        with Image.open(imagePath) as image:
+            orientation = image.getexif().get(ExifTags.Base.Orientation, 1)
+            isTransposed = orientation in self.TRANSPOSED_ORIENTATIONS
+            # Sizes are measured on the upright photo
+            pixelWidth, pixelHeight = image.size
+            if isTransposed:
+                pixelWidth, pixelHeight = pixelHeight, pixelWidth
+            if width is None:
+                width = round(height * pixelWidth / pixelHeight)
+            elif height is None:
+                height = round(width * pixelHeight / pixelWidth)
+
+            variantSize = (
+                min(pixelWidth, self.__pixels(width)),
+                min(pixelHeight, self.__pixels(height)),
+            )
+            if variantSize == (pixelWidth, pixelHeight) and orientation == 1:
+                return imagePath, width, height
+
+            isJpeg = image.format in ("JPEG", "MPO")
+            variantPath = self.__variantPath(imagePath, variantSize, isJpeg)
+            if not os.path.exists(variantPath):
+                if isJpeg:
+                    # The decoder skips the DCT scales below the target, a large photo is never fully decoded
+                    image.draft(
+                        image.mode,
+                        variantSize[::-1] if isTransposed else variantSize,
+                    )
+                self.__writeVariant(
+                    ImageOps.exif_transpose(image), variantPath, variantSize, isJpeg
+                )
+        return variantPath, width, height
+
+    def __pixels(self, length: int) -> int:
+        """
+        Method returns the pixels covering a length in EMU at VARIANT_DPI.
+        """
+        return max(1, math.ceil(length * self.VARIANT_DPI / self.EMU_PER_INCH))
+
+    def __variantPath(
+        self, imagePath: str, variantSize: tuple[int, int], isJpeg: bool
+    ) -> str:
+        """
+        Method names the variant after the asset, its size and the asset file state, an edited asset gets a new variant.
+        """
+        status = os.stat(imagePath)
+        assetKey = hashlib.sha1(
+            f"{os.path.abspath(imagePath)}|{status.st_size}|{status.st_mtime_ns}".encode()
+        ).hexdigest()[:12]
+        stem = os.path.splitext(os.path.basename(imagePath))[0]
+        extension = ".jpg" if isJpeg else ".png"
+        return os.path.join(
+            self.cacheDirectory,
+            f"{stem}_{variantSize[0]}x{variantSize[1]}_{assetKey}{extension}",
+        )
+
+    def __writeVariant(
+        self,
+        image: Image.Image,
+        variantPath: str,
+        variantSize: tuple[int, int],
+        isJpeg: bool,
+    ) -> None:
+        """
+        Method writes the resampled image, photos stay JPEG and every other format is written as PNG.
+        """
+        if image.mode not in ("RGB", "RGBA", "L", "LA") + (("CMYK",) if isJpeg else ()):
+            hasAlpha = "transparency" in image.info or image.mode in ("PA", "RGBa")
+            image = image.convert("RGBA" if hasAlpha else "RGB")
+        variant = image.resize(variantSize, resample=Image.Resampling.LANCZOS)
+
+        os.makedirs(self.cacheDirectory, exist_ok=True)
+        # Written aside and moved, a parallel render never embeds a partial file
+        temporaryPath = f"{variantPath}.{os.getpid()}.tmp"
+        try:
+            if isJpeg:
+                variant.save(
+                    temporaryPath,
+                    format="JPEG",
+                    quality=self.JPEG_QUALITY,
+                    optimize=True,
+                )
+            else:
+                variant.save(temporaryPath, format="PNG", optimize=True)
+            os.replace(temporaryPath, variantPath)
+        finally:
+            if os.path.exists(temporaryPath):
+                os.remove(temporaryPath)
+        pass
+
+    pass
@@ -0,0 +1,116 @@
+# Python native libraries
+import json
+import os
+import sys
+import time
+
+# Third party libraries
+import uno
+
+# Self build libraries
+
+
+class OfficeBridgeHelper:
+    """
+    Class converts documents for an OfficeWorker whose interpreter does not ship the LibreOffice Python bridge (uno).
+    It runs as a script on an interpreter shipping it, usually the one bundled with LibreOffice, so it only uses the standard library and uno:
+        python OfficeBridgeHelper.py <pipeName> <startupTimeout>
+    It connects to the worker LibreOffice listening on the pipe and writes {"ready": true} or {"ready": false, "error"} on stdout.
+    Then it reads one JSON request per line on stdin, {"document", "pdf"}, and answers one JSON line on stdout, {"error"} with None on success.
+    Args:
+        > pipeName (str): pipe the worker LibreOffice listens on
+        > startupTimeout (float): seconds LibreOffice may take to accept connections
+    Meth:
+        > serve: converts the requested documents until stdin is closed.
+    Raises:
+        > RuntimeError: LibreOffice could not be reached.
+    """
+
+    def __init__(self, pipeName: str, startupTimeout: float) -> None:
+        localContext = uno.getComponentContext()
+        resolver = localContext.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", localContext
+        )
+        deadline = time.monotonic() + startupTimeout
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:pipe,name={pipeName};urp;StarOffice.ComponentContext"
+                )
+                break
+            except Exception:
+                # The pipe is not accepting connections yet
+                if time.monotonic() > deadline:
+                    raise RuntimeError("LibreOffice could not be reached.")
+                time.sleep(0.25)
+        self.__desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        pass
+
+    @staticmethod
+    def __properties(**values: any) -> tuple:
+        """
+        Method builds the UNO property values of a load or store call.
+        """
+        properties = list()
+        for name, value in values.items():
+            propertyValue = uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+            propertyValue.Name = name
+            propertyValue.Value = value
+            properties.append(propertyValue)
+        return tuple(properties)
+
+    def __convert(self, documentPath: str, pdfPath: str) -> None:
+        """
+        Method loads the document in LibreOffice and stores it with the PDF export filter.
+        """
+        document = self.__desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(os.path.abspath(documentPath)),
+            "_blank",
+            0,
+            self.__properties(Hidden=True, ReadOnly=True),
+        )
+        if document is None:
+            raise RuntimeError(f"LibreOffice could not open {documentPath}")
+        try:
+            document.storeToURL(
+                uno.systemPathToFileUrl(os.path.abspath(pdfPath)),
+                self.__properties(FilterName="writer_pdf_Export"),
+            )
+        finally:
+            document.close(True)
+        pass
+
+    def serve(self, requests=sys.stdin, responses=sys.stdout) -> None:
+        """
+        Method converts the documents requested on stdin until it is closed.
+
+        Args:
+            > requests (TextIO, optional): JSON lines {"document", "pdf"}. Defaults to stdin.
+            > responses (TextIO, optional): JSON lines {"error"}. Defaults to stdout.
+        """
+        for line in requests:
+            try:
+                request = json.loads(line)
+                self.__convert(request["document"], request["pdf"])
+                response = {"error": None}
+            except Exception as error:
+                response = {"error": f"{type(error).__name__}: {error}"}
+            responses.write(json.dumps(response) + "\n")
+            responses.flush()
+        pass
+
+    pass
+
+
+if __name__ == "__main__":
+    try:
+        helper = OfficeBridgeHelper(
+            pipeName=sys.argv[1], startupTimeout=float(sys.argv[2])
+        )
+    except Exception as error:
+        print(json.dumps({"ready": False, "error": f"{type(error).__name__}: {error}"}))
+        sys.exit(1)
+    print(json.dumps({"ready": True}), flush=True)
+    helper.serve()
@@ -0,0 +1,144 @@
+# Python native libraries
+import os
+import queue
+import threading
+
+# Third party libraries
+
+# Self build libraries
+from Render.RenderInstrumentation import RenderInstrumentation
+
+
+class OutputWriter:
+    """
+    Class writes rendered documents to disk from a pool of writer threads, so rendering the next run overlaps with writing the previous one.
+    Documents are handed over as in-memory bytes through a bounded queue, a full queue blocks the renderer to cap memory.
+    Args:
+        > threads (int, optional): number of writer threads. Defaults to 2.
+        > maxPending (int, optional): documents waiting to be written before the renderer blocks. Defaults to 8.
+        > instrumentation (RenderInstrumentation, optional): measures each document write. Defaults to None.
+    Meth:
+        > write: queues a rendered document.
+        > close: waits for every queued document to be written.
+    Raises:
+        > ValueError: Writer threads and pending documents should be positive integers.
+    """
+
+    def __init__(
+        self,
+        threads: int = 2,
+        maxPending: int = 8,
+        instrumentation: RenderInstrumentation = None,
+    ) -> None:
+        """
+        Method starts the writer threads.
+
+        Args:
+            > threads (int, optional): number of writer threads. Defaults to 2.
+            > maxPending (int, optional): documents waiting to be written before the renderer blocks. Defaults to 8.
+            > instrumentation (RenderInstrumentation, optional): measures each document write. Defaults to None.
+
+        Raises:
+            ValueError: Writer threads and pending documents should be positive integers.
+        """
+        if threads < 1 or maxPending < 1:
+            raise ValueError(
+                "Writer threads and pending documents should be positive integers."
+            )
+        self.instrumentation = instrumentation
+        self.__pending = queue.Queue(maxsize=maxPending)
+
+        # First exception raised by a writer thread, raised back to the renderer
+        self.__error = None
+        self.__threads = [
+            threading.Thread(target=self.__writeLoop, daemon=True)
+            for _ in range(threads)
+        ]
+        for thread in self.__threads:
+            thread.start()
+        pass
+
+    def __enter__(self) -> "OutputWriter":
+        return self
+
+    def __exit__(self, excType: any, excValue: any, traceback: any) -> None:
+        # A write error never hides the exception raised while rendering
+        try:
+            self.close()
+        except Exception:
+            if excType is None:
+                raise
+        pass
+
+    def __writeLoop(self) -> None:
+        """
+        Method writes queued documents until it receives the stop signal.
+        """
+        while True:
+            item = self.__pending.get()
+            try:
+                if item is None:
+                    return
+                # After a failure we keep draining the queue so the renderer never blocks
+                if self.__error is None:
+                    self.__writeDocument(*item)
+            except Exception as error:
+                self.__error = error
+            finally:
+                self.__pending.task_done()
+
+    def __writeDocument(self, outputPath: str, data: bytes) -> None:
+        """
+        Method writes a document next to its destination and moves it in place, a failed write never leaves a truncated output.
+        """
+        if self.instrumentation is None:
+            self.__replaceFile(outputPath, data)
+            return
+        with self.instrumentation.measure(
+            phase="writeRun", output=os.path.basename(outputPath)
+        ):
+            self.__replaceFile(outputPath, data)
+        pass
+
+    @staticmethod
+    def __replaceFile(outputPath: str, data: bytes) -> None:
+        """
+        Method writes the bytes into a temporary file and renames it over the output path.
+        """
+        os.makedirs(os.path.dirname(outputPath), exist_ok=True)
+        temporaryPath = f"{outputPath}.{threading.get_ident()}.tmp"
+        with open(temporaryPath, mode="wb") as outputFile:
+            outputFile.write(data)
+        os.replace(temporaryPath, outputPath)
+        pass
+
+    def write(self, outputPath: str, data: bytes) -> None:
+        """
+        Method queues a rendered document, blocking while the queue is full.
+
+        Args:
+            > outputPath (str): destination of the document, its directory is created when missing
+            > data (bytes): document content
+        """
+        if self.__error is not None:
+            raise self.__error
+        self.__pending.put((outputPath, data))
+        pass
+
+    def close(self) -> None:
+        """
+        Method waits for every queued document to be written and stops the writer threads.
+
+        Raises:
+            Exception: first error raised while writing a document
+        """
+        for _ in self.__threads:
+            self.__pending.put(None)
+        for thread in self.__threads:
+            thread.join()
+        self.__threads = []
+        if self.__error is not None:
+            raise self.__error
+        pass
+
+    pass
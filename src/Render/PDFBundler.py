@@ -0,0 +1,192 @@
+# Python native libraries
+import os
+import re
+
+# Third party libraries
+import pymupdf  # PyMuPDF, the fitz module name is deprecated
+
+# Self build libraries
+from Func.PDF.PDFMerger import PDFMerger
+
+
+class PDFBundler:
+    """
+    Class bundles the PDF documents of a project renders: one packet per run merging every PDF of Renders/<run>/,
+    and one archive merging every run packet, written to the project Bundles directory and its Archive subdirectory, so no run packet takes the archive path.
+    The packets list their documents in the table of contents, the archive lists each run by its Key_Header with its documents below.
+    A packet is only merged again when its documents changed, the archive when any packet did.
+    The archive always holds the packet of every run directory in Key_Header order, the runs selection only limits which packets are merged again.
+    Args:
+        > projectPath (str): project directory holding the Renders directory
+        > runs (list, optional): key headers of the runs whose packets are merged again when outdated, the other runs keep their packet. Defaults to None (every run).
+        > flushPages (int, optional): pages merged in memory before they are flushed to the bundle file. Defaults to 500.
+        > keyHeaders (list, optional): key headers of the database in archive order, run directories not listed follow in natural name order. Defaults to None (natural name order, "Run 2" before "Run 10").
+    Attr:
+        > bundlesDirectory (str): directory of the bundles
+        > runBundles (dict[str, str]): key header -> path of the run packet
+        > archivePath (str | None): path of the project archive, None when there was nothing to bundle
+        > mergedBundles (list[str]): bundles merged by this call, up to date bundles are kept as they are
+    Raises:
+        > FileNotFoundError: Renders directory does not exist.
+    """
+
+    RENDERS_DIR = "Renders"
+    BUNDLES_DIR = "Bundles"
+    ARCHIVE_DIR = "Archive"
+
+    def __init__(
+        self,
+        projectPath: str,
+        runs: list = None,
+        flushPages: int = 500,
+        keyHeaders: list = None,
+    ) -> None:
+        """
+        Method bundles the run packets and the project archive.
+
+        Raises:
+            FileNotFoundError: Renders directory does not exist.
+        """
+        self.projectPath = projectPath
+        self.flushPages = flushPages
+        self.__rendersDirectory = os.path.join(projectPath, self.RENDERS_DIR)
+        if not os.path.isdir(self.__rendersDirectory):
+            raise FileNotFoundError("Renders directory does not exist.")
+        self.bundlesDirectory = os.path.join(projectPath, self.BUNDLES_DIR)
+
+        # Run directories are named after the key headers
+        runDirectories = sorted(
+            (
+                item
+                for item in os.listdir(self.__rendersDirectory)
+                if os.path.isdir(os.path.join(self.__rendersDirectory, item))
+            ),
+            key=self.__naturalKey,
+        )
+        keyHeaders = [str(run) for run in keyHeaders or list()]
+        self.__runs = [run for run in keyHeaders if run in runDirectories] + [
+            run for run in runDirectories if run not in keyHeaders
+        ]
+        self.__selectedRuns = None if runs is None else {str(run) for run in runs}
+        self.runBundles: dict[str, str] = dict()
+        self.archivePath: str | None = None
+        self.mergedBundles: list[str] = list()
+
+        self.__bundleRuns()
+        self.__bundleProject()
+        pass
+
+    @staticmethod
+    def __naturalKey(name: str) -> list:
+        """
+        Method sorts names with their numbers by value, e.g. "Run 2" before "Run 10".
+        """
+        return [
+            (0, int(part), "") if part.isdigit() else (1, 0, part)
+            for part in re.split(r"(\d+)", name)
+        ]
+
+    def __runDocuments(self, run: str) -> list[str]:
+        """
+        Method lists the PDF documents of a run, sorted by name.
+        """
+        runDirectory = os.path.join(self.__rendersDirectory, run)
+        if not os.path.isdir(runDirectory):
+            return list()
+        return [
+            os.path.join(runDirectory, item)
+            for item in sorted(os.listdir(runDirectory))
+            if item.lower().endswith(".pdf")
+        ]
+
+    @staticmethod
+    def __documentTitle(run: str, documentPath: str) -> str:
+        """
+        Method names a document in the table of contents after its template, e.g. "wordTemplate" for "Run 1_wordTemplate.pdf".
+        """
+        title = os.path.splitext(os.path.basename(documentPath))[0]
+        prefix = f"{run}_"
+        return title[len(prefix) :] if title.startswith(prefix) else title
+
+    @staticmethod
+    def __isUpToDate(
+        bundlePath: str, sourcePaths: list[str], titles: list[str]
+    ) -> bool:
+        """
+        Method tells whether a bundle is newer than its sources and still bookmarks the same titles.
+        """
+        if not os.path.exists(bundlePath):
+            return False
+        bundleTime = os.path.getmtime(bundlePath)
+        if any(os.path.getmtime(path) > bundleTime for path in sourcePaths):
+            return False
+        try:
+            with pymupdf.open(bundlePath) as bundle:
+                toc = bundle.get_toc(simple=True)
+        except Exception:
+            # An unreadable bundle is merged again
+            return False
+        return [title for level, title, _ in toc if level == 1] == titles
+
+    def __bundleRuns(self) -> None:
+        """
+        Method merges the documents of each run into its packet.
+        """
+        os.makedirs(self.bundlesDirectory, exist_ok=True)
+        for run in self.__runs:
+            documentPaths = self.__runDocuments(run)
+            if not documentPaths:
+                continue
+            bundlePath = os.path.join(self.bundlesDirectory, f"{run}.pdf")
+            self.runBundles[run] = bundlePath
+            # Runs outside the selection keep their packet, only a missing one is merged for the archive
+            if (
+                self.__selectedRuns is not None
+                and run not in self.__selectedRuns
+                and os.path.exists(bundlePath)
+            ):
+                continue
+            titles = [self.__documentTitle(run, path) for path in documentPaths]
+            if not self.__isUpToDate(bundlePath, documentPaths, titles):
+                self.__mergeRun(bundlePath, documentPaths, titles)
+        pass
+
+    def __mergeRun(
+        self, bundlePath: str, documentPaths: list[str], titles: list[str]
+    ) -> None:
+        """
+        Method merges the documents of a run, each one bookmarked by its template name.
+        """
+        with PDFMerger(outputPath=bundlePath, flushPages=self.flushPages) as merger:
+            for documentPath, title in zip(documentPaths, titles):
+                merger.append(documentPath, title=title)
+        self.mergedBundles.append(bundlePath)
+        pass
+
+    def __bundleProject(self) -> None:
+        """
+        Method merges the run packets into the project archive, each one bookmarked by its key header.
+        """
+        if not self.runBundles:
+            return
+        archiveDirectory = os.path.join(self.bundlesDirectory, self.ARCHIVE_DIR)
+        os.makedirs(archiveDirectory, exist_ok=True)
+        self.archivePath = os.path.join(
+            archiveDirectory,
+            f"{os.path.basename(os.path.normpath(self.projectPath))}.pdf",
+        )
+        if not self.mergedBundles and self.__isUpToDate(
+            self.archivePath, list(self.runBundles.values()), list(self.runBundles)
+        ):
+            return
+
+        # Run packets are streamed one after the other, the archive never fits in memory at once
+        with PDFMerger(
+            outputPath=self.archivePath, flushPages=self.flushPages
+        ) as merger:
+            for run, bundlePath in self.runBundles.items():
+                merger.append(bundlePath, title=run)
+        self.mergedBundles.append(self.archivePath)
+        pass
+
+    pass
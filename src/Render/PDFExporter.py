@@ -0,0 +1,697 @@
+# Python native libraries
+import json
+import os
+import pathlib
+import queue
+import shutil
+import signal
+import subprocess
+import tempfile
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Third party libraries
+from tqdm import tqdm
+
+# Self build libraries
+from Func.PDF.LazyPDF import LazyPDF
+
+
+class PDFExporter:
+    """
+    Class converts rendered Word documents into PDF files written next to them, through a pool of long-lived headless LibreOffice workers.
+    At most "workers" conversions run at once, each one is killed after "timeout" seconds and retried on a restarted worker.
+    Every converted PDF is opened to verify it holds pages before it is reported as exported.
+    Workers start on the first conversion and stay alive until close, the class can be used as a context manager.
+    Conversions go through the LibreOffice Python bridge (uno) of this interpreter, else through a helper script on an interpreter shipping it.
+    Without either one each conversion starts its own LibreOffice, which is much slower, so a RuntimeWarning is issued and the mode is reported.
+    Args:
+        > workers (int, optional): concurrent LibreOffice workers. Defaults to 2.
+        > timeout (float, optional): seconds a conversion may take before its worker is killed. Defaults to 120.
+        > retries (int, optional): new attempts of a failed conversion. Defaults to 1.
+        > sofficePath (str, optional): LibreOffice executable. Defaults to None (found on the PATH or the usual install directories).
+    Attr:
+        > sofficePath (str): LibreOffice executable
+        > mode (str): how the workers convert, "bridge", "helper" or "command", None until the first conversion
+    Meth:
+        > convert: converts documents into PDF next to them.
+        > exportRenders: converts the rendered Word documents whose PDF is missing or outdated.
+        > close: stops the workers.
+        > findSoffice: finds the LibreOffice executable.
+        > findUnoPython: finds an interpreter shipping the LibreOffice Python bridge.
+    Raises:
+        > ValueError: Workers should be a positive integer.
+        > ValueError: Retries should be a non negative integer.
+        > FileNotFoundError: LibreOffice executable not found.
+    """
+
+    # Usual LibreOffice executables when soffice is not on the PATH
+    SOFFICE_LOCATIONS = [
+        r"C:\Program Files\LibreOffice\program\soffice.exe",
+        r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+        "/Applications/LibreOffice.app/Contents/MacOS/soffice",
+        "/usr/lib/libreoffice/program/soffice",
+        "/opt/libreoffice/program/soffice",
+    ]
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 120,
+        retries: int = 1,
+        sofficePath: str = None,
+    ) -> None:
+        """
+        Method validates the options and finds LibreOffice, no worker is started yet.
+
+        Raises:
+            ValueError: Workers should be a positive integer.
+            ValueError: Retries should be a non negative integer.
+            FileNotFoundError: LibreOffice executable not found.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Workers should be a positive integer.")
+        if not isinstance(retries, int) or retries < 0:
+            raise ValueError("Retries should be a non negative integer.")
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.sofficePath = self.findSoffice() if sofficePath is None else sofficePath
+        if not os.path.exists(self.sofficePath):
+            raise FileNotFoundError(
+                f"LibreOffice executable not found: {self.sofficePath}"
+            )
+
+        self.mode = None
+
+        # Worker profiles live in a temporary directory removed on close
+        self.__profilesDirectory = None
+        self.__idleWorkers = None
+        self.__officeWorkers = list()
+        pass
+
+    @classmethod
+    def findSoffice(cls) -> str:
+        """
+        Method finds the LibreOffice executable on the PATH or in the usual install directories.
+
+        Returns:
+            str: path of the soffice executable
+
+        Raises:
+            FileNotFoundError: LibreOffice executable not found.
+        """
+        for name in ["soffice", "libreoffice"]:
+            sofficePath = shutil.which(name)
+            if sofficePath is not None:
+                return sofficePath
+        for sofficePath in cls.SOFFICE_LOCATIONS:
+            if os.path.exists(sofficePath):
+                return sofficePath
+        raise FileNotFoundError(
+            "LibreOffice executable not found, "
+            "install LibreOffice or give its soffice path."
+        )
+
+    @staticmethod
+    def findUnoPython(sofficePath: str) -> str:
+        """
+        Method finds an interpreter able to import the LibreOffice Python bridge, first the one bundled with LibreOffice then the system one.
+
+        Args:
+            > sofficePath (str): LibreOffice executable
+
+        Returns:
+            str | None: path of the interpreter, None when none ships the bridge
+        """
+        programDirectory = os.path.dirname(os.path.realpath(sofficePath))
+        candidates = [
+            os.path.join(programDirectory, "python.exe"),
+            os.path.join(programDirectory, "python"),
+            # macOS keeps the bundled interpreter next to the MacOS directory
+            os.path.join(os.path.dirname(programDirectory), "Resources", "python"),
+            shutil.which("python3"),
+            shutil.which("python"),
+        ]
+        checked = set()
+        for candidate in candidates:
+            if candidate is None or not os.path.isfile(candidate):
+                continue
+            candidate = os.path.realpath(candidate)
+            # This interpreter already failed to import uno
+            if candidate in checked or candidate == os.path.realpath(sys.executable):
+                continue
+            checked.add(candidate)
+            try:
+                process = subprocess.run(
+                    [candidate, "-c", "import uno"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=OfficeWorker.STARTUP_TIMEOUT,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+            if process.returncode == 0:
+                return candidate
+        return None
+
+    def __startPool(self) -> None:
+        """
+        Method builds the workers, each with its own LibreOffice profile so they run side by side.
+        """
+        unoPython = None
+        if not OfficeWorker.hasBridge() and os.path.exists(OfficeWorker.HELPER_PATH):
+            unoPython = self.findUnoPython(self.sofficePath)
+        self.__profilesDirectory = tempfile.mkdtemp(prefix="officesuite_pdf_")
+        self.__idleWorkers = queue.Queue()
+        for index in range(self.workers):
+            officeWorker = OfficeWorker(
+                sofficePath=self.sofficePath,
+                profileDirectory=os.path.join(
+                    self.__profilesDirectory, f"worker{index}"
+                ),
+                unoPython=unoPython,
+            )
+            self.__officeWorkers.append(officeWorker)
+            self.__idleWorkers.put(officeWorker)
+        self.mode = self.__officeWorkers[0].mode
+        if self.mode == "command":
+            warnings.warn(
+                "LibreOffice Python bridge (uno) not found, "
+                "each PDF conversion starts its own LibreOffice.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+        pass
+
+    def convert(self, documentPaths: list[str]) -> list[dict]:
+        """
+        Method converts the documents into PDF files with the same name next to them.
+
+        Args:
+            > documentPaths (list[str]): paths of the documents to convert
+
+        Returns:
+            list[dict]: result of each document, in the given order: {"document", "pdf", "status", "mode", "attempts", "pages", "seconds", "error"}
+        """
+        if not documentPaths:
+            return list()
+        if self.__idleWorkers is None:
+            self.__startPool()
+
+        results = dict()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self.__convertDocument, documentPath): documentPath
+                for documentPath in documentPaths
+            }
+            with tqdm(
+                total=len(futures), desc="Exporting PDF", unit="document"
+            ) as progressBar:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    progressBar.update(1)
+        return [results[documentPath] for documentPath in documentPaths]
+
+    def __convertDocument(self, documentPath: str) -> dict:
+        """
+        Method converts one document on the first idle worker, retrying failures on a restarted worker.
+        """
+        pdfPath = f"{os.path.splitext(documentPath)[0]}.pdf"
+        result = {
+            "document": documentPath,
+            "pdf": pdfPath,
+            "status": "error",
+            "mode": self.mode,
+            "attempts": 0,
+            "pages": None,
+            "seconds": 0.0,
+            "error": None,
+        }
+        start = time.perf_counter()
+        for attempt in range(1, self.retries + 2):
+            result["attempts"] = attempt
+            officeWorker = self.__idleWorkers.get()
+            try:
+                officeWorker.convert(
+                    documentPath=documentPath, pdfPath=pdfPath, timeout=self.timeout
+                )
+                with LazyPDF(pdfPath) as pdf:
+                    pages = pdf.pageCount
+                if pages < 1:
+                    raise ValueError(f"Converted PDF has no pages: {pdfPath}")
+                result.update({"status": "success", "pages": pages, "error": None})
+                break
+            except Exception as error:
+                # The worker may be stuck or dead, it starts again on its next document
+                officeWorker.stop()
+                result["error"] = f"{type(error).__name__}: {error}"
+            finally:
+                self.__idleWorkers.put(officeWorker)
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    def exportRenders(
+        self, rendersDirectory: str, runs: list = None, force: bool = False
+    ) -> list[dict]:
+        """
+        Method converts the Word documents of a renders directory (Renders/<run>/*.docx) whose PDF is missing or older than the document.
+
+        Args:
+            > rendersDirectory (str): renders directory of a project
+            > runs (list, optional): key headers of the runs to export. Defaults to None (every run).
+            > force (bool, optional): converts up to date documents as well. Defaults to False.
+
+        Returns:
+            list[dict]: result of each converted document, see convert
+        """
+        # Run directories are named after the key headers
+        runs = None if runs is None else {str(run) for run in runs}
+        documentPaths = list()
+        if not os.path.isdir(rendersDirectory):
+            return self.convert(documentPaths)
+        for run in sorted(os.listdir(rendersDirectory)):
+            runDirectory = os.path.join(rendersDirectory, run)
+            if not os.path.isdir(runDirectory) or (runs is not None and run not in runs):
+                continue
+            for item in sorted(os.listdir(runDirectory)):
+                # Word lock files start with ~$
+                if not item.endswith(".docx") or item.startswith("~$"):
+                    continue
+                documentPath = os.path.join(runDirectory, item)
+                pdfPath = f"{os.path.splitext(documentPath)[0]}.pdf"
+                if (
+                    force
+                    or not os.path.exists(pdfPath)
+                    or os.path.getmtime(pdfPath) < os.path.getmtime(documentPath)
+                ):
+                    documentPaths.append(documentPath)
+        return self.convert(documentPaths)
+
+    def close(self) -> None:
+        """
+        Method stops the workers and removes their profiles.
+        """
+        for officeWorker in self.__officeWorkers:
+            officeWorker.stop()
+        self.__officeWorkers = list()
+        self.__idleWorkers = None
+        if self.__profilesDirectory is not None:
+            shutil.rmtree(self.__profilesDirectory, ignore_errors=True)
+            self.__profilesDirectory = None
+        pass
+
+    def __enter__(self) -> "PDFExporter":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+        pass
+
+    pass
+
+
+class OfficeWorker:
+    """
+    Class keeps one headless LibreOffice process alive and converts documents through it.
+    The process listens on a pipe and every conversion reuses it, through the LibreOffice Python bridge (uno) of this interpreter ("bridge" mode)
+    or through OfficeBridgeHelper running on an interpreter shipping it ("helper" mode).
+    Without either one each conversion runs "soffice --convert-to" on the worker profile, which is only initialized on the first one ("command" mode).
+    Args:
+        > sofficePath (str): LibreOffice executable
+        > profileDirectory (str): LibreOffice user profile of the worker, concurrent processes need their own
+        > unoPython (str, optional): interpreter shipping uno running the helper when this one does not. Defaults to None.
+    Attr:
+        > mode (str): how documents are converted, "bridge", "helper" or "command"
+    Meth:
+        > convert: converts a document into PDF.
+        > stop: kills the LibreOffice process, the next conversion starts it again.
+        > hasBridge: tells whether this interpreter ships uno.
+    Raises:
+        > RuntimeError: LibreOffice could not be started.
+        > TimeoutError: Conversion timed out.
+    """
+
+    # Seconds LibreOffice may take to accept connections
+    STARTUP_TIMEOUT = 60
+    # Script converting through uno on another interpreter
+    HELPER_PATH = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "OfficeBridgeHelper.py"
+    )
+
+    def __init__(
+        self, sofficePath: str, profileDirectory: str, unoPython: str = None
+    ) -> None:
+        self.sofficePath = sofficePath
+        self.profileDirectory = profileDirectory
+        self.__profileUrl = pathlib.Path(os.path.abspath(profileDirectory)).as_uri()
+        self.__pipeName = f"officesuite_{os.getpid()}_{id(self)}"
+        self.__process = None
+        self.__helper = None
+        self.__desktop = None
+        self.__timedOut = False
+        self.__uno = self.__importUno()
+        self.unoPython = unoPython
+        if self.__uno is not None:
+            self.mode = "bridge"
+        elif unoPython is not None:
+            self.mode = "helper"
+        else:
+            self.mode = "command"
+        pass
+
+    @classmethod
+    def hasBridge(cls) -> bool:
+        """
+        Method tells whether this interpreter ships the LibreOffice Python bridge.
+        """
+        return cls.__importUno() is not None
+
+    @staticmethod
+    def __importUno() -> any:
+        """
+        Method imports the LibreOffice Python bridge, None when this interpreter does not ship it.
+        """
+        try:
+            import uno
+        except ImportError:
+            return None
+        return uno
+
+    def __command(self, *arguments: str) -> list[str]:
+        """
+        Method builds a LibreOffice command line running on the worker profile.
+        """
+        return [
+            self.sofficePath,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--nodefault",
+            "--norestore",
+            "--nolockcheck",
+            f"-env:UserInstallation={self.__profileUrl}",
+            *arguments,
+        ]
+
+    @staticmethod
+    def __popen(command: list[str], captureErrors: bool) -> subprocess.Popen:
+        """
+        Method starts a LibreOffice process in its own process group, so a kill also reaches the soffice.bin child.
+        Only short-lived processes capture their errors, a long-lived one would block on a full pipe.
+        """
+        errors = subprocess.PIPE if captureErrors else subprocess.DEVNULL
+        if os.name == "posix":
+            return subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=errors,
+                start_new_session=True,
+            )
+        return subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=errors,
+            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
+        )
+
+    @staticmethod
+    def __kill(process: subprocess.Popen) -> None:
+        """
+        Method kills a LibreOffice process and its children, then closes its pipes.
+        """
+        if process.poll() is None:
+            try:
+                if os.name == "posix":
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except OSError:
+                pass
+        # Waits for the process and closes the captured errors pipe
+        process.communicate()
+        pass
+
+    def convert(self, documentPath: str, pdfPath: str, timeout: float) -> None:
+        """
+        Method converts a document into PDF, the PDF file only appears once it is complete.
+
+        Args:
+            > documentPath (str): path of the document
+            > pdfPath (str): path of the PDF file
+            > timeout (float): seconds before the conversion is killed
+
+        Raises:
+            RuntimeError: LibreOffice could not be started or did not convert the document.
+            TimeoutError: Conversion timed out.
+        """
+        temporaryPath = f"{pdfPath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            if self.mode == "bridge":
+                self.__convertWithBridge(documentPath, temporaryPath, timeout)
+            elif self.mode == "helper":
+                self.__convertWithHelper(documentPath, temporaryPath, timeout)
+            else:
+                self.__convertWithCommand(documentPath, temporaryPath, timeout)
+            os.replace(temporaryPath, pdfPath)
+        finally:
+            if os.path.exists(temporaryPath):
+                os.remove(temporaryPath)
+        pass
+
+    def __convertWithCommand(
+        self, documentPath: str, pdfPath: str, timeout: float
+    ) -> None:
+        """
+        Method converts the document with one "soffice --convert-to" call on the worker profile.
+        """
+        os.makedirs(self.profileDirectory, exist_ok=True)
+        outputDirectory = tempfile.mkdtemp(dir=self.profileDirectory)
+        try:
+            process = self.__popen(
+                self.__command(
+                    "--convert-to",
+                    "pdf:writer_pdf_Export",
+                    "--outdir",
+                    outputDirectory,
+                    os.path.abspath(documentPath),
+                ),
+                captureErrors=True,
+            )
+            try:
+                _, errors = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                self.__kill(process)
+                raise TimeoutError(
+                    f"Conversion timed out after {timeout} seconds: {documentPath}"
+                )
+            convertedPath = os.path.join(
+                outputDirectory,
+                f"{os.path.splitext(os.path.basename(documentPath))[0]}.pdf",
+            )
+            if not os.path.exists(convertedPath):
+                message = errors.decode(errors="replace").strip()
+                raise RuntimeError(
+                    f"LibreOffice did not convert {documentPath}: {message}"
+                )
+            shutil.move(convertedPath, pdfPath)
+        finally:
+            shutil.rmtree(outputDirectory, ignore_errors=True)
+        pass
+
+    def __listen(self) -> None:
+        """
+        Method starts LibreOffice listening on the worker pipe.
+        """
+        self.__process = self.__popen(
+            self.__command(
+                f"--accept=pipe,name={self.__pipeName};urp;StarOffice.ComponentContext"
+            ),
+            captureErrors=False,
+        )
+        pass
+
+    def __start(self) -> None:
+        """
+        Method starts LibreOffice listening on the worker pipe and connects to it.
+
+        Raises:
+            RuntimeError: LibreOffice could not be started.
+        """
+        uno = self.__uno
+        self.__listen()
+        localContext = uno.getComponentContext()
+        resolver = localContext.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", localContext
+        )
+        deadline = time.monotonic() + self.STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:pipe,name={self.__pipeName};urp;StarOffice.ComponentContext"
+                )
+                break
+            except Exception:
+                # The pipe is not accepting connections yet
+                if self.__process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("LibreOffice could not be started.")
+                time.sleep(0.25)
+        self.__desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        pass
+
+    def __properties(self, **values: any) -> tuple:
+        """
+        Method builds the UNO property values of a load or store call.
+        """
+        properties = list()
+        for name, value in values.items():
+            propertyValue = self.__uno.createUnoStruct(
+                "com.sun.star.beans.PropertyValue"
+            )
+            propertyValue.Name = name
+            propertyValue.Value = value
+            properties.append(propertyValue)
+        return tuple(properties)
+
+    def __startHelper(self) -> None:
+        """
+        Method starts LibreOffice listening on the worker pipe and the helper connected to it.
+
+        Raises:
+            RuntimeError: LibreOffice could not be started.
+        """
+        self.__listen()
+        self.__helper = subprocess.Popen(
+            [
+                self.unoPython,
+                self.HELPER_PATH,
+                self.__pipeName,
+                str(self.STARTUP_TIMEOUT),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+        )
+        try:
+            ready = json.loads(self.__helper.stdout.readline())
+        except ValueError:
+            ready = {"ready": False, "error": "helper stopped"}
+        if not ready.get("ready"):
+            self.stop()
+            raise RuntimeError(
+                f"LibreOffice could not be started: {ready.get('error')}"
+            )
+        pass
+
+    def __timeout(self) -> None:
+        """
+        Method kills a conversion running over its timeout, the blocked bridge call then fails.
+        """
+        self.__timedOut = True
+        if self.__process is not None:
+            self.__kill(self.__process)
+        if self.__helper is not None:
+            self.__helper.kill()
+        pass
+
+    def __convertWithBridge(
+        self, documentPath: str, pdfPath: str, timeout: float
+    ) -> None:
+        """
+        Method loads the document in the running LibreOffice and stores it with the PDF export filter.
+        """
+        if self.__desktop is None:
+            self.__start()
+        uno = self.__uno
+        self.__timedOut = False
+        watchdog = threading.Timer(timeout, self.__timeout)
+        watchdog.start()
+        try:
+            document = self.__desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(os.path.abspath(documentPath)),
+                "_blank",
+                0,
+                self.__properties(Hidden=True, ReadOnly=True),
+            )
+            if document is None:
+                raise RuntimeError(f"LibreOffice could not open {documentPath}")
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(os.path.abspath(pdfPath)),
+                    self.__properties(FilterName="writer_pdf_Export"),
+                )
+            finally:
+                document.close(True)
+        except Exception:
+            if self.__timedOut:
+                raise TimeoutError(
+                    f"Conversion timed out after {timeout} seconds: {documentPath}"
+                )
+            raise
+        finally:
+            watchdog.cancel()
+            # A killed process is started again on the next document
+            if self.__timedOut:
+                self.stop()
+        pass
+
+    def __convertWithHelper(
+        self, documentPath: str, pdfPath: str, timeout: float
+    ) -> None:
+        """
+        Method sends the document to the helper, which converts it like __convertWithBridge.
+        """
+        if self.__helper is None:
+            self.__startHelper()
+        self.__timedOut = False
+        watchdog = threading.Timer(timeout, self.__timeout)
+        watchdog.start()
+        try:
+            request = {
+                "document": os.path.abspath(documentPath),
+                "pdf": os.path.abspath(pdfPath),
+            }
+            self.__helper.stdin.write(json.dumps(request) + "\n")
+            self.__helper.stdin.flush()
+            response = json.loads(self.__helper.stdout.readline() or "null")
+        except (OSError, ValueError):
+            response = None
+        finally:
+            watchdog.cancel()
+        if self.__timedOut:
+            # A killed process is started again on the next document
+            self.stop()
+            raise TimeoutError(
+                f"Conversion timed out after {timeout} seconds: {documentPath}"
+            )
+        if response is None:
+            self.stop()
+            raise RuntimeError(f"LibreOffice bridge helper stopped: {documentPath}")
+        if response["error"] is not None:
+            raise RuntimeError(
+                f"LibreOffice did not convert {documentPath}: {response['error']}"
+            )
+        pass
+
+    def stop(self) -> None:
+        """
+        Method kills the LibreOffice process, the next conversion starts it again.
+        """
+        if self.__helper is not None:
+            self.__helper.kill()
+            self.__helper.communicate()
+            self.__helper = None
+        if self.__process is not None:
+            self.__kill(self.__process)
+            self.__process = None
+        self.__desktop = None
+        pass
+
+    pass
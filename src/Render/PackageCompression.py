@@ -0,0 +1,110 @@
+# Python native libraries
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+# Third party libraries
+
+# Self build libraries
+
+
+class PackageCompression:
+    """
+    Class holds the zip compression used to write rendered docx and xlsx packages.
+    Levels trade output size for save time: "store" skips compression for batches post-processed later, "fast" suits bulk runs and "max" archival.
+    Args:
+        > level (str, optional): one of PackageCompression.LEVELS. Defaults to "default" (libraries' own settings).
+    Attr:
+        > level (str): selected compression level
+        > compressType (int): zipfile compression method
+        > compressLevel (int | None): deflate level, None for the zlib default
+    Meth:
+        > openPackage: opens a zip package for writing with the selected compression.
+        > writeDocument: writes a python-docx package with the selected compression.
+    Raises:
+        > ValueError: Compression level should be one of: store, fast, default, max.
+    """
+
+    CONTENT_TYPES_NAMESPACE = (
+        "http://schemas.openxmlformats.org/package/2006/content-types"
+    )
+    RELATIONSHIPS_TYPE = "application/vnd.openxmlformats-package.relationships+xml"
+
+    # Level -> (zip compression method, deflate level)
+    LEVELS = {
+        "store": (zipfile.ZIP_STORED, None),
+        "fast": (zipfile.ZIP_DEFLATED, 1),
+        "default": (zipfile.ZIP_DEFLATED, None),
+        "max": (zipfile.ZIP_DEFLATED, 9),
+    }
+
+    def __init__(self, level: str = "default") -> None:
+        """
+        Method validates the compression level.
+
+        Args:
+            > level (str, optional): one of PackageCompression.LEVELS. Defaults to "default" (libraries' own settings).
+
+        Raises:
+            ValueError: Compression level should be one of: store, fast, default, max.
+        """
+        if level not in self.LEVELS:
+            raise ValueError(
+                f"Compression level should be one of: {', '.join(self.LEVELS)}."
+            )
+        self.level = level
+        self.compressType, self.compressLevel = self.LEVELS[level]
+        pass
+
+    def openPackage(self, filename: any) -> zipfile.ZipFile:
+        """
+        Method opens a zip package for writing with the selected compression.
+
+        Args:
+            > filename (any): output path or binary stream
+
+        Returns:
+            zipfile.ZipFile: package open in write mode
+        """
+        return zipfile.ZipFile(
+            filename,
+            mode="w",
+            compression=self.compressType,
+            compresslevel=self.compressLevel,
+        )
+
+    def writeDocument(self, package: any, filename: any) -> None:
+        """
+        Method writes a python-docx package with the selected compression, through the public package API only.
+        Every part gets an override content type, as valid in OPC as python-docx's defaults by extension.
+
+        Args:
+            > package (any): python-docx OPC package, e.g. document.part.package
+            > filename (any): output path or binary stream
+        """
+        parts = list(package.iter_parts())
+        for part in parts:
+            part.before_marshal()
+
+        contentTypes = [
+            "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n",
+            f'<Types xmlns="{self.CONTENT_TYPES_NAMESPACE}">',
+            f'<Default Extension="rels" ContentType="{self.RELATIONSHIPS_TYPE}"/>',
+            '<Default Extension="xml" ContentType="application/xml"/>',
+        ]
+        for part in parts:
+            contentTypes.append(
+                f"<Override PartName={quoteattr(str(part.partname))} "
+                f"ContentType={quoteattr(part.content_type)}/>"
+            )
+        contentTypes.append("</Types>")
+
+        with self.openPackage(filename) as document:
+            document.writestr("[Content_Types].xml", "".join(contentTypes))
+            document.writestr("_rels/.rels", package.rels.xml)
+            for part in parts:
+                document.writestr(part.partname.membername, part.blob)
+                if len(part.rels):
+                    document.writestr(part.partname.rels_uri.membername, part.rels.xml)
+        pass
+
+    pass
@@ -0,0 +1,233 @@
+# Python native libraries
+import os
+
+# Third party libraries
+
+# Self build libraries
+from Render.DatabaseSnapshot import DatabaseSnapshot
+
+
+class ProjectContext:
+    """
+    Class reads a project database once and shares its parsed sheets between the renderers.
+    The database is opened in read-only values mode and each sheet is only parsed the first time it is requested.
+    Databases are an excel workbook, a SQLite file or a directory of CSV or Parquet files, all holding the same sheets.
+    Parsed sheets and transformed contexts are kept in a snapshot next to the database, an unchanged database is never parsed twice.
+    Contexts of a run selection are only kept in memory, so the snapshot does not grow with every selection rendered.
+    Args:
+        > databasePath (str): path of the database information
+        > snapshot (bool, optional): loads and saves the database snapshot. Defaults to True.
+    Attr:
+        > databasePath (str): path of the database information
+        > databaseFormat (str): one of ProjectContext.DATABASE_FORMATS
+        > sheets (list[str]): list of sheets contained in the database
+        > snapshotLoaded (bool): the sheets were loaded from the snapshot
+    Meth:
+        > getSheetMatrix: returns the matrix of a sheet.
+        > getContext: returns a context transformed from the sheets, building it once.
+        > close: closes the database file and saves the snapshot.
+        > detectFormat: tells the format of a database path.
+        > findDatabase: finds the database of a project database directory.
+        > databaseReader: imports the reader class of a database format.
+    Raises:
+        > FileNotFoundError: Database path does not exist.
+        > ImportError: Parquet databases require pyarrow.
+    """
+
+    # Database format -> database name inside the project database directory
+    DATABASE_FORMATS = {
+        "xlsx": "database.xlsx",
+        "sqlite": "database.sqlite",
+        "csv": "database_csv",
+        "parquet": "database_parquet",
+    }
+
+    def __init__(self, databasePath: str, snapshot: bool = True) -> None:
+        """
+        Method reads the database content.
+
+        Args:
+            > databasePath (str): path of the database information
+            > snapshot (bool, optional): loads and saves the database snapshot. Defaults to True.
+
+        Raises:
+            FileNotFoundError: Database path does not exist.
+            ImportError: Parquet databases require pyarrow.
+        """
+        self.databasePath = databasePath
+
+        # We validate before a reader builds an empty database in place of a missing one
+        if not os.path.exists(self.databasePath):
+            raise FileNotFoundError("Database path does not exist.")
+        self.databaseFormat = self.detectFormat(self.databasePath)
+        self.__snapshot = DatabaseSnapshot(self.databasePath) if snapshot else None
+
+        self.__readDatabase()
+        pass
+
+    def __readDatabase(self) -> None:
+        """
+        Method loads the database snapshot or opens the database, sheets are parsed later on demand.
+        """
+        # Parsed sheets by name, filled by getSheetMatrix
+        self.__sheetMatrices = dict()
+
+        # Transformed contexts by key, filled by getContext, the transient ones are left out of the snapshot
+        self.__contexts = dict()
+        self.__transientContexts = dict()
+
+        # Opened on the first sheet missing from the snapshot
+        self.__database = None
+
+        content = None if self.__snapshot is None else self.__snapshot.load()
+        self.snapshotLoaded = content is not None
+        if self.snapshotLoaded:
+            self.sheets = content["sheets"]
+            self.__sheetMatrices = content["matrices"]
+            self.__contexts = content["contexts"]
+        else:
+            self.__openDatabase()
+            self.sheets = self.__database.sheets
+
+        # Whether the snapshot should be saved on close
+        self.__outdated = not self.snapshotLoaded or self.__snapshot.matchedByHash
+        pass
+
+    def __openDatabase(self) -> None:
+        """
+        Method opens the database with the reader of its format.
+        """
+        reader = self.databaseReader(self.databaseFormat)
+        if self.databaseFormat == "xlsx":
+            self.__database = reader(self.databasePath, readOnly=True)
+        else:
+            self.__database = reader(self.databasePath)
+        pass
+
+    def getSheetMatrix(self, sheetName: str) -> list[list[any]] | None:
+        """
+        Method returns the 2D matrix (row, column) of the given sheet, parsing it the first time it is requested.
+
+        Args:
+            > sheetName (str): name of the sheet, e.g. "Word Data"
+
+        Returns:
+            list[list[any]] | None: sheet matrix, None if the sheet does not exist
+        """
+        if sheetName not in self.sheets:
+            return None
+        if sheetName not in self.__sheetMatrices:
+            if self.__database is None:
+                self.__openDatabase()
+            self.__sheetMatrices[sheetName] = self.__database.readSheet(sheetName)
+            self.__outdated = True
+        return self.__sheetMatrices[sheetName]
+
+    def getContext(self, key: tuple, builder: callable, snapshot: bool = True) -> any:
+        """
+        Method returns a context transformed from the database sheets, building it the first time it is requested.
+        Built contexts are saved in the snapshot, so the key should hold everything the context depends on besides the database.
+
+        Args:
+            > key (tuple): picklable context identifier, e.g. ("wordContext", selected runs)
+            > builder (callable): builds the context from the database sheets
+            > snapshot (bool, optional): saves the context in the snapshot, False for the contexts of a run selection. Defaults to True.
+
+        Returns:
+            any: transformed context
+        """
+        contexts = self.__contexts if snapshot else self.__transientContexts
+        if key not in contexts:
+            contexts[key] = builder()
+            self.__outdated = self.__outdated or snapshot
+        return contexts[key]
+
+    def close(self) -> None:
+        """
+        Method closes the database file and saves the snapshot when new sheets or contexts were built, already parsed sheets remain available.
+        """
+        if self.__database is not None:
+            self.__database.close()
+            self.__database = None
+        if self.__snapshot is not None and self.__outdated:
+            self.__snapshot.save(
+                sheets=self.sheets,
+                matrices=self.__sheetMatrices,
+                contexts=self.__contexts,
+            )
+            self.__outdated = False
+        pass
+
+    @staticmethod
+    def detectFormat(databasePath: str) -> str:
+        """
+        Method tells the format of a database path: SQLite files end in .sqlite or .db, directories hold CSV or Parquet files.
+
+        Args:
+            > databasePath (str): path of the database information
+
+        Returns:
+            str: one of ProjectContext.DATABASE_FORMATS
+        """
+        if os.path.isdir(databasePath):
+            if any(item.endswith(".parquet") for item in os.listdir(databasePath)):
+                return "parquet"
+            return "csv"
+        if databasePath.lower().endswith((".sqlite", ".sqlite3", ".db")):
+            return "sqlite"
+        return "xlsx"
+
+    @classmethod
+    def findDatabase(cls, databaseDirectory: str) -> str:
+        """
+        Method finds the database of a project database directory, trying the formats in DATABASE_FORMATS order.
+
+        Args:
+            > databaseDirectory (str): project database directory
+
+        Returns:
+            str: path of the database information
+
+        Raises:
+            FileNotFoundError: Database path does not exist.
+        """
+        for databaseName in cls.DATABASE_FORMATS.values():
+            databasePath = os.path.join(databaseDirectory, databaseName)
+            if os.path.exists(databasePath):
+                return databasePath
+        raise FileNotFoundError("Database path does not exist.")
+
+    @staticmethod
+    def databaseReader(databaseFormat: str) -> type:
+        """
+        Method imports the reader class of a database format, e.g. Excel for "xlsx".
+        Readers are imported on first use, a snapshot hit never loads openpyxl.
+
+        Args:
+            > databaseFormat (str): one of ProjectContext.DATABASE_FORMATS
+
+        Returns:
+            type: reader class, built with the database path
+
+        Raises:
+            KeyError: Unknown database format.
+        """
+        if databaseFormat == "xlsx":
+            from Func.Excel.Excel import Excel
+
+            return Excel
+        if databaseFormat == "sqlite":
+            from Func.SQLite.SQLite import SQLite
+
+            return SQLite
+        if databaseFormat == "csv":
+            from Func.CSV.CSV import CSV
+
+            return CSV
+        if databaseFormat == "parquet":
+            from Func.Parquet.Parquet import Parquet
+
+            return Parquet
+        raise KeyError(f"Unknown database format: {databaseFormat}")
+
+    pass
@@ -0,0 +1,327 @@
+# Python native libraries
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Third party libraries
+
+# Self build libraries
+
+
+class RenderIndex:
+    """
+    Class keeps a persistent full-text index (SQLite FTS5) of the rendered documents and the templates of a project, to find which documents mention a value.
+    Text is extracted with the Func document classes: Word paragraphs and tables, PDF pages and Excel cell values.
+    Updates are incremental, only documents whose size or modification time changed are extracted again, optionally across worker processes.
+    Args:
+        > projectPath (str): project directory holding the Renders and Templates directories
+    Attr:
+        > projectPath (str): project directory
+        > indexPath (str): path of the SQLite index file
+    Meth:
+        > update: indexes the new and changed documents and forgets the removed ones.
+        > search: returns the documents matching a full-text query, best first.
+        > quote: turns plain text into a query matching all its words.
+        > close: closes the index file.
+    Raises:
+        > FileNotFoundError: Project directory does not exist.
+    """
+
+    INDEX_FILE_NAME = ".renderIndex.sqlite"
+
+    # Indexed directories of the project, rendered documents are grouped by run
+    RENDERS_DIR = "Renders"
+    TEMPLATE_DIR = "Templates"
+
+    EXTENSIONS = (".docx", ".pdf", ".xlsx")
+
+    # Documents extracted between two index commits
+    BATCH_DOCUMENTS = 200
+
+    def __init__(self, projectPath: str) -> None:
+        """
+        Method opens the index of the project, creating it the first time.
+
+        Raises:
+            FileNotFoundError: Project directory does not exist.
+        """
+        if not os.path.isdir(projectPath):
+            raise FileNotFoundError(
+                f"Project directory does not exist: {projectPath}"
+            )
+        self.projectPath = projectPath
+        self.indexPath = os.path.join(projectPath, self.INDEX_FILE_NAME)
+        self.__connection = sqlite3.connect(self.indexPath)
+        self.__createSchema()
+        pass
+
+    def __createSchema(self) -> None:
+        """
+        Method creates the document and full-text tables when missing.
+        """
+        self.__connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                run TEXT,
+                size INTEGER NOT NULL,
+                mtime INTEGER NOT NULL,
+                error TEXT
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS documentText USING fts5(
+                text, tokenize = 'unicode61 remove_diacritics 2'
+            );
+            """
+        )
+        pass
+
+    def __walkDocuments(self) -> dict[str, tuple]:
+        """
+        Method lists the indexable documents of the project.
+
+        Returns:
+            dict[str, tuple]: relative path -> (run, size, modification time)
+        """
+        documents = dict()
+        for directoryName in [self.RENDERS_DIR, self.TEMPLATE_DIR]:
+            pending = [os.path.join(self.projectPath, directoryName)]
+            while pending:
+                directory = pending.pop()
+                if not os.path.isdir(directory):
+                    continue
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        # Hidden files and Office lock files are skipped
+                        if entry.name.startswith((".", "~$")):
+                            continue
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                        elif entry.name.lower().endswith(self.EXTENSIONS):
+                            relativePath = os.path.relpath(
+                                entry.path, self.projectPath
+                            )
+                            # Renders/<run>/<document>
+                            parts = relativePath.split(os.sep)
+                            isRender = directoryName == self.RENDERS_DIR
+                            run = parts[1] if isRender and len(parts) > 2 else None
+                            status = entry.stat()
+                            documents[relativePath] = (
+                                run,
+                                status.st_size,
+                                status.st_mtime_ns,
+                            )
+        return documents
+
+    def update(self, workers: int = 1, rebuild: bool = False) -> dict:
+        """
+        Method indexes the new and changed documents and forgets the removed ones.
+
+        Args:
+            > workers (int, optional): text extraction processes. Defaults to 1 (serial).
+            > rebuild (bool, optional): extracts every document again. Defaults to False.
+
+        Returns:
+            dict: {"indexed", "unchanged", "removed", "failed", "documents", "seconds"}, failed lists the documents that could not be read
+
+        Raises:
+            ValueError: Workers should be a positive integer.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Workers should be a positive integer.")
+        start = time.perf_counter()
+        connection = self.__connection
+        if rebuild:
+            with connection:
+                connection.execute("DELETE FROM documents")
+                connection.execute("DELETE FROM documentText")
+
+        indexed = {
+            path: (documentId, size, mtime)
+            for documentId, path, size, mtime in connection.execute(
+                "SELECT id, path, size, mtime FROM documents"
+            )
+        }
+        documents = self.__walkDocuments()
+
+        removedIds = [
+            (indexed[path][0],) for path in indexed.keys() - documents.keys()
+        ]
+        with connection:
+            connection.executemany("DELETE FROM documents WHERE id = ?", removedIds)
+            connection.executemany(
+                "DELETE FROM documentText WHERE rowid = ?", removedIds
+            )
+
+        changedPaths = sorted(
+            path
+            for path, (run, size, mtime) in documents.items()
+            if indexed.get(path, (None, None, None))[1:] != (size, mtime)
+        )
+        failed = list()
+        # Serial path, we avoid the process pool overhead
+        executor = None if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+        try:
+            for index in range(0, len(changedPaths), self.BATCH_DOCUMENTS):
+                batch = changedPaths[index : index + self.BATCH_DOCUMENTS]
+                filePaths = [os.path.join(self.projectPath, path) for path in batch]
+                if executor is None:
+                    extractions = map(self._extractText, filePaths)
+                else:
+                    extractions = executor.map(
+                        self._extractText,
+                        filePaths,
+                        chunksize=max(1, len(filePaths) // (workers * 4)),
+                    )
+                # Each batch is committed, an interrupted update keeps its progress
+                with connection:
+                    for path, (text, error) in zip(batch, extractions):
+                        self.__store(path, documents[path], text, error)
+                        if error is not None:
+                            failed.append({"path": path, "error": error})
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return {
+            "indexed": len(changedPaths) - len(failed),
+            "unchanged": len(documents) - len(changedPaths),
+            "removed": len(removedIds),
+            "failed": failed,
+            "documents": len(documents),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def __store(self, path: str, document: tuple, text: str, error: str) -> None:
+        """
+        Method replaces the index entry of a document, an unreadable document is kept without text until it changes.
+        """
+        run, size, mtime = document
+        connection = self.__connection
+        row = connection.execute(
+            "SELECT id FROM documents WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None:
+            connection.execute("DELETE FROM documentText WHERE rowid = ?", row)
+            connection.execute("DELETE FROM documents WHERE id = ?", row)
+        documentId = connection.execute(
+            "INSERT INTO documents (path, run, size, mtime, error) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (path, run, size, mtime, error),
+        ).lastrowid
+        if error is None:
+            connection.execute(
+                "INSERT INTO documentText (rowid, text) VALUES (?, ?)",
+                (documentId, text),
+            )
+        pass
+
+    @staticmethod
+    def _extractText(filePath: str) -> tuple[str | None, str | None]:
+        """
+        Worker extracts the text of a document with its Func class.
+        Static so it can be sent to worker processes, document classes are imported in the worker that needs them.
+
+        Returns:
+            tuple[str | None, str | None]: text and None, or None and the error when the document could not be read
+        """
+        try:
+            extension = os.path.splitext(filePath)[1].lower()
+            if extension == ".docx":
+                from Func.Word.Word import Word
+
+                word = Word(filePath, fast=True)
+                lines = list(word.paragraphsContent)
+                for table in word.tablesContent:
+                    lines.extend("\t".join(row) for row in table)
+            elif extension == ".pdf":
+                from Func.PDF.LazyPDF import LazyPDF
+
+                with LazyPDF(filePath, cachedPages=0) as pdf:
+                    lines = list(pdf)
+            else:
+                from Func.Excel.Excel import Excel
+
+                excel = Excel(filePath, readOnly=True)
+                try:
+                    lines = [
+                        "\t".join("" if value is None else str(value) for value in row)
+                        for sheetName in excel.sheets
+                        for row in excel.iterSheetRows(sheetName)
+                    ]
+                finally:
+                    excel.close()
+            return "\n".join(line for line in lines if line), None
+        except Exception as error:
+            return None, f"{type(error).__name__}: {error}"
+
+    def search(self, query: str, limit: int = 20, run: str = None) -> list[dict]:
+        """
+        Method returns the documents matching a full-text query, best ranked first.
+
+        Args:
+            > query (str): FTS5 query, e.g. '"ACME Corp" AND invoice', see quote for plain text
+            > limit (int, optional): maximum number of results. Defaults to 20.
+            > run (str, optional): only returns the documents of this run. Defaults to None (every document).
+
+        Returns:
+            list[dict]: {"path", "run", "snippet", "rank"} of each matching document
+
+        Raises:
+            ValueError: Search query should not be empty.
+            ValueError: Invalid full-text query.
+        """
+        if not query.strip():
+            raise ValueError("Search query should not be empty.")
+        sql = (
+            "SELECT documents.path, documents.run, "
+            "snippet(documentText, 0, '[', ']', '...', 12), documentText.rank "
+            "FROM documentText JOIN documents ON documents.id = documentText.rowid "
+            "WHERE documentText MATCH ?"
+        )
+        parameters = [query]
+        if run is not None:
+            sql += " AND documents.run = ?"
+            parameters.append(str(run))
+        sql += " ORDER BY documentText.rank LIMIT ?"
+        parameters.append(limit)
+        try:
+            rows = self.__connection.execute(sql, parameters).fetchall()
+        except sqlite3.OperationalError as error:
+            raise ValueError(f"Invalid full-text query: {error}.")
+        return [
+            {"path": path, "run": documentRun, "snippet": snippet, "rank": rank}
+            for path, documentRun, snippet, rank in rows
+        ]
+
+    @staticmethod
+    def quote(text: str) -> str:
+        """
+        Method turns plain text into a query matching documents holding all its words, query operators are taken as words.
+
+        Args:
+            > text (str): plain text, e.g. "O'Brien & Co"
+
+        Returns:
+            str: FTS5 query
+        """
+        words = text.split()
+        return " ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+
+    def close(self) -> None:
+        """
+        Method closes the index file.
+        """
+        self.__connection.close()
+        pass
+
+    def __enter__(self) -> "RenderIndex":
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+        pass
+
+    pass
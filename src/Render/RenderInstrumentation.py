@@ -0,0 +1,142 @@
+# Python native libraries
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Third party libraries
+import psutil
+
+# Self build libraries
+
+
+class RenderInstrumentation:
+    """
+    Class measures the wall time, CPU time and peak resident memory of every render phase.
+    Renderers measure their steps and their per run render and save calls, worker processes send their records back to be merged.
+    Args:
+        > logPath (str, optional): JSON lines file where each record is appended as soon as it is measured. Defaults to None (no log).
+    Attr:
+        > logPath (str | None): JSON lines log path
+        > records (list[dict]): measured phases in completion order
+    Meth:
+        > measure: context manager recording a single phase.
+        > extend: merges the records measured in another process.
+        > summary: aggregates the records by phase.
+        > report: structured report holding the summary and every record.
+    """
+
+    def __init__(self, logPath: str = None) -> None:
+        """
+        Method initializes an empty report.
+
+        Args:
+            > logPath (str, optional): JSON lines file where each record is appended as soon as it is measured. Defaults to None (no log).
+        """
+        self.logPath = logPath
+        self.records: list[dict] = list()
+        self.__process = psutil.Process()
+
+        # Writer threads may complete records while the renderer measures its own
+        self.__lock = threading.Lock()
+        pass
+
+    def __peakResidentMemory(self) -> int:
+        """
+        Method returns the peak resident memory in bytes of the current process.
+        """
+        memoryInfo = self.__process.memory_info()
+
+        # Windows keeps the peak working set, unix keeps it in the resource usage
+        if hasattr(memoryInfo, "peak_wset"):
+            return memoryInfo.peak_wset
+        try:
+            import resource
+        except ImportError:
+            return memoryInfo.rss
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        # Linux reports kilobytes while macOS reports bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    @contextmanager
+    def measure(self, phase: str, **labels: any):
+        """
+        Method measures the enclosed block as a phase, the record is completed when the block exits.
+
+        Args:
+            > phase (str): phase name, e.g. "readDatabase" or "saveRun"
+            > labels (any): JSON serializable values identifying the phase, e.g. template or run
+
+        Yields:
+            dict: phase record, its measures are filled on exit
+        """
+        record = {"phase": phase, **labels, "pid": os.getpid()}
+        peakStart = self.__peakResidentMemory()
+        # Thread CPU time, writer threads do not leak into the renderer phases
+        cpuStart = time.thread_time()
+        wallStart = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wallSeconds"] = time.perf_counter() - wallStart
+            record["cpuSeconds"] = time.thread_time() - cpuStart
+            record["peakRssBytes"] = self.__peakResidentMemory()
+            record["peakRssGrowthBytes"] = record["peakRssBytes"] - peakStart
+            self.__append([record])
+        pass
+
+    def extend(self, records: list[dict]) -> None:
+        """
+        Method merges records measured by another instrumentation, e.g. in a worker process.
+
+        Args:
+            > records (list[dict]): measured phase records
+        """
+        self.__append(records)
+        pass
+
+    def __append(self, records: list[dict]) -> None:
+        """
+        Method stores the records and appends them into the JSON lines log.
+        """
+        with self.__lock:
+            self.records.extend(records)
+            if self.logPath is None or not records:
+                return
+            with open(self.logPath, mode="a", encoding="utf-8") as logFile:
+                for record in records:
+                    logFile.write(json.dumps(record, default=str) + "\n")
+        pass
+
+    def summary(self) -> dict[str, dict]:
+        """
+        Method aggregates the records by phase.
+
+        Returns:
+            dict[str, dict]: count, wallSeconds, cpuSeconds and the highest peakRssBytes of each phase
+        """
+        phases = dict()
+        for record in self.records:
+            phase = phases.setdefault(
+                record["phase"],
+                {"count": 0, "wallSeconds": 0.0, "cpuSeconds": 0.0, "peakRssBytes": 0},
+            )
+            phase["count"] += 1
+            phase["wallSeconds"] += record["wallSeconds"]
+            phase["cpuSeconds"] += record["cpuSeconds"]
+            phase["peakRssBytes"] = max(phase["peakRssBytes"], record["peakRssBytes"])
+        return phases
+
+    def report(self) -> dict:
+        """
+        Method builds the structured report of the measured phases.
+
+        Returns:
+            dict: {"summary": summary by phase, "records": every phase record}
+        """
+        return {"summary": self.summary(), "records": list(self.records)}
+
+    pass
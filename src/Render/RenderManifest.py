@@ -0,0 +1,150 @@
+# Python native libraries
+import hashlib
+import json
+import os
+
+# Third party libraries
+
+# Self build libraries
+
+
+class RenderManifest:
+    """
+    Class keeps track of the inputs each rendered document was built from, so incremental renders only regenerate changed outputs.
+    Every output is recorded with a content hash of its template file, its run row values, the asset files it references
+    and the render settings changing the output bytes, e.g. the compression level.
+    Args:
+        > manifestPath (str): path of the JSON manifest file
+        > settings (dict, optional): render settings shared by every output. Defaults to None.
+    Attr:
+        > manifestPath (str): path of the JSON manifest file
+    Meth:
+        > needsRender: registers an expected output and tells whether its inputs changed since the last render.
+        > commit: deletes orphaned outputs, unless only a selection was rendered, and saves the manifest.
+    """
+
+    def __init__(self, manifestPath: str, settings: dict = None) -> None:
+        """
+        Method loads the previous manifest when it exists.
+
+        Args:
+            > manifestPath (str): path of the JSON manifest file
+            > settings (dict, optional): render settings shared by every output. Defaults to None.
+        """
+        self.manifestPath = manifestPath
+        # Changing a setting renders every output again
+        self.__settings = repr(sorted((settings or {}).items()))
+        self.__rootDirectory = os.path.dirname(self.manifestPath)
+
+        # Output relative path -> digest, from the previous and the current render
+        self.__previousOutputs = self.__readManifest()
+        self.__currentOutputs = dict()
+
+        # File digests by path, templates and assets are hashed once per render
+        self.__fileDigests = dict()
+        pass
+
+    def __readManifest(self) -> dict[str, str]:
+        """
+        Method reads the previous manifest, a missing or corrupted manifest renders everything again.
+        """
+        if not os.path.exists(self.manifestPath):
+            return dict()
+        try:
+            with open(self.manifestPath, mode="r", encoding="utf-8") as manifestFile:
+                return json.load(manifestFile).get("outputs", {})
+        except (ValueError, AttributeError):
+            return dict()
+
+    def __fileDigest(self, filePath: str) -> str:
+        """
+        Method returns the content hash of a file, computed once per path.
+        """
+        if filePath not in self.__fileDigests:
+            fileHash = hashlib.sha256()
+            with open(filePath, mode="rb") as file:
+                for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                    fileHash.update(chunk)
+            self.__fileDigests[filePath] = fileHash.hexdigest()
+        return self.__fileDigests[filePath]
+
+    def __runDigest(
+        self,
+        templatePath: str,
+        values: any,
+        assetPaths: list[str] | None,
+    ) -> str:
+        """
+        Method hashes every input of a single rendered document.
+        """
+        runHash = hashlib.sha256()
+        runHash.update(self.__fileDigest(templatePath).encode())
+        runHash.update(self.__settings.encode())
+        runHash.update(repr(values).encode())
+        for assetPath in assetPaths or []:
+            runHash.update(self.__fileDigest(assetPath).encode())
+        return runHash.hexdigest()
+
+    def needsRender(
+        self,
+        outputPath: str,
+        templatePath: str,
+        values: any,
+        assetPaths: list[str] = None,
+    ) -> bool:
+        """
+        Method registers an output expected in the current render and tells whether it has to be rendered.
+
+        Args:
+            > outputPath (str): path of the rendered document
+            > templatePath (str): path of the template the document is rendered from
+            > values (any): row values rendered into the document
+            > assetPaths (list[str], optional): asset files embedded in the document. Defaults to None.
+
+        Returns:
+            bool: True if the inputs changed or the output is missing, False otherwise.
+        """
+        outputKey = os.path.relpath(outputPath, self.__rootDirectory)
+        digest = self.__runDigest(templatePath, values, assetPaths)
+        self.__currentOutputs[outputKey] = digest
+        if self.__previousOutputs.get(outputKey) != digest:
+            return True
+        return not os.path.exists(outputPath)
+
+    def commit(self, prune: bool = True) -> list[str]:
+        """
+        Method deletes the outputs of the previous render that are no longer expected and saves the manifest.
+        Only call it once the current render succeeded.
+
+        Args:
+            > prune (bool, optional): delete the previous outputs not expected in this render. Defaults to True,
+            use False when only a selection of the project was rendered, e.g. by recipe, to keep the other outputs.
+
+        Returns:
+            list[str]: paths of the deleted orphaned outputs
+        """
+        removedOutputs = list()
+        if not prune:
+            # Outputs outside the selection keep their previous entries
+            self.__currentOutputs = {**self.__previousOutputs, **self.__currentOutputs}
+        for outputKey in self.__previousOutputs:
+            if outputKey in self.__currentOutputs:
+                continue
+            outputPath = os.path.join(self.__rootDirectory, outputKey)
+            if os.path.exists(outputPath):
+                os.remove(outputPath)
+                removedOutputs.append(outputPath)
+
+            # We clean the run directory once it is left empty
+            runDirectory = os.path.dirname(outputPath)
+            if os.path.isdir(runDirectory) and not os.listdir(runDirectory):
+                os.rmdir(runDirectory)
+
+        with open(self.manifestPath, mode="w", encoding="utf-8") as manifestFile:
+            json.dump({"outputs": self.__currentOutputs}, manifestFile, indent=1)
+
+        self.__previousOutputs = self.__currentOutputs
+        self.__currentOutputs = dict()
+        return removedOutputs
+
+    pass
@@ -0,0 +1,174 @@
+# Python native libraries
+import json
+import os
+
+# Third party libraries
+
+# Self build libraries
+
+
+class RenderRecipe:
+    """
+    Class is a saved selection of runs, templates and output types to render from a project.
+    Renderers given a recipe only transform and render the selected rows and templates, everything else is left untouched.
+    Args:
+        > name (str): recipe name, also its file name
+        > runs (list[str], optional): key headers of the runs to render. Defaults to None (every run).
+        > templates (list[str], optional): file names of the templates to render. Defaults to None (every template).
+        > outputTypes (list[str], optional): document types to render, "word" and/or "excel". Defaults to None (both).
+    Attr:
+        > name (str): recipe name
+        > runs (list[str] | None): selected key headers, None for every run
+        > templates (list[str] | None): selected template file names, None for every template
+        > outputTypes (list[str]): selected document types
+    Meth:
+        > includesRun: tells whether a run is selected.
+        > includesTemplate: tells whether a template is selected.
+        > includesOutput: tells whether a document type is selected.
+        > save: writes the recipe as JSON into a directory.
+        > load: reads a recipe JSON file.
+        > listRecipes: lists the recipe files of a directory.
+        > runsKey: hashable key of the runs selected by a recipe.
+    Raises:
+        > ValueError: Recipe output types should be word or excel.
+    """
+
+    OUTPUT_TYPES = ["word", "excel"]
+    FILE_EXTENSION = ".recipe.json"
+
+    def __init__(
+        self,
+        name: str,
+        runs: list[str] = None,
+        templates: list[str] = None,
+        outputTypes: list[str] = None,
+    ) -> None:
+        """
+        Method validates the recipe selection.
+
+        Raises:
+            ValueError: Recipe output types should be word or excel.
+        """
+        self.name = name
+        self.runs = None if runs is None else list(runs)
+        self.templates = None if templates is None else list(templates)
+        self.outputTypes = (
+            list(self.OUTPUT_TYPES) if outputTypes is None else list(outputTypes)
+        )
+        if any(outputType not in self.OUTPUT_TYPES for outputType in self.outputTypes):
+            raise ValueError("Recipe output types should be word or excel.")
+
+        # Sets for the lookups done on every row and template, runs match by text as numeric key headers are read as numbers
+        self.__runs = None if self.runs is None else {str(run) for run in self.runs}
+        self.__templates = None if self.templates is None else set(self.templates)
+        pass
+
+    def includesRun(self, run: any) -> bool:
+        """
+        Method tells whether a run is selected by the recipe.
+        """
+        return self.__runs is None or str(run) in self.__runs
+
+    def includesTemplate(self, templatePath: str) -> bool:
+        """
+        Method tells whether a template is selected by the recipe, templates are matched by file name.
+        """
+        return (
+            self.__templates is None
+            or os.path.basename(templatePath) in self.__templates
+        )
+
+    def includesOutput(self, outputType: str) -> bool:
+        """
+        Method tells whether a document type, "word" or "excel", is selected by the recipe.
+        """
+        return outputType in self.outputTypes
+
+    def save(self, recipesDirectory: str) -> str:
+        """
+        Method writes the recipe as JSON, replacing a previous recipe with the same name.
+
+        Args:
+            > recipesDirectory (str): directory where the project recipes are stored, built when missing
+
+        Returns:
+            str: path of the recipe file
+        """
+        os.makedirs(recipesDirectory, exist_ok=True)
+        recipePath = os.path.join(
+            recipesDirectory, f"{self.name}{self.FILE_EXTENSION}"
+        )
+        with open(recipePath, mode="w", encoding="utf-8") as recipeFile:
+            json.dump(
+                {
+                    "name": self.name,
+                    "runs": self.runs,
+                    "templates": self.templates,
+                    "outputTypes": self.outputTypes,
+                },
+                recipeFile,
+                indent=4,
+            )
+        return recipePath
+
+    @classmethod
+    def load(cls, recipePath: str) -> "RenderRecipe":
+        """
+        Method reads a recipe JSON file.
+
+        Args:
+            > recipePath (str): path of the recipe file
+
+        Returns:
+            RenderRecipe: loaded recipe
+
+        Raises:
+            FileNotFoundError: Recipe file does not exist.
+            ValueError: Recipe output types should be word or excel.
+        """
+        if not os.path.exists(recipePath):
+            raise FileNotFoundError(f"Recipe file does not exist: {recipePath}")
+        with open(recipePath, mode="r", encoding="utf-8") as recipeFile:
+            content = json.load(recipeFile)
+        return cls(
+            name=content.get("name", os.path.basename(recipePath)),
+            runs=content.get("runs"),
+            templates=content.get("templates"),
+            outputTypes=content.get("outputTypes"),
+        )
+
+    @staticmethod
+    def runsKey(recipe: "RenderRecipe | None") -> tuple | None:
+        """
+        Method returns a hashable key of the runs selected by a recipe, e.g. to cache the contexts transformed for it.
+
+        Args:
+            > recipe (RenderRecipe | None): recipe, None for every run
+
+        Returns:
+            tuple | None: selected key headers, None when every run is selected
+        """
+        if recipe is None or recipe.runs is None:
+            return None
+        return tuple(recipe.runs)
+
+    @classmethod
+    def listRecipes(cls, recipesDirectory: str) -> list[str]:
+        """
+        Method lists the recipe files saved in a directory.
+
+        Args:
+            > recipesDirectory (str): directory where the project recipes are stored
+
+        Returns:
+            list[str]: sorted recipe file paths, empty when the directory does not exist
+        """
+        if not os.path.isdir(recipesDirectory):
+            return []
+        return sorted(
+            os.path.join(recipesDirectory, item)
+            for item in os.listdir(recipesDirectory)
+            if item.endswith(cls.FILE_EXTENSION)
+        )
+
+    pass
@@ -1,12 +1,22 @@
 # Python native libraries
+import io
 import os
+from collections.abc import Mapping
 
 # Third party libraries
+from docx.shared import Cm
 from docxtpl import DocxTemplate, InlineImage
 from tqdm import tqdm
 
 # Self build libraries
-from Func.Excel.Excel import Excel
+from Render.CompiledTemplate import CompiledTemplate
+from Render.ImageAssetCache import CachedInlineImage, ImageAssetCache
+from Render.ImageVariantCache import ImageVariantCache
+from Render.OutputWriter import OutputWriter
+from Render.PackageCompression import PackageCompression
+from Render.ProjectContext import ProjectContext
+from Render.RenderInstrumentation import RenderInstrumentation
+from Render.RenderRecipe import RenderRecipe
 from Render.WordRender import WordRender
 
 """
@@ -165,30 +175,56 @@ class WordImageRenderer(WordRender):
 class WordImageRenderer(WordRender):
     """
     Specialized class for rendering Word documents with image placeholders.
+    Placeholders listed in the optional "Place Holder Sizes" sheet (Place Holder, Width (cm), Height (cm)) are displayed at that size,
+    their assets are embedded as variants resampled for it and cached in the ".variants" directory of the assets.
 
     Args:
         templatesDirectory (str): Directory where Word templates are stored.
         databasePath (str): Path to the Excel database file.
         outputRenders (str): Directory where rendered documents will be saved.
         assetsDirectory (str): Directory containing image assets for placeholders.
+        workers (int, optional): Number of worker processes rendering in parallel. Defaults to 1 (serial).
+        projectContext (ProjectContext, optional): Database already read and shared between renderers. Defaults to None (read from databasePath).
+        incremental (bool, optional): Only renders documents whose template, row values or assets changed since the last render. Defaults to False.
+        instrumentationLog (str, optional): JSON lines file where each measured phase is appended. Defaults to None (no log).
+        compression (str, optional): zip compression level of the rendered documents: "store", "fast", "default" or "max". Defaults to "default".
+        recipe (RenderRecipe, optional): Only renders the runs and templates selected by the recipe. Defaults to None (everything).
 
     Raises:
         FileNotFoundError: If any of the directories or files do not exist.
+        ValueError: If workers is not a positive integer.
+        ValueError: If the compression level is unknown.
         ValueError: If required sheets are missing in the database.
+        ValueError: If a placeholder size is not a positive number of centimeters.
     """
 
+    # Optional sheet of the placeholder display sizes
+    SIZES_SHEET = "Place Holder Sizes"
+    VARIANTS_DIRECTORY = ".variants"
+
     def __init__(
         self,
         templatesDirectory: str,
         databasePath: str,
         outputRenders: str,
         assetsDirectory: str,
+        workers: int = 1,
+        projectContext: ProjectContext = None,
+        incremental: bool = False,
+        instrumentationLog: str = None,
+        compression: str = "default",
+        recipe: RenderRecipe = None,
     ) -> None:
         # Principal attributes
         self.templatesDirectory = templatesDirectory
         self.databasePath = databasePath
         self.outputRenders = outputRenders
         self.assetsDirectory = assetsDirectory
+        self.workers = workers
+        self.projectContext = projectContext
+        self.incremental = incremental
+        self.compression = compression
+        self.recipe = recipe
 
         # Initial validations
         if not os.path.exists(self.templatesDirectory):
@@ -197,63 +233,142 @@ class WordImageRenderer(WordRender):
             raise FileNotFoundError("Database path does not exist.")
         if self.assetsDirectory and not os.path.exists(self.assetsDirectory):
             raise FileNotFoundError("Assets directory does not exist.")
+        if not isinstance(self.workers, int) or self.workers < 1:
+            raise ValueError("Workers should be a positive integer.")
+
+        # Unknown compression levels fail before reading the database
+        PackageCompression(level=self.compression)
 
         # Main procedures for rendering documents
         steps = [
             self._WordRender__buildConstants,
             self._WordRender__readDatabase,
-            self.__readDatabase,
+            self.__readPlaceholders,
             self._WordRender__transformWordMatrix,
             self.__transformPlaceholderMatrix,
             self._WordRender__getTemplatesList,
+            self.__prepareImageVariants,
             self.__renderWordImageDocuments,
         ]
         totalSteps = len(steps)
+
+        # Wall time in seconds of each step, e.g. {"readDatabase": 0.42}
+        self.stepTimings: dict[str, float] = dict()
+        self.instrumentation = RenderInstrumentation(logPath=instrumentationLog)
         with tqdm(
             total=totalSteps,
             desc="Rendering Word templates in project",
             unit="step",
         ) as progressBar:
+            self._WordRender__progressBar = progressBar
             for index, step in enumerate(iterable=steps):
                 progressBar.set_description(f"Step {index+1} of {totalSteps}")
-                step()
+                stepName = step.__name__.strip("_")
+                with self.instrumentation.measure(
+                    phase=stepName, renderer=type(self).__name__
+                ) as record:
+                    step()
+                self.stepTimings[stepName] = (
+                    self.stepTimings.get(stepName, 0.0) + record["wallSeconds"]
+                )
                 progressBar.update(1)
             pass
 
-    def __readDatabase(self) -> None:
+        # We release the database file when this renderer opened it
+        if projectContext is None:
+            self.projectContext.close()
+
+    def __readPlaceholders(self) -> None:
         """
         Reads the placeholders sheet from the database and validates its content.
         Raises:
             ValueError: If the "Place Holders" sheet is missing.
         """
-        excel = Excel(self.databasePath)
-        self.__matrix = excel.workbookData
-        self.__sheets = excel.sheets
-
-        for index, sheetName in enumerate(self.__sheets):
-            if sheetName == "Place Holders":
-                self.__placeholdersMatrix = self.__matrix[index]
+        # The project context was already loaded while reading the word data
+        self.__placeholdersMatrix = self.projectContext.getSheetMatrix("Place Holders")
 
         if not self.__placeholdersMatrix:
             raise ValueError("Missing required sheet: Place Holders.")
 
+        # None when the database does not size its placeholders
+        self.__sizesMatrix = self.projectContext.getSheetMatrix(self.SIZES_SHEET)
+
     def __transformPlaceholderMatrix(self) -> None:
         """
         Transforms the placeholders matrix into a structured context dictionary.
+        The transformed context of every run is kept in the project context snapshot, the one of a run selection only in memory.
         """
-        self.keyWordsPlaceholders = self.__placeholdersMatrix[1]  # Header row
-        self.placeholderContext = {}
+        runsKey = RenderRecipe.runsKey(self.recipe)
+        self.keyWordsPlaceholders, self.placeholderContext = (
+            self.projectContext.getContext(
+                key=("placeholderContext", runsKey),
+                builder=self.__buildPlaceholderContext,
+                snapshot=runsKey is None,
+            )
+        )
+        self.placeholderSizes = self.projectContext.getContext(
+            key=("placeholderSizes",), builder=self.__buildPlaceholderSizes
+        )
+
+    def __buildPlaceholderContext(self) -> tuple[list, dict]:
+        """
+        Builds the placeholder keywords and the placeholder context by run.
+        """
+        keyWordsPlaceholders = self.__placeholdersMatrix[1]  # Header row
+        placeholderContext = {}
 
         for runIndex, row in enumerate(self.__placeholdersMatrix[2:], start=1):
+            runKey = self.wordKeyHeaders[runIndex]
+
+            # Rows outside the recipe are never transformed
+            if self.recipe is not None and not self.recipe.includesRun(runKey):
+                continue
+
             runDictionary = {}
-            for columnIndex, columnKeyword in enumerate(self.keyWordsPlaceholders):
+            for columnIndex, columnKeyword in enumerate(keyWordsPlaceholders):
                 value = row[columnIndex]
                 if not value:
                     raise IndexError(f"Empty placeholder found in {columnKeyword}")
                 runDictionary[columnKeyword] = value
 
-            runKey = self.wordKeyHeaders[runIndex]
-            self.placeholderContext[runKey] = runDictionary
+            placeholderContext[runKey] = runDictionary
+        return keyWordsPlaceholders, placeholderContext
+
+    def __buildPlaceholderSizes(self) -> dict[str, tuple[int | None, int | None]]:
+        """
+        Builds the displayed width and height in EMU of each sized placeholder, a blank dimension follows the image aspect ratio.
+
+        Raises:
+            ValueError: If a placeholder size is not a positive number of centimeters.
+        """
+        placeholderSizes = dict()
+        if not self.__sizesMatrix:
+            return placeholderSizes
+
+        # We skip the header row
+        for row in self.__sizesMatrix[1:]:
+            cells = list(row) + [None] * (3 - len(row))
+            placeholder, width, height = cells[:3]
+            if not placeholder:
+                continue
+            size = list()
+            for value in (width, height):
+                if value is None or value == "":
+                    size.append(None)
+                    continue
+                try:
+                    centimeters = float(value)
+                except (TypeError, ValueError):
+                    centimeters = 0.0
+                if isinstance(value, bool) or not centimeters > 0:
+                    raise ValueError(
+                        "Placeholder size should be a positive number of centimeters: "
+                        f"{placeholder}."
+                    )
+                size.append(int(Cm(centimeters)))
+            if size != [None, None]:
+                placeholderSizes[placeholder] = tuple(size)
+        return placeholderSizes
 
     def __imagePathBuilder(self, partialPath: str) -> str:
         """
@@ -267,40 +382,168 @@ class WordImageRenderer(WordRender):
         return imagePath
 
     @staticmethod
-    def __inLineImageBuilder(template: DocxTemplate, imagePath: str) -> InlineImage:
+    def __inLineImageBuilder(
+        template: DocxTemplate,
+        imageAssets: ImageAssetCache,
+        imagePath: str,
+        width: int = None,
+        height: int = None,
+    ) -> InlineImage:
         """
-        Builds an InlineImage object for rendering in Word.
+        Builds an InlineImage object for rendering in Word from a cached image asset, at native size without width and height.
         """
-        return InlineImage(template, imagePath)
+        return CachedInlineImage(
+            template,
+            imageAssets.getImage(imagePath),
+            imageAssets=imageAssets,
+            width=width,
+            height=height,
+        )
+
+    def __prepareImageVariants(self) -> None:
+        """
+        Resolves the image of every placeholder of the selected runs, sized placeholders get their right-sized variant.
+        Each distinct image and size is resolved once before rendering, so missing assets fail early and worker processes only read cached variants.
+        """
+        variants = ImageVariantCache(
+            cacheDirectory=os.path.join(self.assetsDirectory, self.VARIANTS_DIRECTORY)
+        )
+        self.__variantCache = variants
+        imagePaths = dict()
+
+        # Run -> {placeholder: (image path, width, height)}, and the assets behind them
+        self.__imageContexts = dict()
+        self.__assetPaths = dict()
+        for run in self.selectedRuns():
+            placeholdersStructure = self.placeholderContext.get(run, {})
+            imageContext = dict()
+            for key, value in placeholdersStructure.items():
+                if value not in imagePaths:
+                    imagePaths[value] = self.__imagePathBuilder(value)
+                width, height = self.placeholderSizes.get(key, (None, None))
+                imageContext[key] = variants.getVariant(
+                    imagePaths[value], width=width, height=height
+                )
+            self.__imageContexts[run] = imageContext
+            self.__assetPaths[run] = [
+                imagePaths[value] for value in placeholdersStructure.values()
+            ]
 
     def __renderWordImageDocuments(self) -> None:
         """
         Renders Word documents by merging text and image placeholders.
         """
+        runsDirectory = os.path.join(self.outputRenders, self.rendersDirectory)
+        runs = self.selectedRuns()
+        imageContexts = self.__imageContexts
+
+        manifest = self._WordRender__openManifest()
+
+        jobs = list()
         for templatePath in self.wordTemplatesPaths:
-            documentTemplate = DocxTemplate(template_file=templatePath)
 
-            for run in self.wordKeyHeaders[1:]:
-                runOutputDirectory = os.path.join(
-                    self.outputRenders, self.rendersDirectory, run
+            # In incremental mode we skip the runs whose inputs did not change
+            pendingRuns = [
+                run
+                for run in runs
+                if manifest is None
+                or manifest.needsRender(
+                    outputPath=self._WordRender__renderOutputPath(
+                        runsDirectory, run, templatePath
+                    ),
+                    templatePath=templatePath,
+                    values=(
+                        self.wordContext.get(run, {}),
+                        self.placeholderContext.get(run, {}),
+                        {
+                            key: self.placeholderSizes[key]
+                            for key in imageContexts[run]
+                            if key in self.placeholderSizes
+                        },
+                    ),
+                    assetPaths=self.__assetPaths[run],
                 )
-                os.makedirs(runOutputDirectory, exist_ok=True)
+            ]
+            for partition in self._WordRender__partitionRuns(pendingRuns):
+                jobs.append(
+                    {
+                        "templatePath": templatePath,
+                        "runs": partition,
+                        "contexts": self.wordContext.select(partition),
+                        "imageContexts": {
+                            run: imageContexts[run] for run in partition
+                        },
+                        "runsDirectory": runsDirectory,
+                        "compression": self.compression,
+                    }
+                )
+        self._WordRender__dispatchPartitions(
+            worker=self._renderImagePartition,
+            jobs=jobs,
+        )
 
-                fileName = os.path.basename(templatePath)
-                renderName = f"{run}_{fileName}"
-                renderOutput = os.path.join(runOutputDirectory, renderName)
+        # A recipe render keeps the outputs outside its selection
+        if manifest is not None:
+            manifest.commit(prune=self.recipe is None)
+        # Variants are resolved for every run unless the selection narrows the runs
+        if self.recipe is None or self.recipe.runs is None:
+            self.__variantCache.prune()
 
-                context = self.wordContext.get(run, {}).copy()
-                placeholdersStructure = self.placeholderContext.get(run, {})
+    @staticmethod
+    def _renderImagePartition(
+        templatePath: str,
+        runs: list,
+        contexts: Mapping,
+        imageContexts: dict,
+        runsDirectory: str,
+        compression: str = "default",
+    ) -> list[dict]:
+        """
+        Worker renders a partition of runs merging text and image placeholders for a single template.
+        Each distinct image is read and measured once and reused by every run referencing it.
+        Static so it can be sent to worker processes, serial and parallel modes share it to produce the same output.
+
+        Returns:
+            list[dict]: measured phase records of the template load and each run render, save and write
+        """
+        instrumentation = RenderInstrumentation()
+        templateName = os.path.basename(templatePath)
+        with instrumentation.measure(phase="loadTemplate", template=templateName):
+            documentTemplate = CompiledTemplate(
+                templatePath=templatePath, compression=compression
+            )
+        imageAssets = ImageAssetCache()
+
+        with OutputWriter(instrumentation=instrumentation) as writer:
+            for run in runs:
+                renderOutput = WordRender._WordRender__renderOutputPath(
+                    runsDirectory, run, templatePath
+                )
+
+                context = dict(contexts.get(run, {}))
                 secondContext = {}
 
-                for key, value in placeholdersStructure.items():
-                    imagePath = self.__imagePathBuilder(value)
-                    inlineImageObject = self.__inLineImageBuilder(
-                        template=documentTemplate, imagePath=imagePath
+                for key, (imagePath, width, height) in imageContexts.get(
+                    run, {}
+                ).items():
+                    inlineImageObject = WordImageRenderer.__inLineImageBuilder(
+                        template=documentTemplate,
+                        imageAssets=imageAssets,
+                        imagePath=imagePath,
+                        width=width,
+                        height=height,
                     )
                     secondContext[key] = inlineImageObject
 
                 context.update(secondContext)
-                documentTemplate.render(context=context)
-                documentTemplate.save(renderOutput)
+                with instrumentation.measure(
+                    phase="renderRun", template=templateName, run=run
+                ):
+                    documentTemplate.render(context=context)
+                with instrumentation.measure(
+                    phase="saveRun", template=templateName, run=run
+                ):
+                    document = io.BytesIO()
+                    documentTemplate.save(document)
+                writer.write(renderOutput, document.getvalue())
+        return instrumentation.records
@@ -1,12 +1,21 @@
 # Python native libraries
+import io
 import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Third party libraries
-from docxtpl import DocxTemplate
 from tqdm import tqdm
 
 # Self build libraries
-from Func.Excel.Excel import Excel
+from Render.ColumnarContext import ColumnarContext
+from Render.CompiledTemplate import CompiledTemplate
+from Render.OutputWriter import OutputWriter
+from Render.PackageCompression import PackageCompression
+from Render.ProjectContext import ProjectContext
+from Render.RenderInstrumentation import RenderInstrumentation
+from Render.RenderManifest import RenderManifest
+from Render.RenderRecipe import RenderRecipe
 
 
 class WordRender:
@@ -16,9 +25,22 @@ class WordRender:
         > templatesDirectory (str): directory where the word documents are found
         > databasePath (str): path of the excel database information
         > outputRenders (str): directory where the class will dump render documents
+        > workers (int, optional): number of worker processes rendering in parallel. Defaults to 1 (serial).
+        > projectContext (ProjectContext, optional): database already read and shared between renderers. Defaults to None (read from databasePath).
+        > incremental (bool, optional): only renders documents whose template, row values or assets changed since the last render. Defaults to False.
+        > instrumentationLog (str, optional): JSON lines file where each measured phase is appended. Defaults to None (no log).
+        > compression (str, optional): zip compression level of the rendered documents: "store", "fast", "default" or "max". Defaults to "default".
+        > recipe (RenderRecipe, optional): only renders the runs and templates selected by the recipe. Defaults to None (everything).
+    Attr:
+        > stepTimings (dict[str, float]): wall time in seconds of each step
+        > instrumentation (RenderInstrumentation): wall time, CPU time and peak memory of each step and each run render and save
+    Meth:
+        > selectedRuns: key headers of the runs rendered, the recipe selection when one was given.
     Raises:
         > FileNotFoundError: Templates directory does not exist.
         > FileNotFoundError: Database path does not exist.
+        > ValueError: Workers should be a positive integer.
+        > ValueError: Compression level should be one of: store, fast, default, max.
         > ValueError: Missing required sheets: Word Data.
     """
 
@@ -27,6 +49,12 @@ class WordRender:
         templatesDirectory: str,
         databasePath: str,
         outputRenders: str,
+        workers: int = 1,
+        projectContext: ProjectContext = None,
+        incremental: bool = False,
+        instrumentationLog: str = None,
+        compression: str = "default",
+        recipe: RenderRecipe = None,
     ) -> None:
         """
         Method initializes the class procedures into rendering a word document.
@@ -35,21 +63,39 @@ class WordRender:
             > templatesDirectory (str): directory where the word documents are found
             > databasePath (str): path of the excel database information
             > outputRenders (str): directory where the class will dump render documents
+            > workers (int, optional): number of worker processes rendering in parallel. Defaults to 1 (serial).
+            > projectContext (ProjectContext, optional): database already read and shared between renderers. Defaults to None (read from databasePath).
+            > incremental (bool, optional): only renders documents whose template, row values or assets changed since the last render. Defaults to False.
+            > instrumentationLog (str, optional): JSON lines file where each measured phase is appended. Defaults to None (no log).
+            > compression (str, optional): zip compression level of the rendered documents: "store", "fast", "default" or "max". Defaults to "default".
+            > recipe (RenderRecipe, optional): only renders the runs and templates selected by the recipe. Defaults to None (everything).
 
         Raises:
             FileNotFoundError: Templates directory does not exist.
             FileNotFoundError: Database path does not exist.
+            ValueError: Workers should be a positive integer.
+            ValueError: Compression level should be one of: store, fast, default, max.
         """
         # we set our principal attributes
         self.templatesDirectory = templatesDirectory
         self.databasePath = databasePath
         self.outputRenders = outputRenders
+        self.workers = workers
+        self.projectContext = projectContext
+        self.incremental = incremental
+        self.compression = compression
+        self.recipe = recipe
 
         # Initial validations
         if not os.path.exists(self.templatesDirectory):
             raise FileNotFoundError("Templates directory does not exist.")
         if not os.path.exists(self.databasePath):
             raise FileNotFoundError("Database path does not exist.")
+        if not isinstance(self.workers, int) or self.workers < 1:
+            raise ValueError("Workers should be a positive integer.")
+
+        # Unknown compression levels fail before reading the database
+        PackageCompression(level=self.compression)
 
         # We execute the main procedures for rendering documents
 
@@ -61,16 +107,32 @@ class WordRender:
             self.__renderWordDocuments,
         ]
         totalSteps = len(steps)
+
+        # Wall time in seconds of each step, e.g. {"readDatabase": 0.42}
+        self.stepTimings: dict[str, float] = dict()
+        self.instrumentation = RenderInstrumentation(logPath=instrumentationLog)
         with tqdm(
             total=totalSteps,
             desc="Rendering Word templates in project",
             unit="step",
         ) as progressBar:
+            self.__progressBar = progressBar
             for index, step in enumerate(iterable=steps):
                 progressBar.set_description(f"Step {index+1} of {totalSteps}")
-                step()
+                stepName = step.__name__.strip("_")
+                with self.instrumentation.measure(
+                    phase=stepName, renderer=type(self).__name__
+                ) as record:
+                    step()
+                self.stepTimings[stepName] = (
+                    self.stepTimings.get(stepName, 0.0) + record["wallSeconds"]
+                )
                 progressBar.update(1)
             pass
+
+        # We release the database file when this renderer opened it
+        if projectContext is None:
+            self.projectContext.close()
         pass
 
     def __buildConstants(self):
@@ -78,6 +140,7 @@ class WordRender:
         Method build constants used locally in the class
         """
         self.rendersDirectory: str = "Renders"
+        self.manifestFileName: str = ".wordRenderManifest.json"
         pass
 
     def __readDatabase(self) -> None:
@@ -87,14 +150,10 @@ class WordRender:
             ValueError: Missing required sheets: Word Data
         """
 
-        excel = Excel(self.databasePath)
-
-        # workbookData (list[list[list[any]]]): 3D __matrix (sheet, row, column)
-        self.__matrix = excel.workbookData
-        self.__sheets = excel.sheets
-        for index, sheetName in enumerate(self.__sheets):
-            if sheetName == "Word Data":
-                self.__wordMatrix = self.__matrix[index]
+        # We only read the database when no shared project context was given
+        if self.projectContext is None:
+            self.projectContext = ProjectContext(self.databasePath)
+        self.__wordMatrix = self.projectContext.getSheetMatrix("Word Data")
 
         # Validation of database integrity
         if not self.__wordMatrix:
@@ -104,24 +163,41 @@ class WordRender:
     def __transformWordMatrix(self) -> None:
         """
         Method gives the excel file table a proper data structure for rendering documents.
+        The transformed context of every run is kept in the project context snapshot, the one of a run selection only in memory.
+        """
+        runsKey = RenderRecipe.runsKey(self.recipe)
+        self.keyWords, self.wordKeyHeaders, self.wordContext = (
+            self.projectContext.getContext(
+                key=("wordContext", runsKey),
+                builder=self.__buildWordContext,
+                snapshot=runsKey is None,
+            )
+        )
+        pass
+
+    def __buildWordContext(self) -> tuple[list, list, ColumnarContext]:
+        """
+        Method builds the key words, the key headers and the columnar context of the word data.
         """
         # We get all the key words in the matrix
-        self.keyWords = self.__wordMatrix[0]
+        keyWords = self.__wordMatrix[0]
 
         # We get all the key headers or "runs" we will render
-        self.wordKeyHeaders = [row[0] for row in self.__wordMatrix]
-
-        # We build the context dictionary structure for rendering templates
-        self.wordContext = dict()  # We build the main dictionary
-        for runIndex, runKey in enumerate(self.wordKeyHeaders):
-            runDictionary = dict()
-            runRowData = self.__wordMatrix[runIndex]
+        wordKeyHeaders = [row[0] for row in self.__wordMatrix]
 
-            for columnIndex, columnKeyword in enumerate(self.keyWords):
-                runDictionary[columnKeyword] = runRowData[columnIndex]
-
-            self.wordContext[runKey] = runDictionary
-        pass
+        # We build the context structure for rendering templates, one column per keyword instead of a dictionary per run
+        # Rows outside the recipe are never transformed
+        selectedRows = [
+            row
+            for row in self.__wordMatrix[1:]
+            if self.recipe is None or self.recipe.includesRun(row[0])
+        ]
+        wordContext = ColumnarContext(
+            keywords=keyWords,
+            runs=[row[0] for row in selectedRows],
+            rows=selectedRows,
+        )
+        return keyWords, wordKeyHeaders, wordContext
 
     def __getTemplatesList(self):
         """
@@ -132,41 +208,207 @@ class WordRender:
             for item in os.listdir(self.templatesDirectory)
         ]
         self.wordTemplatesPaths = [
-            path for path in self.__templatesPaths if path.endswith(".docx")
+            path
+            for path in self.__templatesPaths
+            if path.endswith(".docx")
+            and (self.recipe is None or self.recipe.includesTemplate(path))
         ]
         pass
 
+    def selectedRuns(self) -> list:
+        """
+        Method returns the key headers of the runs to render, the recipe selection when one was given.
+
+        Returns:
+            list: key headers of the runs to render
+        """
+        # We skip the first key that corresponds for key values
+        return [
+            run
+            for run in self.wordKeyHeaders[1:]
+            if self.recipe is None or self.recipe.includesRun(run)
+        ]
+
     def __renderWordDocuments(self) -> None:
         """
         Method renders the actual document templates and dumps them into the given output directory.
         """
+        runsDirectory = os.path.join(self.outputRenders, self.rendersDirectory)
+
+        runs = self.selectedRuns()
+        manifest = self.__openManifest()
 
+        jobs = list()
         for templatePath in self.wordTemplatesPaths:
-            documentTemplate = DocxTemplate(template_file=templatePath)
-            # We skip the first key that corresponds for key values
-            for run in self.wordKeyHeaders[1:]:
-
-                # We build the destination directory where we will store the rendered document version
-                runOutputDirectory = os.path.join(
-                    self.outputRenders,
-                    self.rendersDirectory,
-                    run,
+
+            # In incremental mode we skip the runs whose inputs did not change
+            pendingRuns = [
+                run
+                for run in runs
+                if manifest is None
+                or manifest.needsRender(
+                    outputPath=self.__renderOutputPath(
+                        runsDirectory, run, templatePath
+                    ),
+                    templatePath=templatePath,
+                    values=self.wordContext.get(run, {}),
+                )
+            ]
+            for partition in self.__partitionRuns(pendingRuns):
+                jobs.append(
+                    {
+                        "templatePath": templatePath,
+                        "runs": partition,
+                        "contexts": self.wordContext.select(partition),
+                        "runsDirectory": runsDirectory,
+                        "compression": self.compression,
+                    }
                 )
-                os.makedirs(runOutputDirectory, exist_ok=True)
+        self.__dispatchPartitions(worker=self._renderPartition, jobs=jobs)
+
+        # A recipe render keeps the outputs outside its selection
+        if manifest is not None:
+            manifest.commit(prune=self.recipe is None)
+        pass
+
+    def __openManifest(self) -> RenderManifest | None:
+        """
+        Method loads the render manifest of the project when rendering incrementally.
+
+        Returns:
+            RenderManifest | None: project manifest, None when rendering everything
+        """
+        if not self.incremental:
+            return None
+        return RenderManifest(
+            manifestPath=os.path.join(self.outputRenders, self.manifestFileName),
+            settings={"compression": self.compression},
+        )
+
+    @staticmethod
+    def __renderOutputPath(runsDirectory: str, run: str, templatePath: str) -> str:
+        """
+        Method builds the path of the document rendered for a run, e.g. Renders/<run>/<run>_<template>.
+
+        Args:
+            > runsDirectory (str): directory where each run directory is built
+            > run (str): key header of the run
+            > templatePath (str): path of the template
+
+        Returns:
+            str: rendered document path
+        """
+        fileName = os.path.basename(templatePath)
+        renderName = f"{run}_{fileName}"
+        return os.path.join(runsDirectory, run, renderName)
+
+    def __partitionRuns(self, runs: list) -> list[list]:
+        """
+        Method splits the runs into contiguous partitions, one per worker.
+
+        Args:
+            > runs (list): key headers of the runs to render
+
+        Returns:
+            list[list]: partitions of runs, empty partitions are discarded
+        """
+        partitionSize = -(-len(runs) // self.workers)  # Ceil division
+        if partitionSize == 0:
+            return []
+        return [
+            runs[index : index + partitionSize]
+            for index in range(0, len(runs), partitionSize)
+        ]
+
+    def __dispatchPartitions(self, worker: callable, jobs: list[dict]) -> None:
+        """
+        Method executes the render jobs serially or across a process pool, reporting the rendered documents into the progress bar.
+
+        Args:
+            > worker (callable): picklable function rendering one template partition, returns its measured phase records
+            > jobs (list[dict]): keyword arguments for each worker call
+        """
+        totalDocuments = sum(len(job["runs"]) for job in jobs)
+        renderedDocuments = 0
+        self.__progressBar.set_postfix_str(
+            f"{renderedDocuments}/{totalDocuments} documents"
+        )
+
+        # Serial path, we avoid the process pool overhead
+        if self.workers == 1:
+            for job in jobs:
+                self.instrumentation.extend(worker(**job))
+                renderedDocuments += len(job["runs"])
+                self.__progressBar.set_postfix_str(
+                    f"{renderedDocuments}/{totalDocuments} documents"
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(worker, **job): job for job in jobs}
+            for future in as_completed(futures):
+                # Exceptions raised in the workers are raised back in here
+                self.instrumentation.extend(future.result())
+                renderedDocuments += len(futures[future]["runs"])
+                self.__progressBar.set_postfix_str(
+                    f"{renderedDocuments}/{totalDocuments} documents"
+                )
+        pass
+
+    @staticmethod
+    def _renderPartition(
+        templatePath: str,
+        runs: list,
+        contexts: Mapping,
+        runsDirectory: str,
+        compression: str = "default",
+    ) -> list[dict]:
+        """
+        Worker renders a partition of runs for a single template, loading the template once.
+        Documents are saved in memory and written by an output writer, so rendering overlaps with disk writes.
+        Static so it can be sent to worker processes, serial and parallel modes share it to produce the same output.
+
+        Args:
+            > templatePath (str): path of the word template
+            > runs (list): key headers of the runs to render
+            > contexts (Mapping): rendering context for each run
+            > runsDirectory (str): directory where each run directory is built
+            > compression (str, optional): zip compression level of the rendered documents. Defaults to "default".
+
+        Returns:
+            list[dict]: measured phase records of the template load and each run render, save and write
+        """
+        instrumentation = RenderInstrumentation()
+        templateName = os.path.basename(templatePath)
+        with instrumentation.measure(phase="loadTemplate", template=templateName):
+            documentTemplate = CompiledTemplate(
+                templatePath=templatePath, compression=compression
+            )
+
+        with OutputWriter(instrumentation=instrumentation) as writer:
+            for run in runs:
 
                 # We strip from the template path the original document name and append it to the intended destination adding the key header
-                fileName = os.path.basename(templatePath)
-                renderName = f"{run}_{fileName}"
-                renderOutput = os.path.join(runOutputDirectory, renderName)
+                renderOutput = WordRender.__renderOutputPath(
+                    runsDirectory, run, templatePath
+                )
 
                 # We merge the word with placeholder context
-                context = self.wordContext.get(run, {}).copy()
+                context = dict(contexts.get(run, {}))
 
                 # We actually render the document
-                documentTemplate.render(context=context)
+                with instrumentation.measure(
+                    phase="renderRun", template=templateName, run=run
+                ):
+                    documentTemplate.render(context=context)
 
-                # We save the changes
-                documentTemplate.save(renderOutput)
-        pass
+                # We save the changes in memory, the writer dumps them into the run directory
+                with instrumentation.measure(
+                    phase="saveRun", template=templateName, run=run
+                ):
+                    document = io.BytesIO()
+                    documentTemplate.save(document)
+                writer.write(renderOutput, document.getvalue())
+        return instrumentation.records
 
     pass
@@ -9,8 +9,6 @@ import csv
 import time
 
 # Third party libraries
-import psutil
-from pynput import keyboard
 
 # Self build libraries
 
@@ -74,6 +72,9 @@ class SystemOperations:
             NotImplementedError: If the operation is not supported on the current OS.
         """
         if self.operativeSystem == "Windows":
+            # psutil is only loaded by the performance actions
+            import psutil
+
             # Set process priority to high
             p = psutil.Process(os.getpid())
             p.nice(psutil.HIGH_PRIORITY_CLASS)
@@ -156,6 +157,9 @@ class SystemOperations:
             printRecord (bool): Whether to print records to the console.
         """
 
+        # psutil is only loaded by the monitoring daemon process
+        import psutil
+
         # Generate specific and general filenames
         basePath, extension = os.path.splitext(outputCsvPath)
         specificCsvPath = f"{basePath} (specific){extension}"
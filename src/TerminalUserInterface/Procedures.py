@@ -27,6 +27,7 @@ class Procedures:
         self.__DATABASE_DIR = "Database"
         self.__DATABASE_FILE_NAME = "database.xlsx"
         self.__ASSETS_DIR = "Assets"
+        self.__RECIPES_DIR = "Recipes"
         self.__updateProjectList()
         pass
 
@@ -5,10 +5,10 @@ from datetime import datetime
 # Third party libraries
 
 # Self build libraries
-from Builder.ProjectBuilder import ProjectBuilder
 from SystemOperations.SystemOperations import SystemOperations
-from Render.ExcelRender import ExcelRenderer
-from Render.WordImageRender import WordImageRenderer
+from Render.PackageCompression import PackageCompression
+from Render.ProjectContext import ProjectContext
+from Render.RenderRecipe import RenderRecipe
 from TerminalUserInterface.Requests import Requests
 from TerminalUserInterface.Procedures import Procedures
 
@@ -41,12 +41,20 @@ class TerminalUserInterface(Requests, Procedures):
             "Work on existing project",
             "Enable monitoring performance",
             "Enable high performance (User Discretion Advised)",
+            "Configure render workers",
+            "Configure output compression",
         ]
+        self.renderWorkers: int = 1  # Worker processes used while rendering
+        self.renderCompression: str = "default"  # Zip compression of rendered documents
         self.__WORK_ON_PROJECT_OPTIONS = [
             "Return to main menu",
             "Open project directory",
             "Render documents (All)",
-            # "Render documents (By Recipe)",
+            "Render documents (Changed only)",
+            "Render documents (By Recipe)",
+            "Convert database.xlsx to another format",
+            "Export rendered Word documents to PDF",
+            "Bundle PDF documents by run and project",
         ]
         pass
 
@@ -103,12 +111,66 @@ class TerminalUserInterface(Requests, Procedures):
                     )
                     input("Press [Enter] to continue ...")
                 continue
+            elif selection == 5:
+                self.__configureRenderWorkers()
+                continue
+            elif selection == 6:
+                self.__configureOutputCompression()
+                continue
             else:
                 input(
                     "InvalidSelection: Please select a valid option (Please type [Enter] to continue)..."
                 )
                 continue
 
+    def __configureRenderWorkers(self) -> None:
+        """
+        Method asks the user for the amount of worker processes used while rendering documents.
+        """
+        print("---------- RENDER WORKERS ----------")
+        print(f"Current render workers: {self.renderWorkers}")
+        print(f"Available CPU cores: {os.cpu_count()}")
+        while True:
+            print("Please enter the number of render workers (1 renders serially)...")
+            workers = self.askForInteger()
+            if workers < 1:
+                print("ValueError: Render workers must be at least 1.")
+                continue
+            break
+        self.renderWorkers = workers
+        input(
+            f"Render workers set to {self.renderWorkers}. Press [Enter] to continue ..."
+        )
+        pass
+
+    def __configureOutputCompression(self) -> None:
+        """
+        Method asks the user for the zip compression level of the rendered documents.
+        """
+        levels = list(PackageCompression.LEVELS)
+        descriptions = {
+            "store": "no compression, fastest saves for batches post-processed later",
+            "fast": "light compression for bulk runs",
+            "default": "libraries' own settings",
+            "max": "smallest files for archival",
+        }
+        print("---------- OUTPUT COMPRESSION ----------")
+        print(f"Current output compression: {self.renderCompression}")
+        for index, level in enumerate(levels):
+            print(f"{index}.- {level} ({descriptions[level]})")
+        while True:
+            print("Please select the compression level by index...")
+            selection = self.askForInteger()
+            if not 0 <= selection < len(levels):
+                print("ValueError: Please select a valid compression level.")
+                continue
+            break
+        self.renderCompression = levels[selection]
+        input(
+            f"Output compression set to {self.renderCompression}. Press [Enter] to continue ..."
+        )
+        pass
+
     def __buildNewProjectMenu(self) -> None:
         while True:
             print("---------- PROJECT  BUILDER (SELECTION) ----------")
@@ -125,9 +187,16 @@ class TerminalUserInterface(Requests, Procedures):
                 input("Please type [Enter] to continue...")
                 continue
 
+        databaseFormat = self.__askForDatabaseFormat(
+            formats=list(ProjectContext.DATABASE_FORMATS)
+        )
+        # Builders load PIL, python-docx and openpyxl, only imported when a project is built
+        from Builder.ProjectBuilder import ProjectBuilder
+
         project = ProjectBuilder(
             projectPath=self.PROJECTS_DIR,
             projectName=projectName,
+            databaseFormat=databaseFormat,
         )
         print(f"Project Built Successfully at :{project.projectDirPath}")
         print(f"Wold you like to continue working on the builded project?")
@@ -141,6 +210,114 @@ class TerminalUserInterface(Requests, Procedures):
             pass
         pass
 
+    def __askForDatabaseFormat(self, formats: list[str]) -> str:
+        """
+        Method asks the user for a database format among the given ones.
+        """
+        descriptions = {
+            "xlsx": "excel workbook, edited by hand",
+            "sqlite": "single SQLite file, one table per sheet",
+            "csv": "directory of CSV files, one per sheet",
+            "parquet": "directory of Parquet files, one per sheet (requires pyarrow)",
+        }
+        print("---------- DATABASE FORMAT ----------")
+        for index, databaseFormat in enumerate(formats):
+            print(f"{index}.- {databaseFormat} ({descriptions[databaseFormat]})")
+        while True:
+            print("Please select the database format by index...")
+            selection = self.askForInteger()
+            if not 0 <= selection < len(formats):
+                print("ValueError: Please select a valid database format.")
+                continue
+            break
+        return formats[selection]
+
+    def __convertDatabase(self) -> None:
+        """
+        Method converts the database.xlsx of the selected project into another format, renders read the converted database afterwards.
+        """
+        databasePath = os.path.join(
+            self.selectedProjectPath,
+            self._Procedures__DATABASE_DIR,
+            self._Procedures__DATABASE_FILE_NAME,
+        )
+        databaseFormat = self.__askForDatabaseFormat(
+            formats=[key for key in ProjectContext.DATABASE_FORMATS if key != "xlsx"]
+        )
+        from Builder.DatabaseConverter import DatabaseConverter
+
+        try:
+            converter = DatabaseConverter(
+                databasePath=databasePath,
+                outputFormat=databaseFormat,
+            )
+        except Exception as e:
+            print(
+                f"While converting the project database following \nException Occurred ({e}): Review manual for Error details"
+            )
+            input("Please type [Enter] to continue...")
+            return
+        print(f"Database converted successfully at: {converter.outputPath}")
+        # The excel database is kept as a backup, renders only look for database.xlsx
+        backupPath = f"{databasePath}.{datetime.now():%Y%m%d-%H%M%S}.bak"
+        print(
+            f"Rename database.xlsx to {os.path.basename(backupPath)} so renders read the converted database instead?"
+        )
+        if self.askForYesNo():
+            os.replace(databasePath, backupPath)
+            print(f"Excel database kept at: {backupPath}")
+        input("Please type [Enter] to continue...")
+        pass
+
+    def __exportPdf(self) -> None:
+        """
+        Method converts the rendered Word documents of the selected project whose PDF is missing or outdated, through LibreOffice.
+        """
+        # The exporter loads PyMuPDF, only imported when exporting
+        from Render.PDFExporter import PDFExporter
+
+        rendersPath = os.path.join(self.selectedProjectPath, "Renders")
+        try:
+            with PDFExporter() as exporter:
+                results = exporter.exportRenders(rendersDirectory=rendersPath)
+        except Exception as e:
+            print(
+                f"While exporting PDF documents following \nException Occurred ({e}): Review manual for Error details"
+            )
+            input("Please type [Enter] to continue...")
+            return
+        failures = [result for result in results if result["status"] != "success"]
+        for failure in failures:
+            print(f"Could not export {failure['document']}: {failure['error']}")
+        print(
+            f"{len(results) - len(failures)} documents exported to PDF, {len(failures)} failed."
+        )
+        input("Please type [Enter] to continue...")
+        pass
+
+    def __bundlePdf(self) -> None:
+        """
+        Method merges the PDF documents of the selected project into one packet per run and one project archive.
+        """
+        # The bundler loads PyMuPDF, only imported when bundling
+        from Render.PDFBundler import PDFBundler
+
+        try:
+            bundler = PDFBundler(projectPath=self.selectedProjectPath)
+        except Exception as e:
+            print(
+                f"While bundling PDF documents following \nException Occurred ({e}): Review manual for Error details"
+            )
+            input("Please type [Enter] to continue...")
+            return
+        if bundler.archivePath is None:
+            print("There are no PDF documents to bundle, export the rendered documents first.")
+        else:
+            print(f"{len(bundler.runBundles)} run packets bundled at: {bundler.bundlesDirectory}")
+            print(f"Project archive: {bundler.archivePath}")
+        input("Please type [Enter] to continue...")
+        pass
+
     def __projectSelection(self) -> None:
         while True:
             print("---------- PROJECT SELECTION (OPTION MENU) ----------")
@@ -190,49 +367,215 @@ class TerminalUserInterface(Requests, Procedures):
                 )
                 continue
             elif selection == 2:
-                templatesPath = os.path.join(
-                    self.selectedProjectPath,
-                    self._Procedures__TEMPLATE_DIR,
+                self.__renderProject(incremental=False)
+                continue
+            elif selection == 3:
+                self.__renderProject(incremental=True)
+                continue
+            elif selection == 4:
+                self.__renderByRecipe()
+                continue
+            elif selection == 5:
+                self.__convertDatabase()
+                continue
+            elif selection == 6:
+                self.__exportPdf()
+                continue
+            elif selection == 7:
+                self.__bundlePdf()
+                continue
+            else:
+                print("Invalid Selection you must choose the action by index")
+                continue
+        pass
+
+    def __renderByRecipe(self) -> None:
+        """
+        Method asks the user for a saved recipe, or builds a new one, and renders its selection of the project.
+        """
+        recipesPath = os.path.join(
+            self.selectedProjectPath,
+            self._Procedures__RECIPES_DIR,
+        )
+        recipesList = RenderRecipe.listRecipes(recipesDirectory=recipesPath)
+        while True:
+            print("---------- RENDER BY RECIPE (SELECTION) ----------")
+            print("0.- Build new recipe")
+            for index, recipePath in enumerate(recipesList, start=1):
+                print(f"{index}.- {os.path.basename(recipePath)}")
+            print("Please select a recipe...")
+            selection = self.askForInteger()
+            if not 0 <= selection <= len(recipesList):
+                print("Invalid selection, you must choose a recipe by its index")
+                continue
+            break
+
+        try:
+            if selection == 0:
+                recipe = self.__buildRecipe(recipesPath=recipesPath)
+            else:
+                recipe = RenderRecipe.load(recipePath=recipesList[selection - 1])
+        except Exception as e:
+            print(
+                f"While loading the recipe following \nException Occurred ({e}): Review manual for Error details"
+            )
+            input("Please type [Enter] to continue...")
+            return
+        self.__renderProject(incremental=False, recipe=recipe)
+        pass
+
+    def __buildRecipe(self, recipesPath: str) -> RenderRecipe:
+        """
+        Method asks the user for the runs, templates and document types of a new recipe and saves it.
+
+        Args:
+            recipesPath (str): directory where the project recipes are stored.
+
+        Returns:
+            RenderRecipe: saved recipe
+        """
+        print("---------- RECIPE BUILDER ----------")
+        while True:
+            print("Please enter the recipe name...")
+            recipeName = self.askForString()
+            try:
+                self._Procedures__SYS_OBJ.isValidPathString(recipeName)
+                break
+            except ValueError:
+                print(
+                    f"ValueError: Recipe Name {recipeName} contains invalid characters."
                 )
-                databasePath = os.path.join(
+                continue
+
+        print(
+            "Please enter the run key headers separated by commas, or * for every run..."
+        )
+        runsAnswer = self.askForString().strip()
+        runs = None
+        if runsAnswer != "*":
+            runs = [run.strip() for run in runsAnswer.split(",") if run.strip()]
+
+        templatesPath = os.path.join(
+            self.selectedProjectPath,
+            self._Procedures__TEMPLATE_DIR,
+        )
+        templatesList = sorted(os.listdir(templatesPath))
+        for index, template in enumerate(templatesList):
+            print(f"{index}.- {template}")
+        while True:
+            print(
+                "Please enter the template indexes separated by commas, or * for every template..."
+            )
+            templatesAnswer = self.askForString().strip()
+            if templatesAnswer == "*":
+                templates = None
+                break
+            try:
+                templates = [
+                    templatesList[int(index)]
+                    for index in templatesAnswer.split(",")
+                    if index.strip()
+                ]
+                break
+            except (ValueError, IndexError):
+                print("Invalid selection, you must choose templates by their index")
+                continue
+
+        outputTypes = list()
+        print("Would you like to render Word documents?")
+        if self.askForYesNo():
+            outputTypes.append("word")
+        print("Would you like to render Excel documents?")
+        if self.askForYesNo():
+            outputTypes.append("excel")
+
+        recipe = RenderRecipe(
+            name=recipeName,
+            runs=runs,
+            templates=templates,
+            outputTypes=outputTypes,
+        )
+        recipePath = recipe.save(recipesDirectory=recipesPath)
+        print(f"Recipe saved at: {recipePath}")
+        return recipe
+
+    def __renderProject(
+        self, incremental: bool, recipe: RenderRecipe = None
+    ) -> None:
+        """
+        Method renders the word and excel templates of the selected project.
+
+        Args:
+            incremental (bool): only renders documents whose inputs changed since the last render.
+            recipe (RenderRecipe, optional): only renders the runs, templates and document types it selects. Defaults to None (everything).
+        """
+        # Renderers load docxtpl, python-docx and openpyxl, only imported when rendering
+        from Render.ExcelRender import ExcelRenderer
+        from Render.WordImageRender import WordImageRenderer
+
+        templatesPath = os.path.join(
+            self.selectedProjectPath,
+            self._Procedures__TEMPLATE_DIR,
+        )
+        assetsPath = os.path.join(
+            self.selectedProjectPath,
+            self._Procedures__ASSETS_DIR,
+        )
+        # The database is read once and shared between the renderers
+        try:
+            databasePath = ProjectContext.findDatabase(
+                databaseDirectory=os.path.join(
                     self.selectedProjectPath,
                     self._Procedures__DATABASE_DIR,
-                    self._Procedures__DATABASE_FILE_NAME,
                 )
-                assetsPath = os.path.join(
-                    self.selectedProjectPath,
-                    self._Procedures__ASSETS_DIR,
+            )
+            projectContext = ProjectContext(databasePath=databasePath)
+        except Exception as e:
+            print(
+                f"While reading the project database following \nException Occurred ({e}): Review manual for Error details"
+            )
+            input("Please type [Enter] to continue...")
+            return
+        try:
+            if recipe is None or recipe.includesOutput("word"):
+                WordImageRenderer(
+                    templatesDirectory=templatesPath,
+                    databasePath=databasePath,
+                    outputRenders=self.selectedProjectPath,
+                    assetsDirectory=assetsPath,
+                    workers=self.renderWorkers,
+                    projectContext=projectContext,
+                    incremental=incremental,
+                    compression=self.renderCompression,
+                    recipe=recipe,
                 )
-                try:
-                    WordImageRenderer(
-                        templatesDirectory=templatesPath,
-                        databasePath=databasePath,
-                        outputRenders=self.selectedProjectPath,
-                        assetsDirectory=assetsPath,
-                    )
-                except Exception as e:
-                    print(
-                        f"While rendering Word Documents following \nException Occurred ({e}): Review manual for Error details"
-                    )
-                    input("Please type [Enter] to continue...")
-                    continue
-                try:
-                    ExcelRenderer(
-                        templatesDirectory=templatesPath,
-                        databasePath=databasePath,
-                        outputRenders=self.selectedProjectPath,
-                    )
-                except Exception as e:
-                    print(
-                        f"While rendering Excel Documents following \nException Occurred ({e}): Review manual for Error details"
-                    )
-                    input("Please type [Enter] to continue...")
-                    continue
-                input("Success rendering the documents.\nType [Enter] to continue...")
-                continue
-            else:
-                print("Invalid Selection you must choose the action by index")
-                continue
+        except Exception as e:
+            print(
+                f"While rendering Word Documents following \nException Occurred ({e}): Review manual for Error details"
+            )
+            input("Please type [Enter] to continue...")
+            projectContext.close()
+            return
+        try:
+            if recipe is None or recipe.includesOutput("excel"):
+                ExcelRenderer(
+                    templatesDirectory=templatesPath,
+                    databasePath=databasePath,
+                    outputRenders=self.selectedProjectPath,
+                    projectContext=projectContext,
+                    incremental=incremental,
+                    compression=self.renderCompression,
+                    recipe=recipe,
+                )
+        except Exception as e:
+            print(
+                f"While rendering Excel Documents following \nException Occurred ({e}): Review manual for Error details"
+            )
+            input("Please type [Enter] to continue...")
+            projectContext.close()
+            return
+        projectContext.close()
+        input("Success rendering the documents.\nType [Enter] to continue...")
         pass
 
     pass
@@ -1,9 +1,21 @@
 # Python native libraries
+import sys
+from multiprocessing import freeze_support
 
 # Third party libraries
 
 # Self build libraries
-from TerminalUserInterface.TerminalUserInterface import TerminalUserInterface
 
 if __name__ == "__main__":
+    # Required by the frozen executable so render worker processes start properly
+    freeze_support()
+
+    # Arguments run the headless command line, e.g. "main.py render <project>", without loading the terminal interface
+    if len(sys.argv) > 1:
+        from CommandLineInterface.CommandLineInterface import CommandLineInterface
+
+        sys.exit(CommandLineInterface(sys.argv[1:]).exitCode)
+
+    from TerminalUserInterface.TerminalUserInterface import TerminalUserInterface
+
     TerminalUserInterface()